@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+
+"""benchnotificator.py contains micro benchmarks for the notificator module.
+
+Run it from the repository root with PYTHONPATH set (see setup.sh). Use -O,
+so debug logs, which are guarded by __debug__, are not part of the numbers:
+
+    python -O benchmark/benchnotificator.py
+
+:author:    Jose Carlos Recuero
+:version:   0.1
+:since:     10/18/2026
+
+"""
+
+__docformat__ = 'restructuredtext en'
+
+###############################################################################
+##  _                            _
+## (_)_ __ ___  _ __   ___  _ __| |_ ___
+## | | '_ ` _ \| '_ \ / _ \| '__| __/ __|
+## | | | | | | | |_) | (_) | |  | |_\__ \
+## |_|_| |_| |_| .__/ \___/|_|   \__|___/
+##             |_|
+###############################################################################
+#
+# import std python modules
+#
+import time
+import timeit
+
+#
+# import user python modules
+#
+import notificator
+
+
+###############################################################################
+##
+##   ___ ___  _ __  ___| |_ __ _ _ __ | |_ ___
+##  / __/ _ \| '_ \/ __| __/ _` | '_ \| __/ __|
+## | (_| (_) | | | \__ \ || (_| | | | | |_\__ \
+##  \___\___/|_| |_|___/\__\__,_|_| |_|\__|___/
+##
+###############################################################################
+#
+
+NUMBER = 200000
+"""
+    :type: int
+
+    Number of calls every benchmark runs.
+"""
+
+
+###############################################################################
+##            _                     _   _
+##  ___ _   _| |__  _ __ ___  _   _| |_(_)_ __   ___  ___
+## / __| | | | '_ \| '__/ _ \| | | | __| | '_ \ / _ \/ __|
+## \__ \ |_| | |_) | | | (_) | |_| | |_| | | | |  __/\__ \
+## |___/\__,_|_.__/|_|  \___/ \__,_|\__|_|_| |_|\___||___/
+##
+###############################################################################
+#
+
+# =============================================================================
+def _legacyWrapTrigger(nt, id, triggerFunction):
+    """Return the trigger wrapper as Notificator.registerTrigger used to.
+
+    It looks up the trigger information, in the nested dictionaries the
+    Notificator used to keep, and calls both priority lists for every call,
+    even when they are empty. Both priority lists are always created.
+    """
+    record = nt.triggerInfo[id & notificator.ID_SLOT_MASK]
+    before = record.before if record.before is not None else nt._createPList('BEFORE')
+    after = record.after if record.after is not None else nt._createPList('AFTER')
+    triggerInfos = {id: {notificator.ARGS: record.args,
+                         notificator.KWARGS: record.kwargs,
+                         notificator.PLIST: {notificator.BEFORE: before,
+                                             notificator.AFTER: after}}}
+
+    def _wrapTrigger(*args, **kwargs):
+        triggerInfo = triggerInfos[id]
+        argsToUse   = args if args  else triggerInfo[notificator.ARGS]
+        kwargsToUse = kwargs if kwargs else triggerInfo[notificator.KWARGS]
+        triggerInfo[notificator.PLIST][notificator.BEFORE].callForAll(*argsToUse, **kwargsToUse)
+        retvalue = triggerFunction(*argsToUse, **kwargsToUse)
+        triggerInfo[notificator.PLIST][notificator.AFTER].callForAll(*argsToUse, **kwargsToUse)
+        return retvalue
+    return _wrapTrigger
+
+
+# =============================================================================
+def _report(name, call):
+    """Print timing for the given call.
+
+    :type name: str
+    :param name: Name for the benchmark.
+
+    :type call: function
+    :param call: Function to benchmark.
+    """
+    seconds = min(timeit.repeat(call, number=NUMBER, repeat=3))
+    print '%-44s %8.3f usec/call' % (name, seconds * 1e6 / NUMBER)
+
+
+# =============================================================================
+def benchTrigger():
+    """Compare the legacy and the compiled trigger wrapper.
+
+    Triggers are called with no notifications, with one notification before
+    and with one notification before and one after.
+    """
+    def trigger(x):
+        return x
+
+    def notif(x):
+        pass
+
+    nt = notificator.Notificator((1, 2, 3), 2)
+    print 'Notificator trigger wrapper'
+    for name, before, after in (('no notifications', False, False),
+                                ('one notification before', True, False),
+                                ('notifications before and after', True, True)):
+        id = nt.registerTrigger(trigger, 'default')[notificator.ID]
+        if before:
+            nt.registerNotification(id, 2, True, False, notif)
+        if after:
+            nt.registerNotification(id, 2, False, False, notif)
+        legacy = _legacyWrapTrigger(nt, id, trigger)
+        compiled = nt.triggerInfo[id & notificator.ID_SLOT_MASK].trigger
+        _report('legacy, %s' % (name, ), lambda: legacy('one'))
+        _report('compiled, %s' % (name, ), lambda: compiled('one'))
+    _report('bare trigger function', lambda: trigger('one'))
+
+
+# =============================================================================
+def benchRunTrigger(triggers=1000):
+    """Measure runTrigger and trigger registration with many triggers.
+
+    :type triggers: int
+    :param triggers: Number of triggers registered.
+    """
+    def trigger():
+        pass
+
+    nt = notificator.Notificator((1, 2, 3), 2)
+    ids = [nt.registerTrigger(trigger)[notificator.ID] for _ in xrange(triggers)]
+    print 'Notificator with %d triggers' % (triggers, )
+    _report('runTrigger, first trigger', lambda: nt.runTrigger(ids[0]))
+    _report('runTrigger, last trigger', lambda: nt.runTrigger(ids[-1]))
+
+    def reRegister():
+        nt.deregisterTrigger(ids[-1])
+        ids[-1] = nt.registerTrigger(trigger)[notificator.ID]
+
+    _report('deregisterTrigger and registerTrigger', reRegister)
+
+
+# =============================================================================
+def benchRunTriggers(triggers=1000):
+    """Compare runTrigger called in a loop and runTriggers for a batch.
+
+    :type triggers: int
+    :param triggers: Number of triggers in the batch.
+    """
+    def trigger(x):
+        return x
+
+    nt = notificator.Notificator((1, 2, 3), 2)
+    batch = [(nt.registerTrigger(trigger, 'default')[notificator.ID], ('one', ), None)
+             for _ in xrange(triggers)]
+
+    def loop():
+        return [nt.runTrigger(id, *args) for id, args, _ in batch]
+
+    print 'Notificator batch of %d triggers' % (triggers, )
+    for name, run in (('runTrigger loop', loop),
+                      ('runTriggers', lambda: nt.runTriggers(batch)),
+                      ('runTriggers, collect exceptions',
+                       lambda: nt.runTriggers(batch, collectExceptions=True))):
+        seconds = min(timeit.repeat(run, number=100, repeat=3)) / 100
+        print '%-44s %8.3f usec/trigger' % (name, seconds * 1e6 / triggers)
+
+
+# =============================================================================
+def benchPostTrigger(events=2000, delay=0.0002):
+    """Compare caller time for runTrigger and postTrigger with a slow subscriber.
+
+    The subscriber blocks, as it would waiting for I/O, so it releases the
+    interpreter lock while the dispatcher thread runs it.
+
+    :type events: int
+    :param events: Number of triggers run or posted.
+
+    :type delay: float
+    :param delay: Seconds the subscriber blocks for every call.
+    """
+    def trigger():
+        pass
+
+    def notif():
+        time.sleep(delay)
+
+    nt = notificator.Notificator((1, 2, 3), 2)
+    id = nt.registerTrigger(trigger)[notificator.ID]
+    nt.registerNotification(id, 2, False, False, notif)
+
+    def run():
+        for _ in xrange(events):
+            nt.runTrigger(id)
+
+    def post():
+        for _ in xrange(events):
+            nt.postTrigger(id)
+
+    print 'Notificator %d triggers with a slow subscriber' % (events, )
+    nt.startDispatcher(maxsize=events)
+    try:
+        for name, call in (('runTrigger', run), ('postTrigger', post)):
+            start = timeit.default_timer()
+            call()
+            posted = timeit.default_timer()
+            nt.flush()
+            done = timeit.default_timer()
+            print '%-44s %8.3f usec/trigger in caller, %8.3f msec total' %\
+                (name, (posted - start) * 1e6 / events, (done - start) * 1e3)
+    finally:
+        nt.stopDispatcher()
+        nt.join()
+
+
+###############################################################################
+##                  _
+##  _ __ ___   __ _(_)_ __
+## | '_ ` _ \ / _` | | '_ \
+## | | | | | | (_| | | | | |
+## |_| |_| |_|\__,_|_|_| |_|
+##
+###############################################################################
+#
+if __name__ == "__main__":
+    benchTrigger()
+    benchRunTrigger()
+    benchRunTriggers()
+    benchPostTrigger()
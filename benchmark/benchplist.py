@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+
+"""benchplist.py contains micro benchmarks for the priority list module.
+
+Run it from the repository root with PYTHONPATH set (see setup.sh). Use -O,
+so debug logs, which are guarded by __debug__, are not part of the numbers:
+
+    python -O benchmark/benchplist.py
+
+:author:    Jose Carlos Recuero
+:version:   0.1
+:since:     10/18/2026
+
+"""
+
+__docformat__ = 'restructuredtext en'
+
+###############################################################################
+##  _                            _
+## (_)_ __ ___  _ __   ___  _ __| |_ ___
+## | | '_ ` _ \| '_ \ / _ \| '__| __/ __|
+## | | | | | | | |_) | (_) | |  | |_\__ \
+## |_|_| |_| |_| .__/ \___/|_|   \__|___/
+##             |_|
+###############################################################################
+#
+# import std python modules
+#
+import gc
+import logging
+import timeit
+
+#
+# import user python modules
+#
+import plist
+
+
+###############################################################################
+##
+##   ___ ___  _ __  ___| |_ __ _ _ __ | |_ ___
+##  / __/ _ \| '_ \/ __| __/ _` | '_ \| __/ __|
+## | (_| (_) | | | \__ \ || (_| | | | | |_\__ \
+##  \___\___/|_| |_|___/\__\__,_|_| |_|\__|___/
+##
+###############################################################################
+#
+
+NUMBER = 200000
+"""
+    :type: int
+
+    Number of calls every benchmark runs.
+"""
+
+
+###############################################################################
+##            _                     _   _
+##  ___ _   _| |__  _ __ ___  _   _| |_(_)_ __   ___  ___
+## / __| | | | '_ \| '__/ _ \| | | | __| | '_ \ / _ \/ __|
+## \__ \ |_| | |_) | | | (_) | |_| | |_| | | | |  __/\__ \
+## |___/\__,_|_.__/|_|  \___/ \__,_|\__|_|_| |_|\___||___/
+##
+###############################################################################
+#
+
+# =============================================================================
+def _legacyCallEntry(entry, *args, **kwargs):
+    """Call method in the given entry as PListFunction._callEntry used to.
+
+    It copies the stored args into a new list for every call, and it updates
+    the stored kwargs in place.
+    """
+    method = entry[plist.METHOD]
+    argsToUse = list(entry[plist.ARGS])
+    argsToUse.extend(args)
+    kwargsToUse = entry[plist.KWARGS]
+    kwargsToUse.update(kwargs)
+    return method(*argsToUse, **kwargsToUse)
+
+
+# =============================================================================
+def _legacyCallForAll(pl, *args, **kwargs):
+    """Call all methods as PListFunction.callForAll used to.
+
+    It copies the list for every priority and it calls every entry with
+    _legacyCallEntry.
+    """
+    for priority in pl.priorityValues.getList():
+        for entry in list(pl.container.get(priority, ())):
+            _legacyCallEntry(entry, *args, **kwargs)
+
+
+# =============================================================================
+def _report(name, call):
+    """Print timing for the given call.
+
+    :type name: str
+    :param name: Name for the benchmark.
+
+    :type call: function
+    :param call: Function to benchmark.
+    """
+    seconds = min(timeit.repeat(call, number=NUMBER, repeat=3))
+    print '%-44s %8.3f usec/call' % (name, seconds * 1e6 / NUMBER)
+
+
+# =============================================================================
+def _allocations(call, probe):
+    """Return objects allocated by the given call that are alive in the method.
+
+    Python 2.7 has no allocation tracer, so the number of objects tracked by
+    the garbage collector is taken before the call and when the method called
+    runs, with the collector disabled. Objects created by the dispatch path,
+    like merged args and kwargs, are alive at that point, so they are
+    counted, and objects created and freed before that are not.
+
+    :type call: function
+    :param call: Function that calls the method once.
+
+    :type probe: list
+    :param probe: List where the method appends gc.get_count()[0].
+
+    :rtype: int
+    :return: Number of objects allocated.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        gc.collect()
+        del probe[:]
+        start = gc.get_count()[0]
+        call()
+        return probe[0] - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# =============================================================================
+def benchCallForAll():
+    """Compare legacy and current argument merging in callForAll.
+
+    The legacy path copies the list for every priority and builds a new list
+    for the stored args on every call, even when no extra argument is passed.
+    The current path calls the dispatch plan, where stored args and kwargs are
+    bound, so they are passed as they are in that case, and it only builds
+    the merged objects for the extra arguments actually passed.
+    """
+    probe = []
+
+    def callback(x, y=0, z=0, w=0):
+        probe.append(gc.get_count()[0])
+
+    pl = plist.PListFunction((1, 2, 3), 2, 'bench')
+    pl.addAtBack({plist.METHOD: callback, plist.ARGS: ('one', ), plist.KWARGS: {'z': 1}}, 2)
+
+    print 'PListFunction.callForAll with 1 entry'
+    for name, legacy, current in (('no extra arguments',
+                                   lambda: _legacyCallForAll(pl),
+                                   lambda: pl.callForAll()),
+                                  ('extra args',
+                                   lambda: _legacyCallForAll(pl, 'two'),
+                                   lambda: pl.callForAll('two')),
+                                  ('extra args and kwargs',
+                                   lambda: _legacyCallForAll(pl, 'two', w=2),
+                                   lambda: pl.callForAll('two', w=2))):
+        for kind, call in (('legacy', legacy), ('current', current)):
+            _report('%s, %s' % (kind, name), call)
+            print '%-44s %8d objects/call' % ('', _allocations(call, probe))
+            del probe[:]
+
+
+# =============================================================================
+def benchAddAtFront(entries=20000):
+    """Compare addAtFront for every PList storage.
+
+    :type entries: int
+    :param entries: Number of entries added at the front.
+    """
+    print 'PList.addAtFront with %d entries' % (entries, )
+    for storage in plist.STORAGES:
+        def build():
+            pl = plist.PList((1, 2, 3), 2, 'bench', storage)
+            for entry in xrange(entries):
+                pl.addAtFront(entry)
+        seconds = min(timeit.repeat(build, number=1, repeat=3))
+        print '%-44s %8.3f msec' % (storage, seconds * 1e3)
+
+
+# =============================================================================
+def benchAddMany(entries=20000):
+    """Compare registering entries one by one and in a batch.
+
+    :type entries: int
+    :param entries: Number of entries registered.
+    """
+    def callback():
+        pass
+
+    def oneByOne():
+        pl = plist.PListFunction((1, 2, 3), 2, 'bench')
+        for _ in xrange(entries):
+            pl.addAtBack({plist.METHOD: callback})
+
+    def batch():
+        pl = plist.PListFunction((1, 2, 3), 2, 'bench')
+        pl.addManyAtBack({plist.METHOD: callback} for _ in xrange(entries))
+
+    print 'PListFunction registration of %d entries' % (entries, )
+    for name, build in (('addAtBack', oneByOne), ('addManyAtBack', batch)):
+        seconds = min(timeit.repeat(build, number=1, repeat=3))
+        print '%-44s %8.3f msec' % (name, seconds * 1e3)
+
+
+# =============================================================================
+def benchStats(entries=1):
+    """Compare callForAll without statistics, with statistics and with trace.
+
+    :type entries: int
+    :param entries: Number of entries called.
+    """
+    def callback():
+        pass
+
+    def build():
+        pl = plist.PListFunction((1, 2, 3), 2, 'bench')
+        for _ in xrange(entries):
+            pl.addAtBack({plist.METHOD: lambda: callback()})
+        return pl
+
+    plain = build()
+    stats = build()
+    stats.enableStats()
+    traced = build()
+    print 'PListFunction.callForAll with %d entries' % (entries, )
+    _report('stats disabled', plain.callForAll)
+    _report('stats enabled', stats.callForAll)
+    # Records are filtered by level, so only building the trace message is
+    # measured, which is a lower bound for the cost of the trace.
+    logger = traced.logger.getLoggerator()
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    plist.__trace__ = True
+    try:
+        _report('trace enabled, records filtered', traced.callForAll)
+    finally:
+        plist.__trace__ = False
+        logger.setLevel(level)
+
+
+# =============================================================================
+def benchUnchecked():
+    """Compare the validated and the unchecked add and remove.
+    """
+    def callback():
+        pass
+
+    entry = {plist.METHOD: callback, plist.ARGS: (), plist.KWARGS: {}}
+    pl = plist.PListFunction((1, 2, 3), 2, 'bench')
+
+    def checked():
+        pl.addAtBack(entry, 2)
+        pl.remove(entry, 2)
+
+    def unchecked():
+        pl.addAtBackUnchecked(entry, 2)
+        pl.removeUnchecked(entry, 2)
+
+    print 'PListFunction add and remove'
+    _report('addAtBack and remove', checked)
+    _report('addAtBackUnchecked and removeUnchecked', unchecked)
+
+
+###############################################################################
+##                  _
+##  _ __ ___   __ _(_)_ __
+## | '_ ` _ \ / _` | | '_ \
+## | | | | | | (_| | | | | |
+## |_| |_| |_|\__,_|_|_| |_|
+##
+###############################################################################
+#
+if __name__ == "__main__":
+    benchCallForAll()
+    benchAddAtFront()
+    benchAddMany()
+    benchStats()
+    benchUnchecked()
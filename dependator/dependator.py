@@ -25,7 +25,7 @@ __docformat__ = 'restructuredtext en'
 #
 # import user defined python modules
 #
-#import plist
+import plist
 import notificator
 from state import State
 from priority import Priority
@@ -102,6 +102,9 @@ class Dependator(object):
         >>> dep.instDependencies
         {}
 
+        >>> dep.instDepsKeys.isEmpty(), dep.instDepsKeys.unique
+        (True, 'reject')
+
         >>> dep.attrDependencies
         {}
 
@@ -135,6 +138,15 @@ class Dependator(object):
         It stores all instance dependencies entries
         """
 
+        self.instDepsKeys = plist.PList(Priority.PRIOS, Priority.DEFAULT, unique=plist.UNIQUE_REJECT)
+        """
+        :type: plist.PList
+
+        It stores the key for every instance dependency entry, which is the
+        instance name and the tuple with sorted dependencies. Keys are
+        unique, so the same dependency can not be registered twice
+        """
+
         self.attrDependencies = {}
         """
         :type: dict
@@ -185,16 +197,14 @@ class Dependator(object):
         :type theState: State
         :param theState: State the instance has changed
         """
-        instance  = self.instances[theInstName]
-        allInDeps = instance.instInDeps.getAllLists()
-        for inDeps in allInDeps:
-            for inDepID in inDeps:
-                dep = self.instDependencies[inDepID]
-                instToCheckStateList = dep.deps
-                for instToCheckState in instToCheckStateList:
-                    if self.getInstanceState(instToCheckState) != theState:
-                        return
-                dep.callbacks[theState](dep.instName, dep.deps, *args, **kwargs)
+        instance = self.instances[theInstName]
+        for inDepID in instance.instInDeps.iterAll():
+            dep = self.instDependencies[inDepID]
+            instToCheckStateList = dep.deps
+            for instToCheckState in instToCheckStateList:
+                if self.getInstanceState(instToCheckState) != theState:
+                    return
+            dep.callbacks[theState](dep.instName, dep.deps, *args, **kwargs)
 
     # =========================================================================
     def registerInstance(self, theInstName):
@@ -730,6 +740,25 @@ class Dependator(object):
                 return True
         return False
 
+    # =========================================================================
+    def _getInstAndDepsKey(self, theInstName, theDeps):
+        """ Return the key for the given instance and dependencies
+
+        >>> dep = Dependator()
+        >>> dep._getInstAndDepsKey('ONE', ('THREE', 'TWO'))
+        ('ONE', ('THREE', 'TWO'))
+
+        :type theInstName: str
+        :param theInstName: Instance name
+
+        :type theDeps: tuple
+        :param theDeps: List with all dependencies
+
+        :rtype: tuple
+        :return: Instance name and tuple with sorted dependencies
+        """
+        return (theInstName, tuple(sorted(theDeps)))
+
     # =========================================================================
     def setDependency(self,
                       theInstName,
@@ -759,6 +788,9 @@ class Dependator(object):
         Can not register the same dependency again
         >>> dep.setDependency('ONE', ('TWO', ), {})
 
+        >>> dep.instDepsKeys.getListForPriority()
+        [('ONE', ('TWO',))]
+
         :type theInstName: str
         :param theInstName: Instance name to set dependency
 
@@ -784,8 +816,12 @@ class Dependator(object):
             self.logger.debug('setDependency instance: %s, dependencies: %s, callbacks: %s' %
                               (theInstName, theDeps, theCallbacks))
 
-        if self._validateAllInstances(theInstName, theDeps) and\
-           not self._lookForInstAndDeps(theInstName, theDeps):
+        if self._validateAllInstances(theInstName, theDeps):
+            try:
+                self.instDepsKeys.addAtBackUnchecked(self._getInstAndDepsKey(theInstName, theDeps),
+                                                     Priority.DEFAULT)
+            except plist.DuplicateEntryException:
+                return None
             self.instID = self.instID + 1
             instDep = DepForInstance(self.instID,
                                      theInstName,
@@ -844,6 +880,8 @@ class Dependator(object):
             for instInDep in instDep.deps:
                 self.instances[instInDep].removeInstanceInDependency(theId)
             del self.instDependencies[theId]
+            self.instDepsKeys.removeUnchecked(self._getInstAndDepsKey(instDep.instName, instDep.deps),
+                                              Priority.DEFAULT)
             return instDep
         return None
 
@@ -143,14 +143,14 @@ class Instance(object):
         Instance state
         """
 
-        self.instDeps    = plist.PList(Priority.PRIOS, Priority.DEFAULT)
+        self.instDeps    = plist.PList(Priority.PRIOS, Priority.DEFAULT, storage=plist.STORAGE_INDEXED)
         """
         :type: plist.PList
 
         Priority list with all instance dependencies
         """
 
-        self.instInDeps  = plist.PList(Priority.PRIOS, Priority.DEFAULT)
+        self.instInDeps  = plist.PList(Priority.PRIOS, Priority.DEFAULT, storage=plist.STORAGE_INDEXED)
         """
         :type: plist.Plist
 
@@ -189,6 +189,31 @@ class Instance(object):
         for st in State.ALL:
             self.stateTriggers[st] = None
 
+    # =========================================================================
+    def _validateId(self, theId):
+        """ Validate a dependency id before adding or removing it
+
+        Dependency ids are added and removed with the unchecked methods of
+        the priority lists, which do not validate them.
+
+        >>> inst = Instance('INSTANCE')
+
+        >>> inst._validateId(1)
+
+        >>> inst._validateId(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        :type theId: int
+        :param theId: Id for the dependency
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+        """
+        if theId is None:
+            raise plist.InvalidEntryException('entry: %s' % (theId, ))
+
     # =========================================================================
     def addInstanceDependency(self, theInstId):
         """ Add dependency id for an instance
@@ -204,6 +229,11 @@ class Instance(object):
         >>> inst.instDeps.getAllLists()
         [[], [1], []]
 
+        >>> inst.addInstanceDependency(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
         :type theInstId: int
         :param theInstId: Id for the dependecy
 
@@ -212,11 +242,9 @@ class Instance(object):
 
         :raise InvalidEntryException:
             Entry is None or not valid.
-
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
         """
-        return self.instDeps.addAtFront(theInstId)
+        self._validateId(theInstId)
+        return self.instDeps.addAtFrontUnchecked(theInstId, Priority.DEFAULT)
 
     # =========================================================================
     def removeInstanceDependency(self, theInstId):
@@ -244,11 +272,9 @@ class Instance(object):
 
         :raise InvalidEntryException:
             Entry is None or not valid.
-
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
         """
-        return self.instDeps.remove(theInstId)
+        self._validateId(theInstId)
+        return self.instDeps.removeUnchecked(theInstId, Priority.DEFAULT)
 
     # =========================================================================
     def addInstanceInDependency(self, theInstId):
@@ -274,11 +300,9 @@ class Instance(object):
 
         :raise InvalidEntryException:
             Entry is None or not valid.
-
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
         """
-        return self.instInDeps.addAtFront(theInstId)
+        self._validateId(theInstId)
+        return self.instInDeps.addAtFrontUnchecked(theInstId, Priority.DEFAULT)
 
     # =========================================================================
     def removeInstanceInDependency(self, theInstId):
@@ -306,11 +330,9 @@ class Instance(object):
 
         :raise InvalidEntryException:
             Entry is None or not valid.
-
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
         """
-        return self.instInDeps.remove(theInstId)
+        self._validateId(theInstId)
+        return self.instInDeps.removeUnchecked(theInstId, Priority.DEFAULT)
 
     # =========================================================================
     def addAttributeDependency(self, theDepAttr, ):
@@ -335,18 +357,18 @@ class Instance(object):
         :raise InvalidEntryException:
             Entry is None or not valid.
 
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
-
         :raise PriorityListException:
             No list of priorities is provided.
 
         :raise DefaultPriorityException:
             Default priority does not belong to list of priorities provided.
         """
+        self._validateId(theDepAttr.id)
         if (theDepAttr.instDep, theDepAttr.attr) not in self.attrDeps:
-            self.attrDeps[(theDepAttr.instDep, theDepAttr.attr)] = plist.PList(Priority.PRIOS, Priority.DEFAULT)
-        self.attrDeps[(theDepAttr.instDep, theDepAttr.attr)].addAtFront(theDepAttr.id)
+            self.attrDeps[(theDepAttr.instDep, theDepAttr.attr)] =\
+                plist.PList(Priority.PRIOS, Priority.DEFAULT, storage=plist.STORAGE_INDEXED)
+        attrDeps = self.attrDeps[(theDepAttr.instDep, theDepAttr.attr)]
+        attrDeps.addAtFrontUnchecked(theDepAttr.id, Priority.DEFAULT)
         return True
 
     # =========================================================================
@@ -367,12 +389,11 @@ class Instance(object):
 
         :raise InvalidEntryException:
             Entry is None or not valid.
-
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
         """
+        self._validateId(theDepAttr.id)
         if (theDepAttr.instDep, theDepAttr.attr) in self.attrDeps:
-            self.attrDeps[(theDepAttr.instDep, theDepAttr.attr)].remove(theDepAttr.id)
+            attrDeps = self.attrDeps[(theDepAttr.instDep, theDepAttr.attr)]
+            attrDeps.removeUnchecked(theDepAttr.id, Priority.DEFAULT)
         else:
             return False
         return True
@@ -403,21 +424,21 @@ class Instance(object):
         :raise InvalidEntryException:
             Entry is None or not valid.
 
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
-
         :raise PriorityListException:
             No list of priorities is provided.
 
         :raise DefaultPriorityException:
             Default priority does not belong to list of priorities provided.
         """
+        self._validateId(theDepAttr.id)
         attr = theDepAttr.attr
         if not attr in self.attrInDeps:
-            self.attrInDeps[attr] = plist.PList(Priority.PRIOS, Priority.DEFAULT)
+            self.attrInDeps[attr] = plist.PList(Priority.PRIOS,
+                                                Priority.DEFAULT,
+                                                storage=plist.STORAGE_INDEXED)
         if not attr in self.attrTriggers:
             self.attrTriggers[attr] = None
-        self.attrInDeps[attr].addAtFront(theDepAttr.id)
+        self.attrInDeps[attr].addAtFrontUnchecked(theDepAttr.id, Priority.DEFAULT)
         return True
 
     # =========================================================================
@@ -440,14 +461,12 @@ class Instance(object):
 
         :raise InvalidEntryException:
             Entry is None or not valid.
-
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
         """
+        self._validateId(theDepAttr.id)
         id = None
         attr = theDepAttr.attr
         if attr in self.attrInDeps:
-            self.attrInDeps[attr].remove(theDepAttr.id)
+            self.attrInDeps[attr].removeUnchecked(theDepAttr.id, Priority.DEFAULT)
             if self.attrInDeps[attr].isEmpty():
                 del self.attrInDeps[attr]
                 id = self.attrTriggers[attr]
@@ -24,6 +24,8 @@ __docformat__ = 'restructuredtext en'
 # import std python modules
 #
 import functools
+import Queue
+import threading
 import mock
 
 #
@@ -122,6 +124,31 @@ AFTER   = 'after'
     called after the trigger method runs are stored.
 """
 
+ID_SLOT_BITS = 24
+"""
+    :type: int
+
+    Number of low bits in a trigger id used for the slot where the trigger is
+    stored. Higher bits are the generation for the slot, which is increased
+    every time the slot is reused, so ids for deregistered triggers are not
+    valid for new triggers stored in the same slot.
+"""
+
+ID_SLOT_MASK = (1 << ID_SLOT_BITS) - 1
+"""
+    :type: int
+
+    Mask used to get the slot from a trigger id.
+"""
+
+DISPATCH_QUEUE_SIZE = 1024
+"""
+    :type: int
+
+    Default maximum number of events waiting in the queue for every
+    dispatcher thread.
+"""
+
 
 ###############################################################################
 ##            _                     _   _
@@ -254,6 +281,94 @@ class TriggerException(error.BaseException):
     BASE_MESSAGE = "Trigger failed"
 
 
+#
+# =============================================================================
+#
+class TriggerQueueFullException(error.BaseException):
+    """Trigger Queue Full Exception.
+    Exception raised when a trigger is posted and the queue for the dispatcher
+    thread is full.
+
+    >>> ex = TriggerQueueFullException()
+
+    >>> ex.BASE_MESSAGE
+    'Trigger queue is full'
+
+    >>> raise TriggerQueueFullException('custom queue full')
+    Traceback (most recent call last):
+    ...
+    TriggerQueueFullException: Trigger queue is full : custom queue full
+
+    """
+    BASE_MESSAGE = "Trigger queue is full"
+
+
+#
+# =============================================================================
+#
+class TriggerRecord(object):
+    """Trigger Record.
+    Information for a trigger registered to the Notificator.
+
+    >>> def trigger(x): pass
+    >>> record = TriggerRecord(1, trigger, ('one', ), {})
+
+    >>> record # doctest: +ELLIPSIS
+    <TriggerRecord 1 <function trigger at 0x...>>
+
+    >>> record.args, record.kwargs
+    (('one',), {})
+
+    >>> record.before, record.after, record.trigger, record.call
+    (None, None, None, None)
+
+    >>> record.stats
+    False
+
+    """
+
+    __slots__ = ('id', 'method', 'args', 'kwargs', 'before', 'after', 'trigger', 'call', 'stats')
+
+    # =========================================================================
+    def __init__(self, id, method, args, kwargs):
+        """TriggerRecord constructor.
+
+        :type id: int
+        :param id:
+            Id for the trigger.
+
+        :type method: function
+        :param method:
+            Trigger method.
+
+        :type args: list
+        :param args:
+            Default list parameters when the trigger function is called.
+
+        :type kwargs: dict
+        :param kwargs:
+            Default dictionary parameters when the trigger function is called.
+        """
+        self.id      = id
+        self.method  = method
+        self.args    = args
+        self.kwargs  = kwargs
+        self.before  = None
+        self.after   = None
+        self.trigger = None
+        self.call    = None
+        self.stats   = False
+
+    # =========================================================================
+    def __repr__(self):
+        """Return the string representation for the record.
+
+        :rtype: str
+        :return: Trigger id and method.
+        """
+        return '<TriggerRecord %s %r>' % (self.id, self.method)
+
+
 #
 # =============================================================================
 #
@@ -292,37 +407,44 @@ class Notificator(object):
             |___________|____|
 
 
-            <triggerInfo> as a dictionary
-            ___________________
-            |         |       |
-            | Key: ID | Value |
-            |_________|_______|
+            <triggerInfo> as a list, indexed by the slot in the id
+            ___________________________________________
+            |      |                 |     |          |
+            | None | TriggerRecord 1 | ... | None     |
+            |______|_________________|_____|__________|
 
 
-            <triggerInfo[ID]> as a dictionary
+            <TriggerRecord> for a trigger
             ____________________________________________________________
             |               |                                          |
-            | Key: 'method' | trigger method                           |
+            | id            | slot and generation for the trigger      |
             |_______________|__________________________________________|
             |               |                                          |
-            | Key: 'args'   | args to pass to trigger                  |
+            | method        | trigger method                           |
             |_______________|__________________________________________|
             |               |                                          |
-            | Key: 'kwargs' | kwargs to pass to trigger                |
+            | args          | args to pass to trigger                  |
             |_______________|__________________________________________|
             |               |                                          |
-            | Key: 'plist'  | Dictionary with PList for notifications  |
+            | kwargs        | kwargs to pass to trigger                |
+            |_______________|__________________________________________|
+            |               |                                          |
+            | before        | PList with notification to be called     |
+            |               | before trigger, None until the first one |
+            |_______________|__________________________________________|
+            |               |                                          |
+            | after         | PList with notification to be called     |
+            |               | after trigger, None until the first one  |
+            |_______________|__________________________________________|
+            |               |                                          |
+            | trigger       | wrapped up trigger method                |
+            |_______________|__________________________________________|
+            |               |                                          |
+            | call          | dispatch function compiled for trigger   |
+            |_______________|__________________________________________|
+            |               |                                          |
+            | stats         | True if notifications record statistics  |
             |_______________|__________________________________________|
-
-
-            <trigger.Value['plist']> as a dictionary
-            _______________________________________________________________________
-            |               |                                                     |
-            | Key: 'before' | PList with notification to be called before trigger |
-            |_______________|_____________________________________________________|
-            |               |                                                     |
-            | Key: 'after'  | PList with notification to be called after trigger  |
-            |_______________|_____________________________________________________|
 
 
 
@@ -332,7 +454,7 @@ class Notificator(object):
     def __init__(self, priorities, defaultPriority):
         """Notificator constructor.
 
-        It create a Notificator instance. Initialize Id to zero.
+        It create a Notificator instance with an empty trigger registry.
 
         >>> nt = Notificator((1, 2, 3), 2)
 
@@ -342,11 +464,16 @@ class Notificator(object):
         >>> nt.priorityValues # doctest: +ELLIPSIS
         <plist.PValuesList object at 0x...>
 
-        >>> nt.id
-        0
-
         >>> nt.triggerInfo
-        {}
+        [None]
+
+        >>> nt.freeIds
+        []
+
+        >>> nt.queues
+
+        >>> nt.dispatchers
+        []
 
         :type priorities: list
         :param priorities:
@@ -371,7 +498,7 @@ class Notificator(object):
             Variable for local logger. Disable debug logs by default.
         """
 
-        self.priorityValues = plist.PValuesList(priorities, defaultPriority)
+        self.priorityValues = plist.getPValuesList(priorities, defaultPriority)
         """
             :type: PValuesList
 
@@ -379,90 +506,125 @@ class Notificator(object):
             default one.
         """
 
-        self.id          = 0
+        self.triggerInfo = [None]
+        """
+            :type: list
+
+            List where triggers are stored, indexed by the slot in the
+            trigger id. Slots for deregistered triggers are None, and slot
+            zero is never used, so zero is never a valid id.
+        """
+
+        self.freeIds = []
+        """
+            :type: list
+
+            Ids to use for new triggers stored in free slots. The id for a
+            free slot is the id for the last trigger in the slot with the
+            generation increased.
         """
-            :type: int
 
-            Identification for every function registered to the notify manager.
+        self.queues = None
         """
+            :type: list
 
-        self.triggerInfo = {}
+            Queue for every dispatcher thread, where posted triggers are
+            stored. None when dispatcher threads are not running.
         """
-            :type: dict
-
-            Dictionary where triggers functions will be stored. A trigger
-            function is the trigger provided by the user wrapped up in order
-            to call all notification registered to that trigger.
-
-            **triggerInfo** dictionary
-
-            +----------+-----------+----------------------+------------+
-            | Key      | KeyType   | Value                | Value Type |
-            +==========+===========+======================+============+
-            | ID       |  <int>    | Trigger Info         | <dict>     |
-            +----------+-----------+----------------------+------------+
-
-            **triggerInfo[ID]** dictionary
-
-            +----------+---------+----------------------+------------+
-            | Key      | KeyType | Value                | Value Type |
-            +==========+=========+======================+============+
-            +----------+---------+----------------------+------------+
-            | 'method' |  <str>  | Trigger method       | <func>     |
-            +----------+-----------+--------------------+------------+
-            | 'args'   | <str>   | Trigger(args)        | <list>     |
-            +----------+-----------+--------------------+------------+
-            | 'kwargs' | <str>   | Trigger(kwargs)      | <dict>     |
-            +----------+-----------+--------------------+------------+
-            | 'plist'  | <str>   | Notifications        | <dict>     |
-            +----------+-----------+--------------------+------------+
-
-            **triggerInfo[ID]['plist']** dictionary
-
-            +----------+-----------+--------------------+------------+
-            | Key      | KeyType | Value                | Value Type |
-            +==========+=========+======================+============+
-            | 'before' | <str>   | Before notifications | <PList>    |
-            +----------+-----------+--------------------+------------+
-            | 'after'  | <str>   | After notifications  | <PList>    |
-            +----------+---------+----------------------+------------+
+
+        self.dispatchers = []
+        """
+            :type: list
+
+            Dispatcher threads.
         """
 
     # =========================================================================
-    def _increaseId(self):
-        """Increase the notify manager instance id and return
-        the new value.
+    def _allocateId(self):
+        """Return the id for a new trigger.
+
+        Free slots are reused first, with a new generation. If there is no
+        free slot, a new slot is appended to the registry.
 
         >>> nt = Notificator((1, 2, 3), 2)
 
-        >>> nt._increaseId()
-        1
-        >>> nt.id
+        >>> nt._allocateId()
         1
-
-        >>> nt._increaseId()
-        2
-        >>> nt.id
+        >>> nt._allocateId()
         2
+        >>> nt.triggerInfo
+        [None, None, None]
+
+        >>> nt.freeIds.append(1 + (1 << ID_SLOT_BITS))
+        >>> nt._allocateId() == 1 + (1 << ID_SLOT_BITS)
+        True
 
         :rtype: int
         :return:
-            New value for the instance id.
+            New trigger id.
+
+        :raise RegistrationException:
+            There is no slot available.
         """
-        self.id += 1
-        return self.id
+        if self.freeIds:
+            return self.freeIds.pop()
+        id = len(self.triggerInfo)
+        if id > ID_SLOT_MASK:
+            raise RegistrationException('No slot available')
+        self.triggerInfo.append(None)
+        return id
+
+    # =========================================================================
+    def _getTriggerRecord(self, id):
+        """Return the trigger record for the given id.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+        >>> def trigger(): pass
+        >>> nt.registerTrigger(trigger) # doctest: +ELLIPSIS
+        {'trigger': <function trigger at 0x...>, 'id': 1}
+
+        >>> nt._getTriggerRecord(1) # doctest: +ELLIPSIS
+        <TriggerRecord 1 <function trigger at 0x...>>
+
+        >>> nt._getTriggerRecord(2)
+        Traceback (most recent call last):
+        ...
+        InvalidIdException: Invalid ID provided : id: 2
+
+        :type id: int
+        :param id:
+            Id for the trigger.
+
+        :rtype: TriggerRecord
+        :return:
+            Record for the trigger.
+
+        :raise InvalidIdException:
+            Id give is not a valid one.
+        """
+        try:
+            record = self.triggerInfo[id & ID_SLOT_MASK]
+        except (IndexError, TypeError):
+            record = None
+        if record is None or record.id != id:
+            raise InvalidIdException('id: %s' % id)
+        return record
 
     # =========================================================================
     def _isValidId(self, id):
         """Check if the given id is a valid one.
 
         It checks if the given id value is a valid one, and it will be a valid
-        one if it is a valid/active key. It has to be lower or equal that the
-        actual key value.
+        one if there is a trigger registered with that id. Ids for
+        deregistered triggers are not valid, even when their slot is used by
+        a new trigger.
 
         >>> nt = Notificator((1, 2, 3), 2)
-        >>> nt.id = 2
-        >>> nt.triggerInfo = {1: True, 2: True, }
+        >>> def trigger(): pass
+        >>> nt.registerTrigger(trigger)[ID]
+        1
+        >>> nt.registerTrigger(trigger)[ID]
+        2
 
         >>> nt._isValidId(1)
         True
@@ -473,6 +635,17 @@ class Notificator(object):
         >>> nt._isValidId(3)
         False
 
+        >>> nt.deregisterTrigger(1)
+        >>> id = nt.registerTrigger(trigger)[ID]
+        >>> id & ID_SLOT_MASK, id >> ID_SLOT_BITS
+        (1, 1)
+
+        >>> nt._isValidId(1)
+        False
+
+        >>> nt._isValidId(id)
+        True
+
         :type id: int
         :param id:
             Id to check if it is valid.
@@ -481,7 +654,11 @@ class Notificator(object):
         :return:
             True if the given id is valid. False if the given id is not valid.
         """
-        return id <= self.id and id in self.triggerInfo.keys()
+        try:
+            self._getTriggerRecord(id)
+            return True
+        except InvalidIdException:
+            return False
 
     # =========================================================================
     def _validateId(self, id):
@@ -490,8 +667,11 @@ class Notificator(object):
         If the given id is not validated, it raises an exception.
 
         >>> nt = Notificator((1, 2, 3), 2)
-        >>> nt.id = 2
-        >>> nt.triggerInfo = {1: True, 2: True, }
+        >>> def trigger(): pass
+        >>> nt.registerTrigger(trigger)[ID]
+        1
+        >>> nt.registerTrigger(trigger)[ID]
+        2
 
         >>> nt._validateId(1)
 
@@ -509,8 +689,7 @@ class Notificator(object):
         :raise InvalidIdException:
             Id give is not a valid one.
         """
-        if not self._isValidId(id):
-            raise InvalidIdException('id: %s' % id)
+        self._getTriggerRecord(id)
 
     # =========================================================================
     def _isMethodType(self, method):
@@ -636,6 +815,12 @@ class Notificator(object):
         >>> pl.name
         'custom plist'
 
+        Notifications are indexed by their method, so deregistering a
+        notification does not scan the list.
+
+        >>> pl.storage
+        'indexed'
+
         :rtype: plist.PListFunction
         :return:
             A PListFunction instance using the list of priorities and the
@@ -643,7 +828,8 @@ class Notificator(object):
         """
         return plist.PListFunction(self.priorityValues.getList(),
                                    self.priorityValues.getDefault(),
-                                   name=name)
+                                   name=name,
+                                   storage=plist.STORAGE_INDEXED)
 
     # =========================================================================
     def _getRegistrationSideFromFlag(self, isBeforeFlag):
@@ -671,6 +857,93 @@ class Notificator(object):
         """
         return BEFORE if isBeforeFlag else AFTER
 
+    # =========================================================================
+    def _compileTrigger(self, record):
+        """Compile the dispatch function for the given trigger record.
+
+        The dispatch function is called with the tuple of args and the
+        dictionary of kwargs passed to the trigger. Default args and kwargs
+        are used when they are empty. Notifications are taken from the
+        dispatch plans for the BEFORE and AFTER priority lists, so calling
+        the trigger does not look up the trigger information or traverse
+        the priority lists. When there are no notifications the trigger
+        function is called straight away. A priority list that was never
+        created has no notifications.
+
+        The dispatch function is not updated when the priority lists change,
+        so it has to be compiled again after any registration or
+        deregistration for the trigger, and when statistics are enabled or
+        disabled for the priority lists, because plans are compiled with or
+        without statistics, see enableStats.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> def trigger(x): print 'trigger %s' % x
+        >>> def notif(x): print 'notif %s' % x
+        >>> nt.registerTrigger(trigger, 'default') # doctest: +ELLIPSIS
+        {'trigger': <function trigger at 0x...>, 'id': 1}
+
+        >>> record = nt.triggerInfo[1]
+        >>> record.after = nt._createPList('AFTER')
+        >>> record.after.addAtBackUnchecked({METHOD: notif, ARGS: (), KWARGS: {}}, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> record.call((), {})
+        trigger default
+
+        >>> call = nt._compileTrigger(record)
+        >>> call is record.call
+        True
+
+        >>> call(('one', ), {})
+        trigger one
+        notif one
+
+        :type record: TriggerRecord
+        :param record:
+            Record for the trigger.
+
+        :rtype: function
+        :return:
+            Dispatch function for the trigger.
+        """
+        triggerFunction = record.method
+        defaultArgs     = record.args
+        defaultKwargs   = record.kwargs
+        before          = record.before.getPlan() if record.before is not None else ()
+        after           = record.after.getPlan() if record.after is not None else ()
+
+        if not before and not after:
+            def _dispatch(args, kwargs):
+                return triggerFunction(*(args or defaultArgs), **(kwargs or defaultKwargs))
+        elif not after:
+            def _dispatch(args, kwargs):
+                args = args or defaultArgs
+                kwargs = kwargs or defaultKwargs
+                for call in before:
+                    call(*args, **kwargs)
+                return triggerFunction(*args, **kwargs)
+        elif not before:
+            def _dispatch(args, kwargs):
+                args = args or defaultArgs
+                kwargs = kwargs or defaultKwargs
+                retvalue = triggerFunction(*args, **kwargs)
+                for call in after:
+                    call(*args, **kwargs)
+                return retvalue
+        else:
+            def _dispatch(args, kwargs):
+                args = args or defaultArgs
+                kwargs = kwargs or defaultKwargs
+                for call in before:
+                    call(*args, **kwargs)
+                retvalue = triggerFunction(*args, **kwargs)
+                for call in after:
+                    call(*args, **kwargs)
+                return retvalue
+
+        record.call = _dispatch
+        return _dispatch
+
     # =========================================================================
     def registerTrigger(self, triggerFunction, *args, **kwargs):
         """Register a new trigger function.
@@ -686,7 +959,7 @@ class Notificator(object):
         {'trigger': <function trigger at 0x...>, 'id': 1}
 
         >>> nt.triggerInfo[1] # doctest: +ELLIPSIS
-        {'trigger': <function trigger at 0x...>, 'plist': {'after': <plist.PListFunction object at 0x...>, 'before': <plist.PListFunction object at 0x...>}, 'args': (), 'kwargs': {}}
+        <TriggerRecord 1 <function trigger at 0x...>>
 
         :type triggerFunction: function
         :param triggerFunction:
@@ -712,7 +985,7 @@ class Notificator(object):
         """
         try:
             self._validateMethodCall(triggerFunction)
-            id = self._increaseId()
+            id = self._allocateId()
 
             ## TODO - MOVED - This has been moved to _validateMethodCall
             ## function.
@@ -722,13 +995,16 @@ class Notificator(object):
             ## if isinstance(triggerFunction, mock.Mock):
             ##    triggerFunction.__name__ = triggerFunction._mock_name
 
+            record = TriggerRecord(id, triggerFunction, args, kwargs)
+
             # =================================================================
             @functools.wraps(triggerFunction)
             def _wrapTrigger(*args, **kwargs):
                 """Wrapped up the trigger function.
 
                 It wraps up the custom trigger function, so notification can
-                be called when the trigger function is executed.
+                be called when the trigger function is executed. It runs the
+                dispatch function compiled for the trigger.
 
                 :type args: list
                 :param args: Default list parameters when the trigger function
@@ -741,19 +1017,14 @@ class Notificator(object):
                 :rtype: function
                 :return: Return trigger function return value.
                 """
-                triggerInfo = self.triggerInfo[id]
-                argsToUse   = args if args  else triggerInfo[ARGS]
-                kwargsToUse = kwargs if kwargs else triggerInfo[KWARGS]
                 if __debug__:
-                    self.logger.debug('triggerFunction %s, argsToUse %s, kwargsToUse %s' %
-                                      (triggerInfo[TRIGGER], argsToUse, kwargsToUse))
-                triggerInfo[PLIST][BEFORE].callForAll(*argsToUse, **kwargsToUse)
-                retvalue = triggerFunction(*argsToUse, **kwargsToUse)
-                triggerInfo[PLIST][AFTER].callForAll(*argsToUse, **kwargsToUse)
-                return retvalue
+                    self.logger.debug('triggerFunction %s, args %s, kwargs %s' %
+                                      (triggerFunction, args, kwargs))
+                return record.call(args, kwargs)
 
-            self.triggerInfo[id] = {TRIGGER: _wrapTrigger, ARGS: args, KWARGS: kwargs,
-                                    PLIST: {BEFORE: self._createPList('BEFORE'), AFTER: self._createPList('AFTER')}}
+            record.trigger = _wrapTrigger
+            self._compileTrigger(record)
+            self.triggerInfo[id & ID_SLOT_MASK] = record
             if __debug__:
                 self.logger.debug('%s: register trigger %s with args %s and kwargs %s, id=%d' %
                                   (info.FUNC(), triggerFunction, args, kwargs, id))
@@ -767,7 +1038,9 @@ class Notificator(object):
     def deregisterTrigger(self, id):
         """Deregister a given trigger at the given id.
 
-        It proceeds to deregister the given trigger at the given id.
+        It proceeds to deregister the given trigger at the given id. The slot
+        for the trigger is free to be used by a new trigger, with a new id.
+        The wrapped up trigger method can not be called anymore.
 
         :type id: int
         :param id:
@@ -776,18 +1049,22 @@ class Notificator(object):
         >>> nt = Notificator((1, 2, 3), 2)
 
         >>> def trigger(): pass
-        >>> nt.registerTrigger(trigger) # doctest: +ELLIPSIS
-        {'trigger': <function trigger at 0x...>, 'id': 1}
+        >>> wrapped = nt.registerTrigger(trigger)[TRIGGER]
 
         >>> nt.triggerInfo[1] # doctest: +ELLIPSIS
-        {'trigger': <function trigger at 0x...>, 'plist': {'after': <plist.PListFunction object at 0x...>, 'before': <plist.PListFunction object at 0x...>}, 'args': (), 'kwargs': {}}
+        <TriggerRecord 1 <function trigger at 0x...>>
 
         >>> nt.deregisterTrigger(1)
 
         >>> nt.triggerInfo[1]
+
+        >>> nt.freeIds == [1 + (1 << ID_SLOT_BITS)]
+        True
+
+        >>> wrapped()
         Traceback (most recent call last):
         ...
-        KeyError: 1
+        TriggerException: Trigger failed : Invalid id value: 1
 
         >>> nt.deregisterTrigger(1)
         Traceback (most recent call last):
@@ -801,8 +1078,14 @@ class Notificator(object):
             if __debug__:
                 self.logger.debug('%s: deregister trigger with id=%d' %
                                   (info.FUNC(), id))
-            self._validateId(id)
-            del self.triggerInfo[id]
+            record = self._getTriggerRecord(id)
+
+            def _deregistered(args, kwargs):
+                raise TriggerException('Invalid id value: %s' % id)
+
+            record.call = _deregistered
+            self.triggerInfo[id & ID_SLOT_MASK] = None
+            self.freeIds.append(id + (1 << ID_SLOT_BITS))
 
         except InvalidIdException:
             raise DeregistrationException('Invalid id value: %s' % id)
@@ -819,6 +1102,8 @@ class Notificator(object):
 
         It registers the given notification with the given priority at the
         given position for a trigger which is identified by the given id value.
+        The priority list for the given position is created when the first
+        notification is registered to it.
 
         >>> nt = Notificator((1, 2, 3), 2)
 
@@ -830,6 +1115,9 @@ class Notificator(object):
         >>> nt.registerNotification(1, 1, True, True, notif)
         True
 
+        >>> nt.triggerInfo[1].before.name, nt.triggerInfo[1].after
+        ('BEFORE', None)
+
         >>> nt.registerNotification(2, 1, True, True, notif)
         Traceback (most recent call last):
         ...
@@ -845,6 +1133,16 @@ class Notificator(object):
         ...
         RegistrationException: Registration failed : Invalid priority: 0 not in (1, 2, 3)
 
+        Notifications are indexed by their method, so it has to be hashable.
+
+        >>> class Unhashable(object):
+        ...     __hash__ = None
+        ...     def __call__(self): pass
+        >>> nt.registerNotification(1, 1, True, True, Unhashable()) # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        RegistrationException: Registration failed : Notification method can not be hashed: <...Unhashable object at 0x...>
+
         :type id: int
         :param id:
             Identifies the trigger where the notification will be registered.
@@ -888,17 +1186,23 @@ class Notificator(object):
             if __debug__:
                 self.logger.debug('%s: register %s notification %s with args %s and kwargs %s, id=%d' %
                                   (info.FUNC(), BEFORE if isBeforeFlag else AFTER, notification, args, kwargs, id))
-            self._validateId(id)
+            record = self._getTriggerRecord(id)
             self._validateMethodCall(notification)
             self._validatePriorityValue(priority)
             registrationSide = self._getRegistrationSideFromFlag(isBeforeFlag)
-            triggerInfoPList = self.triggerInfo[id][PLIST]
+            notificationPList = getattr(record, registrationSide)
+            if notificationPList is None:
+                notificationPList = self._createPList(registrationSide.upper())
+                if record.stats:
+                    notificationPList.enableStats()
+                setattr(record, registrationSide, notificationPList)
             addNotificationToListMethod =\
-                triggerInfoPList[registrationSide].addAtFront if inFrontFlag\
-                else triggerInfoPList[registrationSide].addAtBack
+                notificationPList.addAtFrontUnchecked if inFrontFlag\
+                else notificationPList.addAtBackUnchecked
             addNotificationToListMethod({METHOD: notification,
                                          ARGS: args,
                                          KWARGS: kwargs}, priority)
+            self._compileTrigger(record)
             return True
 
         except InvalidIdException:
@@ -910,6 +1214,9 @@ class Notificator(object):
             raise RegistrationException('Invalid priority: %s not in %s' %
                                         (priority,
                                          self.priorityValues.getList()))
+        except TypeError:
+            raise RegistrationException('Notification method can not be hashed: %s' %
+                                        notification)
 
     # =========================================================================
     def deregisterNotification(self,
@@ -935,6 +1242,8 @@ class Notificator(object):
         >>> nt.deregisterNotification(1, 1, True, notif) # doctest: +ELLIPSIS
         <function notif at 0x...>
 
+        >>> nt.deregisterNotification(1, 1, False, notif)
+
         >>> nt.deregisterNotification(2, 1, True, notif)
         Traceback (most recent call last):
         ...
@@ -981,13 +1290,16 @@ class Notificator(object):
                                    BEFORE if isBeforeFlag else AFTER,
                                    notification,
                                    id))
-            self._validateId(id)
+            record = self._getTriggerRecord(id)
             self._validateMethodCall(notification)
             self._validatePriorityValue(priority)
             registrationSide = self._getRegistrationSideFromFlag(isBeforeFlag)
-            triggerInfoPList = self.triggerInfo[id][PLIST]
-            return triggerInfoPList[registrationSide].remove({METHOD: notification},
-                                                             priority)
+            notificationPList = getattr(record, registrationSide)
+            if notificationPList is None:
+                return None
+            removed = notificationPList.removeUnchecked({METHOD: notification}, priority)
+            self._compileTrigger(record)
+            return removed
 
         except InvalidIdException:
             raise DeregistrationException('Invalid id value: %s' % id)
@@ -999,6 +1311,124 @@ class Notificator(object):
                                           (priority,
                                            self.priorityValues.getList()))
 
+    # =========================================================================
+    def enableStats(self, id):
+        """Enable statistics for all notifications for the given trigger.
+
+        Statistics are enabled in the BEFORE and AFTER priority lists, and
+        the dispatch function for the trigger is compiled again, so it calls
+        the plans that record statistics. Priority lists created later for
+        the trigger record statistics too.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> def trigger(): pass
+        >>> def notif(): pass
+        >>> nt.registerTrigger(trigger) # doctest: +ELLIPSIS
+        {'trigger': <function trigger at 0x...>, 'id': 1}
+        >>> nt.registerNotification(1, 1, True, True, notif)
+        True
+
+        >>> nt.enableStats(1)
+        >>> nt.registerNotification(1, 3, False, True, notif)
+        True
+        >>> nt.runTrigger(1)
+        >>> stats = nt.stats(1)
+        >>> stats[BEFORE][1, notif]['count'], stats[AFTER][3, notif]['count']
+        (1, 1)
+
+        >>> nt.enableStats(2)
+        Traceback (most recent call last):
+        ...
+        InvalidIdException: Invalid ID provided : id: 2
+
+        :type id: int
+        :param id:
+            Id where the trigger is registered.
+
+        :raise InvalidIdException:
+            Trigger id is not valid.
+        """
+        if __debug__:
+            self.logger.debug('%s: enable stats for trigger with id=%d' %
+                              (info.FUNC(), id))
+        record = self._getTriggerRecord(id)
+        record.stats = True
+        for notificationPList in (record.before, record.after):
+            if notificationPList is not None:
+                notificationPList.enableStats()
+        self._compileTrigger(record)
+
+    # =========================================================================
+    def disableStats(self, id):
+        """Disable statistics for all notifications for the given trigger.
+
+        Statistics already recorded are dropped, and the dispatch function
+        for the trigger is compiled again.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> def trigger(): pass
+        >>> def notif(): pass
+        >>> nt.registerTrigger(trigger) # doctest: +ELLIPSIS
+        {'trigger': <function trigger at 0x...>, 'id': 1}
+        >>> nt.registerNotification(1, 1, True, True, notif)
+        True
+        >>> nt.enableStats(1)
+        >>> nt.runTrigger(1)
+
+        >>> nt.disableStats(1)
+        >>> nt.runTrigger(1)
+        >>> nt.stats(1)
+        {'after': {}, 'before': {}}
+
+        :type id: int
+        :param id:
+            Id where the trigger is registered.
+
+        :raise InvalidIdException:
+            Trigger id is not valid.
+        """
+        if __debug__:
+            self.logger.debug('%s: disable stats for trigger with id=%d' %
+                              (info.FUNC(), id))
+        record = self._getTriggerRecord(id)
+        record.stats = False
+        for notificationPList in (record.before, record.after):
+            if notificationPList is not None:
+                notificationPList.disableStats()
+        self._compileTrigger(record)
+
+    # =========================================================================
+    def stats(self, id):
+        """Return statistics for all notifications for the given trigger.
+
+        It returns a dictionary with BEFORE and AFTER as keys, and which
+        values are the statistics for the priority list, see
+        plist.PListFunction.stats.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> def trigger(): pass
+        >>> nt.registerTrigger(trigger) # doctest: +ELLIPSIS
+        {'trigger': <function trigger at 0x...>, 'id': 1}
+        >>> nt.stats(1)
+        {'after': {}, 'before': {}}
+
+        :type id: int
+        :param id:
+            Id where the trigger is registered.
+
+        :rtype: dict
+        :return: Statistics for BEFORE and AFTER notifications.
+
+        :raise InvalidIdException:
+            Trigger id is not valid.
+        """
+        record = self._getTriggerRecord(id)
+        return {BEFORE: record.before.stats() if record.before is not None else {},
+                AFTER: record.after.stats() if record.after is not None else {}}
+
     # =========================================================================
     def runTrigger(self, id, *args, **kwargs):
         """Run the given trigger by the id.
@@ -1048,7 +1478,7 @@ class Notificator(object):
 
         :type id: int
         :param id:
-            Id where the trigger is located in the triggerInfo dictionary.
+            Id where the trigger is registered.
 
         :type args: list
         :param args:
@@ -1069,15 +1499,358 @@ class Notificator(object):
             if __debug__:
                 self.logger.debug('%s: running trigger with id=%d' %
                                   (info.FUNC(), id))
-            self._validateId(id)
-            triggerInfo = self.triggerInfo[id]
-            triggerFunction = triggerInfo[TRIGGER]
-            argsToUse       = args if args  else triggerInfo[ARGS]
-            kwargsToUse     = kwargs if kwargs else triggerInfo[KWARGS]
-            return triggerFunction(*argsToUse, **kwargsToUse)
+            return self._getTriggerRecord(id).call(args, kwargs)
         except InvalidIdException:
             raise TriggerException('Invalid id value: %s' % id)
 
+    # =========================================================================
+    def runTriggers(self, triggers, collectExceptions=False):
+        """Run a batch of triggers.
+
+        It runs every trigger in the given order, with the given args and
+        kwargs, which override default ones when they are not empty or None.
+        All ids are validated before any trigger runs, so an invalid id does
+        not run part of the batch. A trigger deregistered by a trigger that
+        runs before it in the batch raises a TriggerException.
+
+        If collectExceptions is True, the batch is not aborted: the exception
+        raised by a trigger, or a TriggerException for an invalid id, is
+        placed in the list of results instead of its return value.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> def trigger1(x, y=0): print 'the trigger1 with (%s, %s)' % (x, y); return x
+        >>> nt.registerTrigger(trigger1, 'ONE', y=1) # doctest: +ELLIPSIS
+        {'trigger': <function trigger1 at 0x...>, 'id': 1}
+
+        >>> def trigger2(x): raise ValueError(x)
+        >>> nt.registerTrigger(trigger2) # doctest: +ELLIPSIS
+        {'trigger': <function trigger2 at 0x...>, 'id': 2}
+
+        >>> def notif1(x, y=0): print 'notif1'
+        >>> nt.registerNotification(1, 1, False, True, notif1)
+        True
+
+        >>> nt.runTriggers([(1, (), {}), (1, ('two', ), None)])
+        the trigger1 with (ONE, 1)
+        notif1
+        the trigger1 with (two, 1)
+        notif1
+        ['ONE', 'two']
+
+        >>> nt.runTriggers([(1, (), {}), (3, (), {})])
+        Traceback (most recent call last):
+        ...
+        TriggerException: Trigger failed : Invalid id value: 3
+
+        >>> nt.runTriggers([(1, (), {}), (2, ('bad', ), {})])
+        Traceback (most recent call last):
+        ...
+        ValueError: bad
+
+        >>> results = nt.runTriggers([(2, ('bad', ), {}), (3, (), {}), (1, (), {})], collectExceptions=True)
+        the trigger1 with (ONE, 1)
+        notif1
+        >>> results[0], str(results[1]), results[2]
+        (ValueError('bad',), 'Trigger failed : Invalid id value: 3', 'ONE')
+
+        Dispatch functions are taken from the trigger records when every
+        trigger runs, so changes done by a trigger in the batch apply to the
+        triggers after it.
+
+        >>> def trigger3(): nt.deregisterTrigger(1); nt.registerNotification(4, 1, True, True, notif4)
+        >>> def trigger4(): print 'the trigger4'
+        >>> def notif4(): print 'notif4'
+        >>> nt.registerTrigger(trigger3)[ID], nt.registerTrigger(trigger4)[ID]
+        (3, 4)
+
+        >>> results = nt.runTriggers([(3, (), {}), (4, (), {}), (1, (), {})], collectExceptions=True)
+        notif4
+        the trigger4
+        >>> results[:2], str(results[2])
+        ([None, None], 'Trigger failed : Invalid id value: 1')
+
+        :type triggers: list
+        :param triggers:
+            Iterable with a tuple (id, args, kwargs) for every trigger to run.
+
+        :type collectExceptions: boolean
+        :param collectExceptions:
+            If True, exceptions are returned in the list of results.
+            If False, the first exception aborts the batch.
+
+        :rtype: list
+        :return:
+            Return value for every trigger, in the given order.
+
+        :raise TriggerException:
+            If any id is not valid and exceptions are not collected.
+        """
+        if __debug__:
+            self.logger.debug('%s: running triggers, collectExceptions=%s' %
+                              (info.FUNC(), collectExceptions))
+        triggers = list(triggers)
+        records = []
+        for id, args, kwargs in triggers:
+            try:
+                records.append(self._getTriggerRecord(id))
+            except InvalidIdException:
+                if not collectExceptions:
+                    raise TriggerException('Invalid id value: %s' % id)
+                records.append(None)
+
+        results = []
+        if not collectExceptions:
+            for record, (id, args, kwargs) in zip(records, triggers):
+                results.append(record.call(args, kwargs))
+            return results
+
+        for record, (id, args, kwargs) in zip(records, triggers):
+            if record is None:
+                results.append(TriggerException('Invalid id value: %s' % id))
+                continue
+            try:
+                results.append(record.call(args, kwargs))
+            except Exception as ex:
+                results.append(ex)
+        return results
+
+    # =========================================================================
+    def _runDispatcher(self, queue):
+        """Run triggers posted to the given queue until it is stopped.
+
+        It runs in a dispatcher thread. Exceptions raised by triggers, or
+        triggers deregistered after they were posted, are logged, and the
+        dispatcher continues with the next event.
+
+        :type queue: Queue.Queue
+        :param queue:
+            Queue for the dispatcher thread.
+        """
+        while True:
+            event = queue.get()
+            try:
+                if event is None:
+                    return
+                id, args, kwargs = event
+                try:
+                    self._getTriggerRecord(id).call(args, kwargs)
+                except Exception as ex:
+                    self.logger.error('%s: trigger with id=%s failed: %s' %
+                                      (info.FUNC(), id, ex))
+            finally:
+                queue.task_done()
+
+    # =========================================================================
+    def startDispatcher(self, threads=1, maxsize=DISPATCH_QUEUE_SIZE):
+        """Start dispatcher threads for triggers posted with postTrigger.
+
+        Every dispatcher thread has its own bounded queue. Triggers are
+        assigned to a queue by their id, so events for the same trigger are
+        always run in the order they were posted. Notifications and triggers
+        posted run in the dispatcher threads.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> nt.startDispatcher(threads=2, maxsize=8)
+        >>> len(nt.queues), len(nt.dispatchers)
+        (2, 2)
+
+        >>> nt.startDispatcher()
+        Traceback (most recent call last):
+        ...
+        TriggerException: Trigger failed : Dispatcher already started
+
+        >>> nt.stopDispatcher()
+        >>> nt.join()
+        True
+
+        :type threads: int
+        :param threads:
+            Number of dispatcher threads.
+
+        :type maxsize: int
+        :param maxsize:
+            Maximum number of events waiting in the queue for every thread.
+
+        :raise TriggerException:
+            If dispatcher threads are already running.
+        """
+        if self.queues is not None:
+            raise TriggerException('Dispatcher already started')
+        if __debug__:
+            self.logger.debug('%s: start %d dispatcher threads, maxsize=%d' %
+                              (info.FUNC(), threads, maxsize))
+        self.queues = [Queue.Queue(maxsize) for _ in xrange(threads)]
+        for index, queue in enumerate(self.queues):
+            dispatcher = threading.Thread(target=self._runDispatcher,
+                                          args=(queue, ),
+                                          name='notificator-dispatcher-%d' % index)
+            dispatcher.daemon = True
+            dispatcher.start()
+            self.dispatchers.append(dispatcher)
+
+    # =========================================================================
+    def postTrigger(self, id, *args, **kwargs):
+        """Post the given trigger to be run by a dispatcher thread.
+
+        It validates the id and it stores the trigger in the queue for the
+        dispatcher thread, which runs it as runTrigger would do. It does not
+        wait for the queue to have room: a full queue raises an exception,
+        so the caller can decide to retry, drop or run the trigger.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> calls = []
+        >>> running = threading.Event()
+        >>> release = threading.Event()
+        >>> def trigger(x):
+        ...     calls.append(x)
+        ...     running.set()
+        ...     release.wait()
+        >>> nt.registerTrigger(trigger, 'default') # doctest: +ELLIPSIS
+        {'trigger': <function trigger at 0x...>, 'id': 1}
+
+        >>> nt.postTrigger(1)
+        Traceback (most recent call last):
+        ...
+        TriggerException: Trigger failed : Dispatcher not started
+
+        >>> nt.startDispatcher(maxsize=1)
+        >>> nt.postTrigger(1)
+        >>> running.wait(5)
+        True
+        >>> nt.postTrigger(1, 'one')
+        >>> nt.postTrigger(1, 'two')
+        Traceback (most recent call last):
+        ...
+        TriggerQueueFullException: Trigger queue is full : id: 1
+
+        >>> release.set()
+        >>> nt.flush()
+        >>> calls
+        ['default', 'one']
+
+        >>> nt.postTrigger(2)
+        Traceback (most recent call last):
+        ...
+        TriggerException: Trigger failed : Invalid id value: 2
+
+        >>> nt.stopDispatcher()
+        >>> nt.join()
+        True
+
+        :type id: int
+        :param id:
+            Id where the trigger is registered.
+
+        :type args: list
+        :param args:
+                Override list parameters when the trigger function is called.
+
+        :type kwargs: dict
+        :param kwargs:
+                Override dictionary parameters when the trigger function is called.
+
+        :raise TriggerException:
+            If the id is not valid or dispatcher threads are not running.
+
+        :raise TriggerQueueFullException:
+            If the queue for the trigger is full.
+        """
+        if __debug__:
+            self.logger.debug('%s: posting trigger with id=%d' %
+                              (info.FUNC(), id))
+        if not self._isValidId(id):
+            raise TriggerException('Invalid id value: %s' % id)
+        queues = self.queues
+        if queues is None:
+            raise TriggerException('Dispatcher not started')
+        try:
+            queues[(id & ID_SLOT_MASK) % len(queues)].put_nowait((id, args, kwargs))
+        except Queue.Full:
+            raise TriggerQueueFullException('id: %s' % id)
+
+    # =========================================================================
+    def flush(self):
+        """Wait until all triggers posted have been run.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+        >>> calls = []
+        >>> def trigger(x): calls.append(x)
+        >>> nt.registerTrigger(trigger) # doctest: +ELLIPSIS
+        {'trigger': <function trigger at 0x...>, 'id': 1}
+
+        >>> nt.flush()
+
+        >>> nt.startDispatcher(threads=2)
+        >>> for x in range(5):
+        ...     nt.postTrigger(1, x)
+        >>> nt.flush()
+        >>> calls
+        [0, 1, 2, 3, 4]
+
+        >>> nt.stopDispatcher()
+        >>> nt.join()
+        True
+        """
+        for queue in self.queues or ():
+            queue.join()
+
+    # =========================================================================
+    def stopDispatcher(self):
+        """Stop dispatcher threads.
+
+        Triggers already posted are run before dispatcher threads stop, and
+        no new trigger can be posted. Use join to wait for threads to finish.
+
+        >>> nt = Notificator((1, 2, 3), 2)
+
+        >>> nt.stopDispatcher()
+        Traceback (most recent call last):
+        ...
+        TriggerException: Trigger failed : Dispatcher not started
+
+        >>> nt.startDispatcher()
+        >>> nt.stopDispatcher()
+        >>> nt.queues
+
+        >>> nt.join()
+        True
+        >>> nt.dispatchers
+        []
+
+        :raise TriggerException:
+            If dispatcher threads are not running.
+        """
+        queues = self.queues
+        if queues is None:
+            raise TriggerException('Dispatcher not started')
+        if __debug__:
+            self.logger.debug('%s: stop dispatcher threads' % (info.FUNC(), ))
+        self.queues = None
+        for queue in queues:
+            queue.put(None)
+
+    # =========================================================================
+    def join(self, timeout=None):
+        """Wait for stopped dispatcher threads to finish.
+
+        :type timeout: float
+        :param timeout:
+            Maximum number of seconds to wait for every thread, or None to
+            wait until they finish.
+
+        :rtype: boolean
+        :return:
+            True if all dispatcher threads finished.
+        """
+        for dispatcher in self.dispatchers:
+            dispatcher.join(timeout)
+        self.dispatchers = [dispatcher for dispatcher in self.dispatchers
+                            if dispatcher.is_alive()]
+        return not self.dispatchers
+
 
 ###############################################################################
 ##                  _
@@ -22,6 +22,15 @@ __docformat__ = 'restructuredtext en'
 #
 # import std python modules
 #
+import bisect
+import collections
+import cPickle
+import functools
+import itertools
+import operator
+import sys
+import timeit
+import weakref
 
 #
 # import user python modules
@@ -67,6 +76,180 @@ KWARGS = 'kwargs'
     PListFunction is being stored
 """
 
+BATCH = 'batch'
+"""
+    :type: str
+
+    String that represents the key where the flag that selects how a method
+    in class PListFunction receives a batch of events is being stored. If it
+    is True, the method is called once with the list of events, else it is
+    called once per event.
+"""
+
+WEAK = 'weak'
+"""
+    :type: str
+
+    String that represents the key where the flag that selects if a method in
+    class PListFunction is referenced weakly is being stored. If it is True,
+    the entry does not keep the method owner alive, and it is removed when
+    the owner is deleted.
+"""
+
+RESULT = 'result'
+"""
+    :type: str
+
+    String that represents the key where the value returned by a method
+    called from class PListFunction is being stored in the dispatch results.
+"""
+
+EXCEPTION = 'exception'
+"""
+    :type: str
+
+    String that represents the key where the exception raised by a method
+    called from class PListFunction is being stored in the dispatch results.
+"""
+
+EXECUTED = 'executed'
+"""
+    :type: str
+
+    String that represents the key where priorities called are being stored
+    in the report returned by PListFunction.callForAllWithin.
+"""
+
+SKIPPED = 'skipped'
+"""
+    :type: str
+
+    String that represents the key where priorities not called are being
+    stored in the report returned by PListFunction.callForAllWithin.
+"""
+
+DEFERRED = 'deferred'
+"""
+    :type: str
+
+    String that represents the key where priorities deferred to a queue are
+    being stored in the report returned by PListFunction.callForAllWithin.
+"""
+
+COUNT = 'count'
+"""
+    :type: str
+
+    String that represents the key where the number of calls for a method
+    in class PListFunction is being stored in statistics.
+"""
+
+TIME = 'time'
+"""
+    :type: str
+
+    String that represents the key where the cumulative time, in seconds, for
+    calls to a method in class PListFunction is being stored in statistics.
+"""
+
+HISTOGRAM = 'histogram'
+"""
+    :type: str
+
+    String that represents the key where the latency histogram for calls to
+    a method in class PListFunction is being stored in statistics.
+"""
+
+HISTOGRAM_BOUNDS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+"""
+    :type: tuple
+
+    Upper bounds, in seconds, for buckets in the latency histogram. The
+    histogram has one more bucket for calls longer than the last bound.
+"""
+
+STORAGE_LIST = 'list'
+"""
+    :type: str
+
+    String that identifies the storage where every priority keeps its entries
+    in a plain python list. It is the default storage.
+"""
+
+STORAGE_INDEXED = 'indexed'
+"""
+    :type: str
+
+    String that identifies the storage where every priority keeps its entries
+    in an IndexedBucket, so checking and removing entries do not scan the list.
+    Entries (or the key used for them) have to be hashable.
+"""
+
+STORAGE_DEQUE = 'deque'
+"""
+    :type: str
+
+    String that identifies the storage where every priority keeps its entries
+    in a DequeBucket, so entries are added at the front in constant time.
+"""
+
+STORAGES = (STORAGE_LIST, STORAGE_INDEXED, STORAGE_DEQUE)
+"""
+    :type: tuple
+
+    Tuple with all storages that can be used in a PList.
+"""
+
+UNIQUE_REJECT = 'reject'
+"""
+    :type: str
+
+    String that identifies the unique entries mode where adding an entry
+    already in the list for the priority is rejected.
+"""
+
+UNIQUE_MOVE = 'move'
+"""
+    :type: str
+
+    String that identifies the unique entries mode where adding an entry
+    already in the list for the priority moves it to the new position.
+"""
+
+UNIQUES = (UNIQUE_REJECT, UNIQUE_MOVE)
+"""
+    :type: tuple
+
+    Tuple with all unique entries modes that can be used in a PList.
+"""
+
+STATE_VERSION = 2
+"""
+    :type: int
+
+    Version for the state of a PList, used when it is serialized. Any state
+    with a different version is rejected when it is restored.
+"""
+
+_pvaluesListDB = weakref.WeakValueDictionary()
+"""
+    :type: weakref.WeakValueDictionary
+
+    This module variable dictionary stores all PValuesList instances in use
+    by priority lists, where the key for every instance is the tuple with
+    priorities and the default priority. When the same priorities are
+    requested, it returns the already created instance.
+"""
+
+asyncio = None
+"""
+    :type: module
+
+    Module asyncio, or trollius for Python 2, used by AsyncPListFunction. It
+    is None until _getAsyncio imports it, so importing this module does not
+    import any event loop library.
+"""
+
 
 ###############################################################################
 ##            _                     _   _
@@ -78,6 +261,169 @@ KWARGS = 'kwargs'
 ###############################################################################
 #
 
+# =============================================================================
+def _getAsyncio():
+    """Return the asyncio module, importing it the first time.
+
+    Module asyncio is used if it is available, else module trollius.
+
+    >>> _getAsyncio() is _getAsyncio()
+    True
+
+    :rtype: module
+    :return: Module asyncio or trollius, None if none of them is available.
+    """
+    global asyncio
+    if asyncio is None:
+        try:
+            import asyncio as module
+        except ImportError:
+            try:
+                import trollius as module
+            except ImportError:
+                return None
+        asyncio = module
+    return asyncio
+
+
+# =============================================================================
+def getPValuesList(priorities, defaultPriority):
+    """Returns the PValuesList for the given priorities.
+
+    It creates a new PValuesList, if there is not any instance in use for the
+    given priorities and default priority. If there is an instance, it is
+    returned, so priority lists with the same priorities share it.
+
+    >>> getPValuesList((1, 2, 3), 2) is getPValuesList((1, 2, 3), 2)
+    True
+
+    >>> getPValuesList((1, 2, 3), 2) is getPValuesList((1, 2, 3), 3)
+    False
+
+    >>> getPValuesList((1, 2, 3), 0)
+    Traceback (most recent call last):
+    ...
+    DefaultPriorityException: Default priority not valid : default: 0 not in (1, 2, 3)
+
+    :type priorities: tuple
+    :param priorities: It is the list of priorities.
+
+    :type defaultPriority: object
+    :param defaultPriority: It is the default priority.
+
+    :rtype: PValuesList
+    :return: PValuesList for the given priorities and default priority.
+
+    :raise PriorityListException:
+        No list of priorities is provided.
+
+    :raise DefaultPriorityException:
+        Default priority does not belong to list of priorities provided.
+    """
+    if not isinstance(priorities, tuple):
+        return PValuesList(priorities, defaultPriority)
+    key = (priorities, defaultPriority)
+    pvalues = _pvaluesListDB.get(key)
+    if pvalues is None:
+        pvalues = _pvaluesListDB[key] = PValuesList(priorities, defaultPriority)
+    return pvalues
+
+
+# =============================================================================
+def dumps(plist):
+    """Serialize the given priority list.
+
+    It uses pickle protocol 2, and the state defined by the priority list,
+    which contains priorities, default priority, storage and entries.
+
+    >>> pl = PList((1, 2, 3), 2, "custom list", STORAGE_DEQUE)
+    >>> pl.addManyAtBack(('one', 'two'), 3)
+    ['one', 'two']
+
+    >>> restored = loads(dumps(pl))
+    >>> restored.getAllLists(), restored.storage, restored.name
+    ([[], [], ['one', 'two']], 'deque', 'custom list')
+
+    :type plist: PList
+    :param plist: Priority list to serialize.
+
+    :rtype: str
+    :return: Binary string with the priority list.
+    """
+    return cPickle.dumps(plist, cPickle.HIGHEST_PROTOCOL)
+
+
+# =============================================================================
+def loads(data):
+    """Restore a priority list serialized with dumps.
+
+    :type data: str
+    :param data: Binary string with the priority list.
+
+    :rtype: PList
+    :return: Priority list restored.
+
+    :raise InvalidStateException:
+        State version is not supported.
+    """
+    return cPickle.loads(data)
+
+
+# =============================================================================
+def _getCallableReference(method):
+    """Return an importable reference for the given callable.
+
+    Functions are referenced by module and name, and bound methods by the
+    object they are bound to and the method name.
+
+    >>> import operator
+    >>> _getCallableReference(operator.add)
+    ('operator', 'add')
+
+    >>> _getCallableReference(lambda: None)
+    Traceback (most recent call last):
+    ...
+    InvalidStateException: State is not valid : callable <lambda> can not be imported
+
+    :type method: function
+    :param method: Callable to reference.
+
+    :rtype: tuple
+    :return: Module and name, or object and method name.
+
+    :raise InvalidStateException:
+        Callable can not be imported.
+    """
+    target = getattr(method, 'im_self', None)
+    name   = getattr(method, '__name__', None)
+    if target is not None:
+        return (target, name)
+    module = sys.modules.get(getattr(method, '__module__', None))
+    if name is None or getattr(module, name, None) is not method:
+        raise InvalidStateException('callable %s can not be imported' % (name, ))
+    return (method.__module__, name)
+
+
+# =============================================================================
+def _getCallableFromReference(reference):
+    """Return the callable for the given reference.
+
+    >>> _getCallableFromReference(('operator', 'add'))(1, 2)
+    3
+
+    :type reference: tuple
+    :param reference: Reference created by _getCallableReference.
+
+    :rtype: function
+    :return: Callable referenced.
+    """
+    target, name = reference
+    if isinstance(target, str):
+        __import__(target)
+        target = sys.modules[target]
+    return getattr(target, name)
+
+
 ###############################################################################
 ##       _                     _       __ _       _ _   _
 ##   ___| | __ _ ___ ___    __| | ___ / _(_)_ __ (_) |_(_) ___  _ __  ___
@@ -176,6 +522,94 @@ class InvalidPriorityException(error.BaseException):
     BASE_MESSAGE = 'Priority is not in the priority list'
 
 
+#
+# =============================================================================
+#
+class InvalidStorageException(error.BaseException):
+    """Invalid Storage Exception.
+    Exception raised when the storage requested for a priority list is not
+    one of the storages supported.
+
+    >>> ex = InvalidStorageException()
+
+    >>> ex.BASE_MESSAGE
+    'Storage is not supported'
+
+    >>> raise InvalidStorageException('custom invalid storage')
+    Traceback (most recent call last):
+    ...
+    InvalidStorageException: Storage is not supported : custom invalid storage
+
+    """
+    BASE_MESSAGE = 'Storage is not supported'
+
+
+#
+# =============================================================================
+#
+class AsyncNotSupportedException(error.BaseException):
+    """Async Not Supported Exception.
+    Exception raised when an asynchronous priority list is created, but
+    neither asyncio nor trollius are available.
+
+    >>> ex = AsyncNotSupportedException()
+
+    >>> ex.BASE_MESSAGE
+    'Asynchronous calls are not supported'
+
+    >>> raise AsyncNotSupportedException('custom async not supported')
+    Traceback (most recent call last):
+    ...
+    AsyncNotSupportedException: Asynchronous calls are not supported : custom async not supported
+
+    """
+    BASE_MESSAGE = 'Asynchronous calls are not supported'
+
+
+#
+# =============================================================================
+#
+class InvalidStateException(error.BaseException):
+    """Invalid State Exception.
+    Exception raised when a priority list is restored from a state that is
+    not valid, or when it can not be serialized.
+
+    >>> ex = InvalidStateException()
+
+    >>> ex.BASE_MESSAGE
+    'State is not valid'
+
+    >>> raise InvalidStateException('custom invalid state')
+    Traceback (most recent call last):
+    ...
+    InvalidStateException: State is not valid : custom invalid state
+
+    """
+    BASE_MESSAGE = 'State is not valid'
+
+
+#
+# =============================================================================
+#
+class DuplicateEntryException(error.BaseException):
+    """Duplicate Entry Exception.
+    Exception raised when an entry is added to a priority list with unique
+    entries, and the entry is already in the list for the priority.
+
+    >>> ex = DuplicateEntryException()
+
+    >>> ex.BASE_MESSAGE
+    'Entry already in the priority list'
+
+    >>> raise DuplicateEntryException('custom duplicate entry')
+    Traceback (most recent call last):
+    ...
+    DuplicateEntryException: Entry already in the priority list : custom duplicate entry
+
+    """
+    BASE_MESSAGE = 'Entry already in the priority list'
+
+
 #
 # =============================================================================
 #
@@ -205,8 +639,25 @@ class PValuesList(object):
     :ivar defaultPriority:
         Value defines in priorities, and used by all method in PList as the
         default priority if no priority is provided.
+
+    :type ranks: dict
+    :ivar ranks:
+        Dictionary, where every key is a value in priorities, and which value
+        is the position for such priority in the list of priorities.
+
+    :type ascending: bool
+    :ivar ascending:
+        True if priorities are sorted in ascending order, None until it is
+        checked for the first time, see isAscending.
+
+    Attributes are kept in slots, but instances still have a dictionary, so
+    any other attribute can be set, as mockerator does.
     """
 
+    __slots__ = ('priorities', 'defaultPriority', 'name', 'ranks', 'ascending', '__dict__', '__weakref__')
+
+    logger = loggerator.getLoggerator('pvaluelist')
+
     # =========================================================================
     def __init__(self, priorities, defaultPriority, name=None):
         """PValuesList class constructor.
@@ -225,6 +676,9 @@ class PValuesList(object):
         >>> pl.name
         'custom enums'
 
+        >>> pl.ranks
+        {1: 0, 2: 1, 3: 2}
+
         >>> pl = PValuesList((1, 2, 3), 2)
 
         >>> pl.name
@@ -262,10 +716,11 @@ class PValuesList(object):
             raise DefaultPriorityException('default: %s not in %s' %
                                            (defaultPriority, priorities))
 
-        self.logger          = loggerator.getLoggerator('pvaluelist')
         self.priorities      = priorities
         self.defaultPriority = defaultPriority
         self.name            = name
+        self.ranks           = dict(itertools.izip(priorities, itertools.count()))
+        self.ascending       = None
 
     # =========================================================================
     def isValid(self, priority):
@@ -291,7 +746,28 @@ class PValuesList(object):
             True if the priority is in the list of priorities. False if it is
             not found in the list of priorities.
         """
-        return priority in self.priorities
+        return priority in self.ranks
+
+    # =========================================================================
+    def isAscending(self):
+        """Check if priorities are sorted in ascending order.
+
+        Priorities are checked only the first time, the result is kept in
+        ascending.
+
+        >>> PValuesList((1, 2, 3), 2).isAscending()
+        True
+
+        >>> PValuesList((3, 2, 1), 2).isAscending()
+        False
+
+        :rtype: boolean
+        :return: True if priorities are sorted in ascending order.
+        """
+        if self.ascending is None:
+            priorities = self.priorities
+            self.ascending = all(itertools.imap(operator.le, priorities, itertools.islice(priorities, 1, None)))
+        return self.ascending
 
     # =========================================================================
     def getList(self):
@@ -348,807 +824,3408 @@ class PValuesList(object):
 #
 ###############################################################################
 #
-class PList(object):
-    """PList class provides a base class for a priority list.
-
-    It wrappers up a class, where items are organized in physically different
-    list per priority.
+class IndexedBucket(object):
+    """IndexedBucket class stores entries for a single priority.
 
-    A PList is mainly a list of lists. The first/top list is kept in attribute
-    'container', which is a list where the index identify the priority.
-    The list of priorities, together with the default priority is stored in a
-    PValuesList instance.
+    It keeps entries in a double linked list, so they can be added at the
+    front or at the back, and it keeps an index from every entry key to the
+    nodes in the linked list where that key is stored. Checking if an entry is
+    in the bucket and removing it do not traverse the list.
 
-    For every entry in the container, one per priority, we have a list of
-    entries, which could be any kind of object.
+    It provides the subset of the python list interface used by PList, so it
+    can be used as a bucket in the PList container.
 
     ::
 
-        <priorityValues> as PValuesList instance.
-        _________________
-        |           |    |
-        | P1 .. Pn  | Px |
-        |___________|____|
+        Data Structures:
 
-        <container> as a list
-        _______                    _______________________________
-        |     |                    |       |       |     |       |
-        | P1  | ---> container[P1] | Data1 | Data2 | ... | DataN |
-        |_____|                    |_______|_______|_____|_______|
-        |     |
-        | P2  |
-        |_____|
-        |     |
-        | P3  |
-        |_____|
-        |     |
-        | ... |
-        |_____|                    _______________________________
-        |     |                    |       |       |     |       |
-        | Pn  | ---> container[Pn] | Data1 | Data2 | ... | DataN |
-        |_____|                    |_______|_______|_____|_______|
+            <root> as a double linked list of [prev, next, entry] nodes
+            ________      ___________      ___________      ________
+            |      | ---> |         | ---> |         | ---> |      |
+            | root |      | Entry1  |      | EntryN  |      | root |
+            |______| <--- |_________| <--- |_________| <--- |______|
+
+            <index> as a dictionary
+            ____________________________________
+            |          |                       |
+            | Key: key | list of nodes for key |
+            |__________|_______________________|
+
+    :type key: function
+    :ivar key:
+        Function that returns the key to be used in the index for any entry.
+        If it is None, the entry itself is used as the key.
+
+    :type root: list
+    :ivar root:
+        Sentinel node for the double linked list.
+
+    :type index: dict
+    :ivar index:
+        Dictionary where every key is an entry key, and which value is the
+        list of nodes with that key, in the same order they are in the bucket.
+
+    :type length: int
+    :ivar length:
+        Number of entries in the bucket.
+    """
 
-    Data entries (Data1, ..., DataN) can be added at the Front (before Data1)
-    or at the Back (after DataN) for every container[Pn].
+    __slots__ = ('key', 'root', 'index', 'length')
 
-    :type priorityValues: PValuesList
-    :ivar priorityValues:
-        PValuesList with the list with all possible priorites and the default
-        one.
+    # =========================================================================
+    def __init__(self, key=None, entries=None):
+        """IndexedBucket class constructor.
 
-    :type container: dict
-    :ivar container:
-        Dictionary, where every key is a value in priorities, and which
-        value is the list of object for such priority.
-    """
+        >>> bucket = IndexedBucket()
+        >>> bucket
+        IndexedBucket([])
 
-    # =========================================================================
-    def __init__(self, priorities, defaultPriority, name=None):
-        """PList class constructor.
+        >>> len(bucket)
+        0
 
-        Create a PList instance with a the given list of priorities, and where
-        the default priority when an entry is added is de default value
-        provided in the constructor.
+        >>> IndexedBucket(entries=('one', 'two'))
+        IndexedBucket(['one', 'two'])
 
-        A list will be created per entry in the list of priorities.
+        :type key: function
+        :param key:
+            Function that returns the key for a given entry. If it is None,
+            the entry is used as its own key.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
+        :type entries: list
+        :param entries:
+            Entries to be added at the back of the bucket.
+        """
+        self.key    = key
+        self.root   = []
+        self.root[:] = [self.root, self.root, None]
+        self.index  = {}
+        self.length = 0
+        if entries:
+            for entry in entries:
+                self.append(entry)
 
-        >>> pl.logger # doctest: +ELLIPSIS
-        <loggerator.Loggerator object at 0x...>
+    # =========================================================================
+    def _getKey(self, entry):
+        """Return the key used in the index for the given entry.
 
-        >>> pl.priorityValues # doctest: +ELLIPSIS
-        <__main__.PValuesList object at 0x...>
+        >>> IndexedBucket()._getKey('one')
+        'one'
 
-        >>> pl.name
-        'custom list'
+        >>> IndexedBucket(key=len)._getKey('one')
+        3
 
-        >>> pl.container
-        {1: [], 2: [], 3: []}
+        :type entry: object
+        :param entry: Entry to get the key.
 
-        >>> pl = PList(None, 2)
-        Traceback (most recent call last):
-        ...
-        PriorityListException: Not valid priority list : priorities: None
+        :rtype: object
+        :return: Key for the given entry.
+        """
+        return entry if self.key is None else self.key(entry)
 
-        >>> pl = PList(2, 2)
-        Traceback (most recent call last):
-        ...
-        PriorityListException: Not valid priority list : priorities: 2
+    # =========================================================================
+    def _link(self, entry, prev):
+        """Link the given entry after the given node.
 
-        >>> pl = PList((1, 2, 3), 4)
-        Traceback (most recent call last):
-        ...
-        DefaultPriorityException: Default priority not valid : default: 4 not in (1, 2, 3)
+        :type entry: object
+        :param entry: Entry to be linked.
 
-        :type priorities: list
-        :param priorities:
-            It is the list of priorities to be used in the priority list.
+        :type prev: list
+        :param prev: Node after which the entry is linked.
 
-        :type defaultPriority: object
-        :param defaultPriority:
-            It is the default priority that will be used for any other method
-            when no priority value is provided.
-            This value should be present in the list of priorities provided in
-            this constructor.
+        :rtype: list
+        :return: New node created for the entry.
+        """
+        next = prev[1]
+        node = [prev, next, entry]
+        prev[1] = node
+        next[0] = node
+        self.length += 1
+        return node
 
-        :type name: str
-        :param name: name for the list
+    # =========================================================================
+    def insert(self, position, entry):
+        """Insert the given entry before the given position.
 
-        :raise PriorityListException:
-            No list of priorities is provided.
+        Inserting at the front or at the back of the bucket does not traverse
+        the bucket.
 
-        :raise DefaultPriorityException:
-            Default priority does not belong to list of priorities provided.
+        >>> bucket = IndexedBucket()
+        >>> bucket.insert(0, 'one')
+        >>> bucket.insert(0, 'two')
+        >>> bucket.insert(2, 'three')
+        >>> bucket.insert(1, 'four')
+        >>> bucket.insert(-1, 'one')
+        >>> bucket
+        IndexedBucket(['two', 'four', 'one', 'one', 'three'])
+
+        >>> bucket.remove('one')
+        >>> bucket
+        IndexedBucket(['two', 'four', 'one', 'three'])
+
+        :type position: int
+        :param position: Position where the entry is inserted.
+
+        :type entry: object
+        :param entry: Entry to be inserted.
         """
-        if not priorities or not isinstance(priorities, tuple):
-            raise PriorityListException('priorities: %s' % (priorities, ))
+        key = self._getKey(entry)
+        if position < 0:
+            position = max(0, self.length + position)
+        if position == 0:
+            self.appendleft(entry)
+        elif position >= self.length:
+            self.append(entry)
+        else:
+            prev   = self.root
+            before = 0
+            for _ in xrange(position):
+                prev = prev[1]
+                if self._getKey(prev[2]) == key:
+                    before += 1
+            nodes = self.index.setdefault(key, [])
+            nodes.insert(before, self._link(entry, prev))
 
-        if not defaultPriority in priorities:
-            raise DefaultPriorityException('default: %s not in %s' % (defaultPriority, priorities))
+    # =========================================================================
+    def append(self, entry):
+        """Add the given entry at the back of the bucket.
 
-        self.logger         = loggerator.getLoggerator('plist')
-        self.priorityValues = PValuesList(priorities, defaultPriority)
-        self.name           = name
-        self.container      = {}
-        for priority in self.priorityValues.getList():
-            self.container[priority] = []
+        >>> bucket = IndexedBucket()
+        >>> bucket.append('one')
+        >>> bucket.append('two')
+        >>> bucket
+        IndexedBucket(['one', 'two'])
+
+        :type entry: object
+        :param entry: Entry to be added.
+        """
+        nodes = self.index.setdefault(self._getKey(entry), [])
+        nodes.append(self._link(entry, self.root[0]))
 
     # =========================================================================
-    def _validateEntry(self, entry):
-        """Validate entry before inserting it.
+    def extend(self, entries):
+        """Add all given entries at the back of the bucket.
 
-        It validates entry is valid for the priority list. This method should
-        be overriden by any specialized derived class.
+        >>> bucket = IndexedBucket(entries=('one', ))
+        >>> bucket.extend(('two', 'three'))
+        >>> bucket
+        IndexedBucket(['one', 'two', 'three'])
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
+        :type entries: list
+        :param entries: Entries to be added, in order.
+        """
+        key   = self.key
+        index = self.index
+        root  = self.root
+        last  = root[0]
+        count = 0
+        try:
+            for entry in entries:
+                node = [last, root, entry]
+                index.setdefault(entry if key is None else key(entry), []).append(node)
+                last[1] = node
+                last = node
+                count += 1
+        finally:
+            root[0] = last
+            self.length += count
 
-        >>> pl._validateEntry(0)
+    # =========================================================================
+    def appendleft(self, entry):
+        """Add the given entry at the front of the bucket.
 
-        >>> pl._validateEntry(None)
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : entry: None
+        >>> bucket = IndexedBucket(entries=('one', ))
+        >>> bucket.appendleft('two')
+        >>> bucket
+        IndexedBucket(['two', 'one'])
 
         :type entry: object
-        :param entry:
-            Object to be validated before being inserted.
-
-        :raise InvalidEntryException:
-            Entry is None or not valid.
+        :param entry: Entry to be added.
         """
-        if entry is None:
-            raise InvalidEntryException('entry: %s' % entry)
+        nodes = self.index.setdefault(self._getKey(entry), [])
+        nodes.insert(0, self._link(entry, self.root))
 
     # =========================================================================
-    def _getEntryFromContainer(self, entry, priority):
-        """Get entry from the container.
+    def extendleft(self, entries):
+        """Add all given entries at the front of the bucket.
 
-        This method returns the entry from the container for the given priority
-        that is related with the given entry parameter.
+        As in collections.deque, every entry is added at the front, so they
+        end up in reverse order.
 
-        It can be overriden in derived classes in order to provide the
-        real entry to be used, because the entry parameter could not be
-        the same as the entry in the container for derived classes.
+        >>> bucket = IndexedBucket(entries=('one', ))
+        >>> bucket.extendleft(('two', 'three'))
+        >>> bucket
+        IndexedBucket(['three', 'two', 'one'])
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', ], 2: [], 3: []}
+        :type entries: list
+        :param entries: Entries to be added.
+        """
+        for entry in entries:
+            self.appendleft(entry)
 
-        >>> pl._getEntryFromContainer('one', 1)
-        'one'
+    # =========================================================================
+    def remove(self, entry):
+        """Remove the first entry in the bucket with the same key.
 
-        >>> pl._getEntryFromContainer('two', 1)
+        >>> bucket = IndexedBucket(entries=('one', 'two', 'one'))
+        >>> bucket.remove('one')
+        >>> bucket
+        IndexedBucket(['two', 'one'])
 
-        >>> pl._getEntryFromContainer('one', 2)
+        >>> bucket.remove('three')
+        Traceback (most recent call last):
+        ...
+        ValueError: IndexedBucket.remove(x): x not in bucket
 
         :type entry: object
-        :param entry:
-            Object to be check is present in the container.
-
-        :type priority: int
-        :param priority:
-            Priority of the container where entry should be checked if present.
+        :param entry: Entry to be removed.
 
-        :rtype: object
-        :return:
-            Entry to be removed or None if not found.
+        :raise ValueError:
+            Entry is not in the bucket.
         """
-        return entry if entry in self.container[priority] else None
+        key = self._getKey(entry)
+        nodes = self.index.get(key)
+        if not nodes:
+            raise ValueError('IndexedBucket.remove(x): x not in bucket')
+        prev, next, _ = nodes.pop(0)
+        if not nodes:
+            del self.index[key]
+        prev[1] = next
+        next[0] = prev
+        self.length -= 1
 
     # =========================================================================
-    def _getValueFromEntry(self, entry):
-        """ Return value to return when an entry is found.
-
-        This method is used to return the value inside any entry stored in the
-        Plist.
-
-        This method should be redefined in derived list
+    def find(self, key):
+        """Return the first entry in the bucket with the given key.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> bucket = IndexedBucket(key=len, entries=('one', 'three', 'two'))
 
-        >>> pl._getValueFromEntry('one')
+        >>> bucket.find(3)
         'one'
 
-        :type entry: dict
-        :param entry: Entry found in the PListFunction.
+        >>> bucket.find(4)
+
+        :type key: object
+        :param key: Key to look for.
 
         :rtype: object
-        :return: Object stored in the entry in the PList.
+        :return: First entry with the given key or None if not found.
         """
-        return entry
+        nodes = self.index.get(key)
+        return nodes[0][2] if nodes else None
 
     # =========================================================================
-    def addAtFront(self, entry, priority=None):
-        """Add a new entry at the top/front of the list for the given priority.
+    def clear(self):
+        """Remove all entries from the bucket.
 
-        It adds the given entry in the list for the given priority, and it
-        adds at the start/front of the list.
+        >>> bucket = IndexedBucket(entries=('one', 'two'))
+        >>> bucket.clear()
+        >>> bucket
+        IndexedBucket([])
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> 'one' in bucket
+        False
+        """
+        self.root[:] = [self.root, self.root, None]
+        self.index.clear()
+        self.length = 0
 
-        >>> pl.addAtFront('one', 3)
-        'one'
+    # =========================================================================
+    def _iterNodes(self):
+        """Iterate over all nodes in the bucket from the front to the back.
 
-        >>> pl.container
-        {1: [], 2: [], 3: ['one']}
+        :rtype: generator
+        :return: Generator with all nodes in the bucket.
+        """
+        node = self.root[1]
+        while node is not self.root:
+            yield node
+            node = node[1]
 
-        >>> pl.addAtFront('two', 3)
-        'two'
+    # =========================================================================
+    def __iter__(self):
+        """Iterate over all entries from the front to the back.
 
-        >>> pl.container
-        {1: [], 2: [], 3: ['two', 'one']}
+        >>> list(IndexedBucket(entries=('one', 'two')))
+        ['one', 'two']
+        """
+        for node in self._iterNodes():
+            yield node[2]
 
-        >>> pl.addAtFront('three')
-        'three'
+    # =========================================================================
+    def __contains__(self, entry):
+        """Check if an entry with the same key is in the bucket.
 
-        >>> pl.container
-        {1: [], 2: ['three'], 3: ['two', 'one']}
+        >>> bucket = IndexedBucket(entries=('one', ))
 
-        >>> pl.addAtFront('four')
-        'four'
+        >>> 'one' in bucket
+        True
 
-        >>> pl.container
-        {1: [], 2: ['four', 'three'], 3: ['two', 'one']}
+        >>> 'two' in bucket
+        False
+        """
+        return self._getKey(entry) in self.index
 
-        >>> pl.addAtFront(None)
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : entry: None
+    # =========================================================================
+    def __len__(self):
+        """Return the number of entries in the bucket.
 
-        >>> pl.addAtFront('five', 0)
-        Traceback (most recent call last):
-        ...
-        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+        >>> len(IndexedBucket(entries=('one', 'two')))
+        2
+        """
+        return self.length
 
-        :type entry: object
-        :param entry:
-            Object to be added at the front of the list.
+    # =========================================================================
+    def __delitem__(self, position):
+        """Delete entries from the bucket.
 
-        :type priority: object
-        :param priority:
-            Priority where the object should be added. If no value is
-            provided, default priority will be used.
+        Only deleting the whole bucket is supported, which is what PList uses
+        to clean a priority.
 
-        :rtype: object
-        :return:
-            Object added if it was inserted properly.
+        >>> bucket = IndexedBucket(entries=('one', 'two'))
+        >>> del bucket[:]
+        >>> bucket
+        IndexedBucket([])
 
-        :raise InvalidEntryException:
-            Entry is None or not valid.
+        >>> del bucket[0]
+        Traceback (most recent call last):
+        ...
+        TypeError: IndexedBucket only supports deleting all entries
 
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
+        :type position: slice
+        :param position: Slice with all entries.
         """
-        self._validateEntry(entry)
-        priority = self.priorityValues.getDefault(priority)
-        self.container[priority].insert(0, entry)
-        if __debug__:
-            self.logger.debug('%s entry %s added front priority list %s' %
-                              (info.FUNC(), entry, priority))
-        return entry
+        if position != slice(None, None, None):
+            raise TypeError('IndexedBucket only supports deleting all entries')
+        self.clear()
 
     # =========================================================================
-    def addAtBack(self, entry, priority=None):
-        """Add a new entry at the back/end of the list for the given priority.
+    def __repr__(self):
+        """Return string to be displayed when the bucket is printed.
 
-        It adds the given entry in the list for the given priority , and it
-        adds at the back/end of the list.
+        >>> IndexedBucket(entries=(1, 2))
+        IndexedBucket([1, 2])
+        """
+        return '%s(%r)' % (self.__class__.__name__, list(self))
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
 
-        >>> pl.addAtBack('one', 3)
-        'one'
+#
+###############################################################################
+#
+class WeakCallable(object):
+    """WeakCallable class references a method without keeping it alive.
 
-        >>> pl.container
-        {1: [], 2: [], 3: ['one']}
+    For bound methods the object the method is bound to is referenced weakly,
+    for any other callable the callable itself is referenced weakly. The
+    given callback is called with the WeakCallable when the referenced object
+    is deleted.
 
-        >>> pl.addAtBack('two', 3)
-        'two'
+    It compares equal to, and it has the same hash as, the method it
+    references, so it can be looked for with the method.
 
-        >>> pl.container
-        {1: [], 2: [], 3: ['one', 'two']}
+    >>> class Foo(object):
+    ...     def bar(self, x): return 'bar %s' % x
+    >>> def died(call): print 'died %r' % call
+    >>> foo = Foo()
+    >>> call = WeakCallable(foo.bar, died)
+    >>> call('one')
+    'bar one'
 
-        >>> pl.addAtBack('three')
-        'three'
+    >>> call == foo.bar, foo.bar == call, hash(call) == hash(foo.bar)
+    (True, True, True)
 
-        >>> pl.container
-        {1: [], 2: ['three'], 3: ['one', 'two']}
+    >>> del foo
+    died <WeakCallable None>
 
-        >>> pl.addAtBack('four')
-        'four'
+    >>> call('one')
+    """
 
-        >>> pl.container
-        {1: [], 2: ['three', 'four'], 3: ['one', 'two']}
+    __slots__ = ('hash', 'func', 'ref')
 
-        >>> pl.addAtBack(None)
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : entry: None
+    # =========================================================================
+    def __init__(self, method, callback=None):
+        """WeakCallable class constructor.
 
-        >>> pl.addAtBack('five', 0)
-        Traceback (most recent call last):
-        ...
-        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+        :type method: function
+        :param method: Method to reference.
 
-        :type entry: object
-        :param entry:
-            Object to be added at the back of the list.
+        :type callback: function
+        :param callback:
+            Function called with the WeakCallable when the object referenced
+            is deleted.
+        """
+        self.hash = hash(method)
+        target = getattr(method, 'im_self', None)
+        if target is None:
+            self.func = None
+            target = method
+        else:
+            self.func = method.im_func
+        if callback is None:
+            self.ref = weakref.ref(target)
+        else:
+            self.ref = weakref.ref(target, lambda ref: callback(self))
 
-        :type priority: object
-        :param priority:
-            Priority where the object should be added. If no value is
-            provided, default priority will be used.
+    # =========================================================================
+    def get(self):
+        """Return the method referenced.
 
-        :rtype: object
-        :return:
-            Object added if it was inserted properly.
+        :rtype: function
+        :return: Method referenced, or None if the object was deleted.
+        """
+        target = self.ref()
+        if target is None or self.func is None:
+            return target
+        return self.func.__get__(target, type(target))
 
-        :raise InvalidEntryException:
-            Entry is None or not valid.
+    # =========================================================================
+    def __call__(self, *args, **kwargs):
+        """Call the method referenced.
+
+        Nothing is called if the object referenced was deleted.
+
+        :rtype: object
+        :return: Value returned by the method, or None if it was deleted.
+        """
+        target = self.ref()
+        if target is None:
+            return None
+        if self.func is None:
+            return target(*args, **kwargs)
+        return self.func(target, *args, **kwargs)
+
+    # =========================================================================
+    def __eq__(self, other):
+        """Compare the method referenced with the given one.
+
+        :type other: object
+        :param other: WeakCallable or method to compare with.
+
+        :rtype: bool
+        :return: True if both reference the same method.
+        """
+        if isinstance(other, WeakCallable):
+            return self.ref == other.ref and self.func is other.func
+        method = self.get()
+        return method is not None and method == other
+
+    # =========================================================================
+    def __ne__(self, other):
+        """Compare the method referenced with the given one.
+
+        :type other: object
+        :param other: WeakCallable or method to compare with.
+
+        :rtype: bool
+        :return: True if they do not reference the same method.
+        """
+        return not self == other
+
+    # =========================================================================
+    def __hash__(self):
+        """Return the hash for the method referenced.
+
+        :rtype: int
+        :return: Hash for the method referenced.
+        """
+        return self.hash
+
+    # =========================================================================
+    def __repr__(self):
+        """Return string to be displayed when the WeakCallable is printed.
+
+        :rtype: str
+        :return: String with the method referenced.
+        """
+        return '<%s %r>' % (self.__class__.__name__, self.get())
+
+
+#
+###############################################################################
+#
+class DequeBucket(collections.deque):
+    """DequeBucket class stores entries for a single priority in a deque.
+
+    Entries can be added at the front or at the back of the bucket in
+    constant time. Checking and removing entries still traverse the bucket,
+    use IndexedBucket when those operations are frequent.
+
+    It provides the subset of the python list interface used by PList, so it
+    can be used as a bucket in the PList container.
+    """
+
+    __slots__ = ()
+
+    # =========================================================================
+    def insert(self, position, entry):
+        """Insert the given entry before the given position.
+
+        Inserting at the front or at the back of the bucket does not traverse
+        the bucket.
+
+        >>> bucket = DequeBucket()
+        >>> bucket.insert(0, 'one')
+        >>> bucket.insert(0, 'two')
+        >>> bucket.insert(2, 'three')
+        >>> bucket.insert(1, 'four')
+        >>> bucket.insert(-1, 'five')
+        >>> bucket
+        DequeBucket(['two', 'four', 'one', 'five', 'three'])
+
+        :type position: int
+        :param position: Position where the entry is inserted.
+
+        :type entry: object
+        :param entry: Entry to be inserted.
+        """
+        if position < 0:
+            position = max(0, len(self) + position)
+        if position == 0:
+            self.appendleft(entry)
+        elif position >= len(self):
+            self.append(entry)
+        else:
+            self.rotate(-position)
+            self.appendleft(entry)
+            self.rotate(position)
+
+    # =========================================================================
+    def __delitem__(self, position):
+        """Delete entries from the bucket.
+
+        >>> bucket = DequeBucket(('one', 'two', 'three'))
+        >>> del bucket[1]
+        >>> bucket
+        DequeBucket(['one', 'three'])
+
+        >>> del bucket[:]
+        >>> bucket
+        DequeBucket([])
+
+        :type position: int
+        :param position: Position to delete, or a slice with all entries.
+        """
+        if position == slice(None, None, None):
+            self.clear()
+        else:
+            collections.deque.__delitem__(self, position)
+
+    # =========================================================================
+    def __repr__(self):
+        """Return string to be displayed when the bucket is printed.
+
+        >>> DequeBucket((1, 2))
+        DequeBucket([1, 2])
+        """
+        return '%s(%r)' % (self.__class__.__name__, list(self))
+
+
+#
+###############################################################################
+#
+class PList(object):
+    """PList class provides a base class for a priority list.
+
+    It wrappers up a class, where items are organized in physically different
+    list per priority.
+
+    A PList is mainly a list of lists. The first/top list is kept in attribute
+    'container', which is a list where the index identify the priority.
+    The list of priorities, together with the default priority is stored in a
+    PValuesList instance.
+
+    For every entry in the container, one per priority, we have a list of
+    entries, which could be any kind of object.
+
+    ::
+
+        <priorityValues> as PValuesList instance.
+        _________________
+        |           |    |
+        | P1 .. Pn  | Px |
+        |___________|____|
+
+        <container> as a list
+        _______                    _______________________________
+        |     |                    |       |       |     |       |
+        | P1  | ---> container[P1] | Data1 | Data2 | ... | DataN |
+        |_____|                    |_______|_______|_____|_______|
+        |     |
+        | P2  |
+        |_____|
+        |     |
+        | P3  |
+        |_____|
+        |     |
+        | ... |
+        |_____|                    _______________________________
+        |     |                    |       |       |     |       |
+        | Pn  | ---> container[Pn] | Data1 | Data2 | ... | DataN |
+        |_____|                    |_______|_______|_____|_______|
+
+    Data entries (Data1, ..., DataN) can be added at the Front (before Data1)
+    or at the Back (after DataN) for every container[Pn].
+
+    Every container[Pn] is a plain list by default (STORAGE_LIST). When the
+    PList is created with STORAGE_INDEXED, every container[Pn] is an
+    IndexedBucket, which keeps the same ordering but it checks and removes
+    entries without scanning the list. When the PList is created with
+    STORAGE_DEQUE, every container[Pn] is a DequeBucket, where entries are
+    added at the front in constant time. Both of them add entries at the front
+    and at the back without moving any other entry.
+
+    :type priorityValues: PValuesList
+    :ivar priorityValues:
+        PValuesList with the list with all possible priorites and the default
+        one.
+
+    :type storage: str
+    :ivar storage:
+        Storage used for every priority in the container.
+
+    :type levels: list
+    :ivar levels:
+        Sorted list with the position, in the list of priorities, for every
+        priority which list is not empty. It is used to traverse only those
+        priorities with entries.
+
+    :type unique: str
+    :ivar unique:
+        Unique entries mode, None when the same entry can be added many
+        times.
+
+    :type counts: dict
+    :ivar counts:
+        Dictionary, where every key is a priority which list is not empty,
+        and which value is the number of entries in the list.
+
+    :type total: int
+    :ivar total:
+        Number of entries in all lists.
+
+    :type version: int
+    :ivar version:
+        Number of changes done in the container. It increases every time an
+        entry is added or removed, or a list is cleaned.
+
+    :type snapshots: dict
+    :ivar snapshots:
+        Dictionary, where every key is a priority, and which value is an
+        immutable copy (tuple) of the list for such priority. A snapshot is
+        created the first time it is requested after the list has changed,
+        and it is shared until the list changes again, so traversing entries
+        with snapshots is safe even if the list is changed meanwhile.
+
+    :type readers: dict
+    :ivar readers:
+        Dictionary, where every key is the id for a list being traversed, and
+        which value is the number of generators traversing it. A list being
+        traversed is never changed, it is copied, and the copy replaces it in
+        the container, before any change is done.
+
+    :type container: dict
+    :ivar container:
+        Dictionary, where every key is a value in priorities, and which
+        value is the list of object for such priority. The list for a
+        priority is only created when the first entry is added to it, and it
+        is released when the priority is cleaned.
+
+    :type DEFAULT_STORAGE: str
+    :cvar DEFAULT_STORAGE:
+        Storage used when no storage is provided in the constructor.
+
+    Attributes are kept in slots, but instances still have a dictionary,
+    which is only allocated when any other attribute is set, so methods can
+    be replaced in the instance, as mockerator does.
+
+    >>> pl = PList((1, 2, 3), 2)
+    >>> pl.isEmpty = lambda: False
+    >>> pl.isEmpty()
+    False
+    """
+
+    __slots__ = ('priorityValues', 'name', 'storage', 'unique', 'levels', 'counts',
+                 'total', 'version', 'snapshots', 'readers', 'container', '__dict__', '__weakref__')
+
+    logger = loggerator.getLoggerator('plist')
+
+    DEFAULT_STORAGE = STORAGE_LIST
+
+    # =========================================================================
+    def __init__(self, priorities, defaultPriority, name=None, storage=None, unique=None):
+        """PList class constructor.
+
+        Create a PList instance with a the given list of priorities, and where
+        the default priority when an entry is added is de default value
+        provided in the constructor.
+
+        A list will be created per entry in the list of priorities.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl.logger # doctest: +ELLIPSIS
+        <loggerator.Loggerator object at 0x...>
+
+        >>> pl.priorityValues # doctest: +ELLIPSIS
+        <__main__.PValuesList object at 0x...>
+
+        >>> pl.name
+        'custom list'
+
+        >>> pl.storage
+        'list'
+
+        >>> pl.levels
+        []
+
+        >>> pl.version
+        0
+
+        >>> pl.snapshots
+        {}
+
+        >>> pl.readers
+        {}
+
+        >>> pl.container
+        {}
+
+        >>> pl = PList((1, 2, 3), 2, "indexed list", STORAGE_INDEXED)
+
+        >>> pl.container
+        {}
+
+        >>> pl = PList((1, 2, 3), 2, "deque list", STORAGE_DEQUE)
+
+        >>> pl.container
+        {}
+
+        >>> pl = PList(None, 2)
+        Traceback (most recent call last):
+        ...
+        PriorityListException: Not valid priority list : priorities: None
+
+        >>> pl = PList(2, 2)
+        Traceback (most recent call last):
+        ...
+        PriorityListException: Not valid priority list : priorities: 2
+
+        >>> pl = PList((1, 2, 3), 4)
+        Traceback (most recent call last):
+        ...
+        DefaultPriorityException: Default priority not valid : default: 4 not in (1, 2, 3)
+
+        >>> pl = PList((1, 2, 3), 2, storage='tree')
+        Traceback (most recent call last):
+        ...
+        InvalidStorageException: Storage is not supported : storage: tree
+
+        Unique entries use STORAGE_INDEXED, the index is used to look for
+        entries already in the list.
+
+        >>> pl = PList((1, 2, 3), 2, unique=UNIQUE_REJECT)
+        >>> pl.storage, pl.unique
+        ('indexed', 'reject')
+
+        >>> pl = PList((1, 2, 3), 2, storage=STORAGE_LIST, unique=UNIQUE_MOVE)
+        Traceback (most recent call last):
+        ...
+        InvalidStorageException: Storage is not supported : storage: list does not support unique entries
+
+        >>> pl = PList((1, 2, 3), 2, unique='always')
+        Traceback (most recent call last):
+        ...
+        PriorityListException: Not valid priority list : unique: always
+
+        :type priorities: list
+        :param priorities:
+            It is the list of priorities to be used in the priority list.
+
+        :type defaultPriority: object
+        :param defaultPriority:
+            It is the default priority that will be used for any other method
+            when no priority value is provided.
+            This value should be present in the list of priorities provided in
+            this constructor.
+
+        :type name: str
+        :param name: name for the list
+
+        :type storage: str
+        :param storage:
+            Storage to be used for every priority, it should be one of the
+            values in STORAGES. If no value is provided, DEFAULT_STORAGE is
+            used.
+
+        :type unique: str
+        :param unique:
+            Unique entries mode, it should be one of the values in UNIQUES.
+            If no value is provided, the same entry can be added many times.
+
+        :raise PriorityListException:
+            No list of priorities is provided, or unique mode is not valid.
+
+        :raise DefaultPriorityException:
+            Default priority does not belong to list of priorities provided.
+
+        :raise InvalidStorageException:
+            Storage is not supported.
+        """
+        if not priorities or not isinstance(priorities, tuple):
+            raise PriorityListException('priorities: %s' % (priorities, ))
+
+        if not defaultPriority in priorities:
+            raise DefaultPriorityException('default: %s not in %s' % (defaultPriority, priorities))
+
+        if unique is not None and not unique in UNIQUES:
+            raise PriorityListException('unique: %s' % (unique, ))
+
+        if storage is None:
+            storage = STORAGE_INDEXED if unique else self.DEFAULT_STORAGE
+        if not storage in STORAGES:
+            raise InvalidStorageException('storage: %s' % (storage, ))
+        if unique and storage != STORAGE_INDEXED:
+            raise InvalidStorageException('storage: %s does not support unique entries' % (storage, ))
+
+        self.priorityValues = getPValuesList(priorities, defaultPriority)
+        self.name           = name
+        self.storage        = storage
+        self.unique         = unique
+        self.levels         = []
+        self.counts         = {}
+        self.total          = 0
+        self.version        = 0
+        self.snapshots      = {}
+        self.readers        = {}
+        self.container      = {}
+
+    # =========================================================================
+    def _newBucket(self):
+        """Create a new empty bucket for a priority.
+
+        It creates the container for a single priority, using the storage
+        selected for the priority list.
+
+        >>> PList((1, 2, 3), 2)._newBucket()
+        []
+
+        >>> PList((1, 2, 3), 2, storage=STORAGE_INDEXED)._newBucket()
+        IndexedBucket([])
+
+        >>> PList((1, 2, 3), 2, storage=STORAGE_DEQUE)._newBucket()
+        DequeBucket([])
+
+        :rtype: list
+        :return:
+            Empty list, IndexedBucket or DequeBucket, based on the storage.
+        """
+        if self.storage == STORAGE_INDEXED:
+            return IndexedBucket(self._getKeyFromEntry)
+        if self.storage == STORAGE_DEQUE:
+            return DequeBucket()
+        return []
+
+    # =========================================================================
+    def _getBucket(self, priority):
+        """Return the bucket for the given priority, creating it if needed.
+
+        Buckets are only created when the first entry is added to a priority,
+        so empty priorities do not use any memory. The bucket returned is the
+        one to be changed, so if the bucket is being traversed, it is copied
+        and the copy replaces it in the container.
+
+        >>> pl = PList((1, 2, 3), 2)
+        >>> pl.container
+        {}
+
+        >>> pl._getBucket(1)
+        []
+
+        >>> pl.container
+        {1: []}
+
+        >>> bucket = pl._getBucket(1)
+        >>> pl.readers[id(bucket)] = 1
+        >>> pl._getBucket(1) is bucket
+        False
+
+        :type priority: object
+        :param priority: Valid priority.
+
+        :rtype: list
+        :return: Bucket for the given priority.
+        """
+        bucket = self.container.get(priority)
+        if bucket is None:
+            bucket = self.container[priority] = self._newBucket()
+        elif self.readers and id(bucket) in self.readers:
+            bucket = self.container[priority] = self._copyBucket(bucket)
+        return bucket
+
+    # =========================================================================
+    def _copyBucket(self, bucket):
+        """Return a copy of the given bucket.
+
+        >>> pl = PList((1, 2, 3), 2, storage=STORAGE_INDEXED)
+        >>> pl._copyBucket(IndexedBucket(entries=('one', 'two')))
+        IndexedBucket(['one', 'two'])
+
+        :type bucket: list
+        :param bucket: Bucket for a priority.
+
+        :rtype: list
+        :return: New bucket, using the same storage, with the same entries.
+        """
+        copy = self._newBucket()
+        copy.extend(bucket)
+        return copy
+
+    # =========================================================================
+    def _getBucketAsList(self, bucket):
+        """Return the given bucket as a list.
+
+        Plain lists are returned as they are, any other bucket is converted
+        to a new list.
+
+        >>> pl = PList((1, 2, 3), 2)
+
+        >>> pl._getBucketAsList(['one'])
+        ['one']
+
+        >>> pl._getBucketAsList(IndexedBucket(entries=('one', )))
+        ['one']
+
+        >>> pl._getBucketAsList(DequeBucket(('one', )))
+        ['one']
+
+        :type bucket: list
+        :param bucket: Bucket for a priority.
+
+        :rtype: list
+        :return: List with all entries in the bucket.
+        """
+        return bucket if isinstance(bucket, list) else list(bucket)
+
+    # =========================================================================
+    def _validateEntry(self, entry):
+        """Validate entry before inserting it.
+
+        It validates entry is valid for the priority list. This method should
+        be overriden by any specialized derived class.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl._validateEntry(0)
+
+        >>> pl._validateEntry(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        :type entry: object
+        :param entry:
+            Object to be validated before being inserted.
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+        """
+        if entry is None:
+            raise InvalidEntryException('entry: %s' % entry)
+
+    # =========================================================================
+    def _getEntryFromContainer(self, entry, priority):
+        """Get entry from the container.
+
+        This method returns the entry from the container for the given priority
+        that is related with the given entry parameter.
+
+        It can be overriden in derived classes in order to provide the
+        real entry to be used, because the entry parameter could not be
+        the same as the entry in the container for derived classes.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: ['one', ], 2: [], 3: []}
+
+        >>> pl._getEntryFromContainer('one', 1)
+        'one'
+
+        >>> pl._getEntryFromContainer('two', 1)
+
+        >>> pl._getEntryFromContainer('one', 2)
+
+        :type entry: object
+        :param entry:
+            Object to be check is present in the container.
+
+        :type priority: int
+        :param priority:
+            Priority of the container where entry should be checked if present.
+
+        :rtype: object
+        :return:
+            Entry to be removed or None if not found.
+        """
+        bucket = self.container.get(priority)
+        return entry if bucket and entry in bucket else None
+
+    # =========================================================================
+    def _entryRemoved(self, entry, priority):
+        """Notify that the given entry was removed from the list.
+
+        It is called for every entry removed from the list for a priority,
+        before _containerChanged is called for the priority. Lists cleaned
+        as a whole only call _containerChanged. Derived classes that keep any
+        information per entry should override this method in order to drop
+        it.
+
+        :type entry: object
+        :param entry: Entry removed, as it was stored in the container.
+
+        :type priority: object
+        :param priority: Priority for the list the entry was removed from.
+        """
+        pass
+
+    # =========================================================================
+    def _containerChanged(self, priority, delta=None):
+        """Notify that the list for the given priority has changed.
+
+        It is called every time an entry is added or removed, or the list is
+        cleaned. It increases the version, it drops the snapshot for the
+        priority and it keeps counts and levels updated with the priorities
+        which list is not empty. Levels are only changed when the list gets
+        empty or stops being empty. Derived classes that cache any other
+        information from the container should override this method in order
+        to invalidate it.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl._getBucket(3).append('one')
+
+        >>> pl._containerChanged(3)
+        >>> pl.levels
+        [2]
+
+        >>> pl._getBucket(3).append('two')
+        >>> pl._containerChanged(3, 1)
+        >>> pl.counts, pl.levels
+        ({3: 2}, [2])
+
+        >>> del pl.container[3]
+        >>> pl._containerChanged(3)
+        >>> pl.levels
+        []
+
+        >>> pl.version
+        3
+
+        :type priority: object
+        :param priority: Priority for the list that changed.
+
+        :type delta: int
+        :param delta:
+            Number of entries added, negative for entries removed. If no
+            value is provided, entries in the list are counted.
+        """
+        self.version += 1
+        if self.snapshots:
+            self.snapshots.pop(priority, None)
+        counts = self.counts
+        if delta is None:
+            delta = len(self.container.get(priority, ())) - counts.get(priority, 0)
+        if not delta:
+            return
+        self.total += delta
+        count = counts.get(priority, 0) + delta
+        if count == delta:
+            counts[priority] = count
+            bisect.insort(self.levels, self.priorityValues.ranks[priority])
+        elif count:
+            counts[priority] = count
+        else:
+            del counts[priority]
+            del self.levels[bisect.bisect_left(self.levels, self.priorityValues.ranks[priority])]
+
+    # =========================================================================
+    def _updateLevels(self):
+        """Build levels and counts from scratch.
+
+        It is used when the list of priorities changes, because the position
+        for every priority could change, or when the container is replaced.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: [], 2: ['one'], 3: ['two', 'three']}
+
+        >>> pl._updateLevels()
+        >>> pl.levels
+        [1, 2]
+
+        >>> pl.counts, pl.total
+        ({2: 1, 3: 2}, 3)
+        """
+        ranks = self.priorityValues.ranks
+        self.counts = dict((priority, len(bucket)) for priority, bucket in self.container.iteritems() if bucket)
+        self.total  = sum(self.counts.itervalues())
+        self.levels = sorted(ranks[priority] for priority in self.counts)
+
+    # =========================================================================
+    def snapshot(self, priority=None):
+        """Return an immutable copy of the list for the given priority.
+
+        The copy is done only the first time the snapshot is requested after
+        the list has changed. Any change done in the list after the snapshot
+        was returned creates a new version of the list, but it does not change
+        the snapshot, so it can be traversed while the list is changed.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addAtBack('one')
+        'one'
+        >>> pl.addAtBack('two')
+        'two'
+
+        >>> view = pl.snapshot()
+        >>> view
+        ('one', 'two')
+
+        >>> pl.snapshot() is view
+        True
+
+        >>> for entry in view:
+        ...     pl.remove(entry)
+        'one'
+        'two'
+
+        >>> pl.snapshot()
+        ()
+
+        >>> pl.snapshot(0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        :type priority: object
+        :param priority:
+            Priority of the list to be returned, If no value is given for the
+            priority, the default priority will be used.
+
+        :rtype: tuple
+        :return:
+            Tuple with all entries for the given priority.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+        """
+        priority = self.priorityValues.getDefault(priority)
+        snapshot = self.snapshots.get(priority)
+        if snapshot is None:
+            snapshot = self.snapshots[priority] = tuple(self.container.get(priority, ()))
+        return snapshot
+
+    # =========================================================================
+    def getLevels(self):
+        """Return priorities which list is not empty.
+
+        Priorities are returned in the order of the priority list.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addAtBack('one', 3)
+        'one'
+        >>> pl.addAtBack('two', 1)
+        'two'
+
+        >>> pl.getLevels()
+        [1, 3]
+
+        :rtype: list
+        :return: List with all priorities with entries.
+        """
+        priorities = self.priorityValues.getList()
+        return [priorities[rank] for rank in self.levels]
+
+    # =========================================================================
+    def addPriority(self, priority):
+        """Add a new priority to the priority list.
+
+        The new priority is placed in ascending order in the list of
+        priorities, so it can only be added to priority lists which
+        priorities are sorted in ascending order. That order is checked once
+        for every list of priorities, and lists created here are known to be
+        sorted, so only the position for the new priority is looked for.
+
+        >>> pl = PList((10, 20, 30), 20, "custom list")
+        >>> pl.addAtBack('one', 30)
+        'one'
+
+        >>> pl.addPriority(15)
+        15
+
+        >>> pl.priorityValues.getList()
+        (10, 15, 20, 30)
+
+        >>> pl.addAtBack('two', 15)
+        'two'
+
+        >>> pl.getAllLists()
+        [[], ['two'], [], ['one']]
+
+        >>> pl.getLevels()
+        [15, 30]
+
+        >>> pl.addPriority(15)
+        Traceback (most recent call last):
+        ...
+        PriorityListException: Not valid priority list : priority: 15 already in (10, 15, 20, 30)
+
+        >>> PList((3, 2, 1), 2).addPriority(5)
+        Traceback (most recent call last):
+        ...
+        PriorityListException: Not valid priority list : priority: 5 can not be placed in (3, 2, 1), not sorted in ascending order
+
+        :type priority: object
+        :param priority: Priority to be added.
+
+        :rtype: object
+        :return: Priority added.
+
+        :raise PriorityListException:
+            Priority is already in the list of priorities, or the list of
+            priorities is not sorted in ascending order.
+        """
+        priorities = self.priorityValues.getList()
+        if self.priorityValues.isValid(priority):
+            raise PriorityListException('priority: %s already in %s' % (priority, priorities))
+        if not self.priorityValues.isAscending():
+            raise PriorityListException('priority: %s can not be placed in %s, not sorted in ascending order' % (priority, priorities))
+        rank = bisect.bisect_left(priorities, priority)
+        self.priorityValues = getPValuesList(priorities[:rank] + (priority, ) + priorities[rank:],
+                                             self.priorityValues.getDefault())
+        self.priorityValues.ascending = True
+        self.levels = [level + 1 if level >= rank else level for level in self.levels]
+        if __debug__:
+            self.logger.debug('%s priority %s added' % (info.FUNC(), priority))
+        return priority
+
+    # =========================================================================
+    def removePriority(self, priority):
+        """Remove a priority from the priority list.
+
+        All entries for the priority are removed too.
+
+        >>> pl = PList((10, 20, 30), 20, "custom list")
+        >>> pl.addAtBack('one', 10)
+        'one'
+        >>> pl.addAtBack('two', 30)
+        'two'
+
+        >>> pl.removePriority(10)
+        ['one']
+
+        >>> pl.priorityValues.getList()
+        (20, 30)
+
+        >>> pl.getLevels()
+        [30]
+
+        >>> pl.removePriority(20)
+        Traceback (most recent call last):
+        ...
+        DefaultPriorityException: Default priority not valid : default: 20 can not be removed
+
+        >>> pl.removePriority(10)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 10 not in (20, 30)
+
+        :type priority: object
+        :param priority: Priority to be removed.
+
+        :rtype: list
+        :return: List with all entries the priority had.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+
+        :raise DefaultPriorityException:
+            Priority is the default priority.
+        """
+        priority = self.priorityValues.getDefault(priority)
+        if priority == self.priorityValues.getDefault():
+            raise DefaultPriorityException('default: %s can not be removed' % (priority, ))
+        entries = self.getListForPriority(priority)[:]
+        self.cleanList(priority)
+        priorities = self.priorityValues.getList()
+        rank       = self.priorityValues.ranks[priority]
+        ascending  = self.priorityValues.ascending
+        self.priorityValues = getPValuesList(priorities[:rank] + priorities[rank + 1:],
+                                             self.priorityValues.getDefault())
+        if ascending:
+            self.priorityValues.ascending = True
+        self.levels = [level - 1 if level > rank else level for level in self.levels]
+        if __debug__:
+            self.logger.debug('%s priority %s removed' % (info.FUNC(), priority))
+        return entries
+
+    # =========================================================================
+    def _getKeyFromEntry(self, entry):
+        """Return the key that identifies the given entry.
+
+        This key is used by the IndexedBucket storage in order to index
+        entries. In PList the entry is its own key.
+
+        This method should be redefined in derived list
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl._getKeyFromEntry('one')
+        'one'
+
+        :type entry: object
+        :param entry: Entry stored in the PList.
+
+        :rtype: object
+        :return: Key for the entry.
+        """
+        return entry
+
+    # =========================================================================
+    def _getValueFromEntry(self, entry):
+        """ Return value to return when an entry is found.
+
+        This method is used to return the value inside any entry stored in the
+        Plist.
+
+        This method should be redefined in derived list
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl._getValueFromEntry('one')
+        'one'
+
+        :type entry: dict
+        :param entry: Entry found in the PListFunction.
+
+        :rtype: object
+        :return: Object stored in the entry in the PList.
+        """
+        return entry
+
+    # =========================================================================
+    def _admitEntries(self, priority, entries):
+        """Check the given entries can be added in unique entries mode.
+
+        Entries are looked for in the bucket index, so no list is traversed.
+        With UNIQUE_REJECT, it raises an exception if any entry is already in
+        the list for the priority, or if it is given twice, and nothing is
+        changed. With UNIQUE_MOVE, entries already in the list are removed,
+        so they are added again at the new position, and only the last one
+        of entries given twice is kept.
+
+        >>> pl = PList((1, 2, 3), 2, unique=UNIQUE_MOVE)
+        >>> pl.addManyAtBack(('one', 'two', 'three'))
+        ['one', 'two', 'three']
+
+        >>> pl._admitEntries(2, ['two', 'four', 'four'])
+        ['two', 'four']
+        >>> pl.getListForPriority()
+        ['one', 'three']
+
+        :type priority: object
+        :param priority: Valid priority where entries are added.
+
+        :type entries: list
+        :param entries: Entries to add.
+
+        :rtype: list
+        :return: Entries to add.
+
+        :raise DuplicateEntryException:
+            Entry already in the list, only for UNIQUE_REJECT.
+        """
+        bucket = self.container.get(priority)
+        keys   = [self._getKeyFromEntry(entry) for entry in entries]
+        if self.unique == UNIQUE_REJECT:
+            seen = set()
+            for index, key in enumerate(keys):
+                if key in seen or (bucket is not None and bucket.find(key) is not None):
+                    raise DuplicateEntryException('entry: %s in priority: %s' % (entries[index], priority))
+                seen.add(key)
+            return entries
+        last = dict((key, index) for index, key in enumerate(keys))
+        if bucket is not None:
+            for key in last:
+                existing = bucket.find(key)
+                if existing is not None:
+                    self._getBucket(priority).remove(existing)
+                    self._entryRemoved(existing, priority)
+        if len(last) == len(entries):
+            return entries
+        return [entry for index, entry in enumerate(entries) if last[keys[index]] == index]
+
+    # =========================================================================
+    def addAtFront(self, entry, priority=None):
+        """Add a new entry at the top/front of the list for the given priority.
+
+        It adds the given entry in the list for the given priority, and it
+        adds at the start/front of the list.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl.addAtFront('one', 3)
+        'one'
+
+        >>> pl.container
+        {3: ['one']}
+
+        >>> pl.addAtFront('two', 3)
+        'two'
+
+        >>> pl.container
+        {3: ['two', 'one']}
+
+        >>> pl.addAtFront('three')
+        'three'
+
+        >>> pl.container
+        {2: ['three'], 3: ['two', 'one']}
+
+        >>> pl.addAtFront('four')
+        'four'
+
+        >>> pl.container
+        {2: ['four', 'three'], 3: ['two', 'one']}
+
+        >>> pl = PList((1, 2, 3), 2, "deque list", STORAGE_DEQUE)
+        >>> pl.addAtFront('one')
+        'one'
+        >>> pl.addAtFront('two')
+        'two'
+        >>> pl.addAtBack('three')
+        'three'
+
+        >>> pl.getListForPriority()
+        ['two', 'one', 'three']
+
+        >>> pl.getAllLists()
+        [[], ['two', 'one', 'three'], []]
+
+        >>> pl.addAtFront(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        >>> pl.addAtFront('five', 0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        :type entry: object
+        :param entry:
+            Object to be added at the front of the list.
+
+        :type priority: object
+        :param priority:
+            Priority where the object should be added. If no value is
+            provided, default priority will be used.
+
+        :rtype: object
+        :return:
+            Object added if it was inserted properly.
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+
+        :raise DuplicateEntryException:
+            Entry already in the list, only for UNIQUE_REJECT.
+        """
+        self._validateEntry(entry)
+        priority = self.priorityValues.getDefault(priority)
+        if self.unique:
+            self._admitEntries(priority, [entry])
+        self._getBucket(priority).insert(0, entry)
+        self._containerChanged(priority)
+        if __debug__:
+            self.logger.debug('%s entry %s added front priority list %s' %
+                              (info.FUNC(), entry, priority))
+        return entry
+
+    # =========================================================================
+    def addAtBack(self, entry, priority=None):
+        """Add a new entry at the back/end of the list for the given priority.
+
+        It adds the given entry in the list for the given priority , and it
+        adds at the back/end of the list.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl.addAtBack('one', 3)
+        'one'
+
+        >>> pl.container
+        {3: ['one']}
+
+        >>> pl.addAtBack('two', 3)
+        'two'
+
+        >>> pl.container
+        {3: ['one', 'two']}
+
+        >>> pl.addAtBack('three')
+        'three'
+
+        >>> pl.container
+        {2: ['three'], 3: ['one', 'two']}
+
+        >>> pl.addAtBack('four')
+        'four'
+
+        >>> pl.container
+        {2: ['three', 'four'], 3: ['one', 'two']}
+
+        >>> pl.addAtBack(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        >>> pl.addAtBack('five', 0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        In unique entries mode, an entry already in the list is rejected or
+        moved to the back.
+
+        >>> pl = PList((1, 2, 3), 2, "unique list", unique=UNIQUE_REJECT)
+        >>> pl.addManyAtBack(('one', 'two'))
+        ['one', 'two']
+        >>> pl.addAtBack('one')
+        Traceback (most recent call last):
+        ...
+        DuplicateEntryException: Entry already in the priority list : entry: one in priority: 2
+
+        >>> pl = PList((1, 2, 3), 2, "unique list", unique=UNIQUE_MOVE)
+        >>> pl.addManyAtBack(('one', 'two'))
+        ['one', 'two']
+        >>> pl.addAtBack('one')
+        'one'
+        >>> pl.getListForPriority()
+        ['two', 'one']
+
+        :type entry: object
+        :param entry:
+            Object to be added at the back of the list.
+
+        :type priority: object
+        :param priority:
+            Priority where the object should be added. If no value is
+            provided, default priority will be used.
+
+        :rtype: object
+        :return:
+            Object added if it was inserted properly.
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+
+        :raise DuplicateEntryException:
+            Entry already in the list, only for UNIQUE_REJECT.
+        """
+        self._validateEntry(entry)
+        priority = self.priorityValues.getDefault(priority)
+        if self.unique:
+            self._admitEntries(priority, [entry])
+        self._getBucket(priority).append(entry)
+        self._containerChanged(priority)
+        if __debug__:
+            self.logger.debug('%s entry %s added back priority list %s' %
+                              (info.FUNC(), entry, priority))
+        return entry
+
+    # =========================================================================
+    def addAtFrontForAll(self, entry):
+        """Add a new entry at the front for every priority.
+
+        It adds the given entry for every priority, and it adds at the front
+        for every list
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl.addAtFrontForAll('one')
+        ['one', 'one', 'one']
+
+        >>> pl.container
+        {1: ['one'], 2: ['one'], 3: ['one']}
+
+        >>> pl.addAtFrontForAll('two')
+        ['two', 'two', 'two']
+
+        >>> pl.container
+        {1: ['two', 'one'], 2: ['two', 'one'], 3: ['two', 'one']}
+
+        >>> pl.addAtFrontForAll(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        :type entry: object
+        :param entry:
+            Object to be added at the front of the list.
+
+        :rtype: list
+        :return:
+            List with all objects added if they were inserted properly.
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+        """
+        self._validateEntry(entry)
+        if __debug__:
+            self.logger.debug('%s entry %s added front' %
+                              (info.FUNC(), entry))
+        return map(lambda x:
+                   self.addAtFront(entry, x), self.priorityValues.getList())
+
+    # =========================================================================
+    def addAtBackForAll(self, entry):
+        """Add a new entry at the back for every priority.
+
+        It adds the given entry for every priority, and it adds at the back for
+        every list
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl.addAtBackForAll('one')
+        ['one', 'one', 'one']
+
+        >>> pl.container
+        {1: ['one'], 2: ['one'], 3: ['one']}
+
+        >>> pl.addAtBackForAll('two')
+        ['two', 'two', 'two']
+
+        >>> pl.container
+        {1: ['one', 'two'], 2: ['one', 'two'], 3: ['one', 'two']}
+
+        >>> pl.addAtBackForAll(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        :type entry: object
+        :param entry:
+            Object to be added at the back of the list.
+
+        :rtype: list
+        :return:
+            List with all objects added if they were inserted properly.
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+        """
+        if __debug__:
+            self.logger.debug('%s entry %s added back' %
+                              (info.FUNC(), entry))
+        self._validateEntry(entry)
+        return map(lambda p:
+                   self.addAtBack(entry, p), self.priorityValues.getList())
+
+    # =========================================================================
+    def _validateEntries(self, entries):
+        """Validate all entries in a batch before inserting or removing them.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl._validateEntries(('one', 'two'))
+        ['one', 'two']
+
+        >>> pl._validateEntries(('one', None))
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        :type entries: list
+        :param entries: Iterable with all entries to be validated.
+
+        :rtype: list
+        :return: List with all entries.
+
+        :raise InvalidEntryException:
+            Any entry is None or not valid.
+        """
+        entries = list(entries)
+        for entry in entries:
+            self._validateEntry(entry)
+        return entries
+
+    # =========================================================================
+    def addManyAtFront(self, entries, priority=None):
+        """Add many entries at the top/front of the list for the given priority.
+
+        It is the same as calling addAtFront for every entry, in order, but
+        the priority is resolved once, all entries are validated before any of
+        them is inserted, and they are spliced in the list in one operation.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addAtFront('one')
+        'one'
+
+        >>> pl.addManyAtFront(('two', 'three'))
+        ['two', 'three']
+
+        >>> pl.container
+        {2: ['three', 'two', 'one']}
+
+        >>> pl.addManyAtFront(('four', None), 3)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        >>> pl.container
+        {2: ['three', 'two', 'one']}
+
+        >>> pl.addManyAtFront(('five', ), 0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        >>> pl = PList((1, 2, 3), 2, "indexed list", STORAGE_INDEXED)
+        >>> pl.addManyAtFront(('one', 'two'))
+        ['one', 'two']
+        >>> pl.getListForPriority()
+        ['two', 'one']
+
+        :type entries: list
+        :param entries:
+            Iterable with all objects to be added at the front of the list.
+
+        :type priority: object
+        :param priority:
+            Priority where objects should be added. If no value is
+            provided, default priority will be used.
+
+        :rtype: list
+        :return:
+            List with all objects added.
+
+        :raise InvalidEntryException:
+            Any entry is None or not valid.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+
+        :raise DuplicateEntryException:
+            Entry already in the list, only for UNIQUE_REJECT.
+        """
+        entries  = self._validateEntries(entries)
+        priority = self.priorityValues.getDefault(priority)
+        if self.unique:
+            entries = self._admitEntries(priority, entries)
+        bucket   = self._getBucket(priority)
+        if isinstance(bucket, list):
+            bucket[0:0] = entries[::-1]
+        else:
+            bucket.extendleft(entries)
+        self._containerChanged(priority)
+        if __debug__:
+            self.logger.debug('%s %d entries added front priority list %s' %
+                              (info.FUNC(), len(entries), priority))
+        return entries
+
+    # =========================================================================
+    def addManyAtBack(self, entries, priority=None):
+        """Add many entries at the back/end of the list for the given priority.
+
+        It is the same as calling addAtBack for every entry, in order, but the
+        priority is resolved once, all entries are validated before any of
+        them is inserted, and they are spliced in the list in one operation.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addAtBack('one')
+        'one'
+
+        >>> pl.addManyAtBack(('two', 'three'))
+        ['two', 'three']
+
+        >>> pl.container
+        {2: ['one', 'two', 'three']}
+
+        >>> pl.addManyAtBack(('four', None), 3)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        >>> pl.container
+        {2: ['one', 'two', 'three']}
+
+        >>> pl.addManyAtBack(('five', ), 0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        :type entries: list
+        :param entries:
+            Iterable with all objects to be added at the back of the list.
+
+        :type priority: object
+        :param priority:
+            Priority where objects should be added. If no value is
+            provided, default priority will be used.
+
+        :rtype: list
+        :return:
+            List with all objects added.
+
+        :raise InvalidEntryException:
+            Any entry is None or not valid.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+
+        :raise DuplicateEntryException:
+            Entry already in the list, only for UNIQUE_REJECT.
+        """
+        entries  = self._validateEntries(entries)
+        priority = self.priorityValues.getDefault(priority)
+        if self.unique:
+            entries = self._admitEntries(priority, entries)
+        self._getBucket(priority).extend(entries)
+        self._containerChanged(priority)
+        if __debug__:
+            self.logger.debug('%s %d entries added back priority list %s' %
+                              (info.FUNC(), len(entries), priority))
+        return entries
+
+    # =========================================================================
+    def remove(self, entry, priority=None):
+        """Remove the given entry from the given priority list.
+
+        It removes the given entry from the list for the given priority.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'four'], 3: ['five']}
+
+        >>> pl.remove('one', 1)
+        'one'
+
+        >>> pl.container
+        {1: ['two'], 2: ['three', 'four'], 3: ['five']}
+
+        >>> pl.remove('four')
+        'four'
+
+        >>> pl.container
+        {1: ['two'], 2: ['three'], 3: ['five']}
+
+        >>> pl.remove(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        >>> pl.remove('five', 0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        >>> pl.remove('two')
+
+        >>> pl.container
+        {1: ['two'], 2: ['three'], 3: ['five']}
+
+        >>> pl.remove('two', 3) # entry in other priority
+
+        >>> pl.container
+        {1: ['two'], 2: ['three'], 3: ['five']}
+
+        >>> pl.remove('six') # entry not found in default priority
+
+        >>> pl.container
+        {1: ['two'], 2: ['three'], 3: ['five']}
+
+        >>> pl.remove('six', 1) # entry not foun in given priority
+
+        >>> pl.container
+        {1: ['two'], 2: ['three'], 3: ['five']}
+
+        >>> pl = PList((1, 2, 3), 2, "indexed list", STORAGE_INDEXED)
+        >>> pl.addAtBack('one')
+        'one'
+        >>> pl.addAtBack('two')
+        'two'
+
+        >>> pl.remove('one')
+        'one'
+
+        >>> pl.remove('one')
+
+        >>> pl.getListForPriority()
+        ['two']
+
+        :type entry: object
+        :param entry:
+            Object to be removed from the list.
+
+        :type priority: object
+        :param priority:
+            Priority where the object should be removed. If no value is
+            provided, default priority will be used.
+
+        :rtype: object
+        :return:
+            Object removed if it was found. None if object was not found.
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+        """
+        self._validateEntry(entry)
+        priority = self.priorityValues.getDefault(priority)
+        if __debug__:
+            self.logger.debug('%s entry %s removed priority list %s' %
+                              (info.FUNC(), entry, priority))
+        retvalue = None
+        realEntry = self._getEntryFromContainer(entry, priority)
+        if realEntry is not None:
+            self._getBucket(priority).remove(realEntry)
+            self._entryRemoved(realEntry, priority)
+            self._containerChanged(priority)
+            retvalue = self._getValueFromEntry(realEntry)
+            if __debug__:
+                self.logger.debug('%s real entry %s removed priority list %s' %
+                                  (info.FUNC(), retvalue, priority))
+        return retvalue
+
+    # =========================================================================
+    def removeForAll(self, entry):
+        """Remove the given entry from all priorities.
+
+        It removes the given entry from every priority list.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+
+        >>> pl.removeForAll('one')
+        ['one', 'one', 'one']
+
+        >>> pl.container
+        {1: ['two'], 2: ['three', 'four'], 3: ['five', 'two']}
+
+        >>> pl.removeForAll('two')
+        ['two', None, 'two']
+
+        >>> pl.container
+        {1: [], 2: ['three', 'four'], 3: ['five']}
+
+        >>> pl.removeForAll('four')
+        [None, 'four', None]
+
+        >>> pl.container
+        {1: [], 2: ['three'], 3: ['five']}
+
+        >>> pl.removeForAll(None)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        >>> pl.removeForAll('one')
+        [None, None, None]
+
+        >>> pl.container
+        {1: [], 2: ['three'], 3: ['five']}
+
+        :type entry: object
+        :param entry:
+            Object to be removed from the list.
+
+        :rtype: list
+        :return:
+            List with all objects removed if they were found. If the object
+            was not found for any priority, it returns a None for such
+            priority.
+
+        :raise InvalidEntryException:
+            Entry is None or not valid.
+        """
+        if __debug__:
+            self.logger.debug('%s entry %s removed' %
+                              (info.FUNC(), entry))
+        self._validateEntry(entry)
+        return map(lambda p:
+                   self.remove(entry, p), self.priorityValues.getList())
+
+    # =========================================================================
+    def removeMany(self, entries, priority=None):
+        """Remove many entries from the given priority list.
+
+        It is the same as calling remove for every entry, in order, but the
+        priority is resolved once and all entries are validated before any of
+        them is removed.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('one', 'two', 'three', 'one'))
+        ['one', 'two', 'three', 'one']
+
+        >>> pl.removeMany(('one', 'three', 'four'))
+        ['one', 'three', None]
+
+        >>> pl.container
+        {2: ['two', 'one']}
+
+        >>> pl.removeMany(('two', None))
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : entry: None
+
+        >>> pl.container
+        {2: ['two', 'one']}
+
+        >>> pl.removeMany(('two', ), 0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        The list is not changed when no entry is found.
+
+        >>> version = pl.version
+        >>> pl.removeMany(('three', 'four'))
+        [None, None]
+        >>> pl.version == version
+        True
+
+        Entries that can not be used as dictionary keys are removed one by
+        one.
+
+        >>> pl.addManyAtBack((['five'], ['six']))
+        [['five'], ['six']]
+        >>> pl.removeMany((['six'], ))
+        [['six']]
+        >>> pl.container
+        {2: ['two', 'one', ['five']]}
+
+        :type entries: list
+        :param entries:
+            Iterable with all objects to be removed from the list.
+
+        :type priority: object
+        :param priority:
+            Priority where objects should be removed. If no value is
+            provided, default priority will be used.
+
+        :rtype: list
+        :return:
+            List with the object removed for every entry, or None for entries
+            that were not found.
+
+        :raise InvalidEntryException:
+            Any entry is None or not valid.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+        """
+        entries  = self._validateEntries(entries)
+        priority = self.priorityValues.getDefault(priority)
+        keys     = [self._getKeyFromEntry(entry) for entry in entries]
+        found    = None
+        if self.storage != STORAGE_INDEXED and self.container.get(priority):
+            try:
+                found = self._removeInOnePass(priority, keys)
+            except TypeError:
+                found = None
+        if found is None:
+            found = []
+            for key in keys:
+                realEntry = self._getEntryFromContainer(key, priority)
+                if realEntry is not None:
+                    self._getBucket(priority).remove(realEntry)
+                found.append(realEntry)
+        retvalue = []
+        for realEntry in found:
+            if realEntry is None:
+                retvalue.append(None)
+            else:
+                self._entryRemoved(realEntry, priority)
+                retvalue.append(self._getValueFromEntry(realEntry))
+        if len(retvalue) != retvalue.count(None):
+            self._containerChanged(priority)
+        if __debug__:
+            self.logger.debug('%s %d entries removed priority list %s' %
+                              (info.FUNC(), len(entries), priority))
+        return retvalue
+
+    # =========================================================================
+    def _removeInOnePass(self, priority, keys):
+        """Remove the entries with the given keys traversing the list once.
+
+        For every key, the first entry in the list with that key, not removed
+        for a previous key, is removed, so the list is rebuilt only once
+        instead of being traversed for every key. It is used for storages
+        without index, where removing entries one by one takes quadratic
+        time.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('one', 'two', 'one', 'three'))
+        ['one', 'two', 'one', 'three']
+
+        >>> pl._removeInOnePass(2, ('one', 'four', 'one', 'one'))
+        ['one', None, 'one', None]
+        >>> pl.container
+        {2: ['two', 'three']}
+
+        :type priority: object
+        :param priority: Valid priority which list has entries.
+
+        :type keys: list
+        :param keys: Keys for the entries to remove.
+
+        :rtype: list
+        :return: Entry removed for every key, None if it was not found.
+
+        :raise TypeError:
+            Any key can not be used as a dictionary key. Nothing is removed.
+        """
+        bucket = self.container[priority]
+        getKey = self._getKeyFromEntry
+        wanted = {}
+        for key in keys:
+            wanted[key] = wanted.get(key, 0) + 1
+        matches = {}
+        kept    = []
+        for entry in bucket:
+            key = getKey(entry)
+            if wanted.get(key):
+                wanted[key] -= 1
+                matches.setdefault(key, []).append(entry)
+            else:
+                kept.append(entry)
+        if len(kept) == len(bucket):
+            return [None] * len(keys)
+        bucket = self._getBucket(priority)
+        if isinstance(bucket, list):
+            bucket[:] = kept
+        else:
+            bucket.clear()
+            bucket.extend(kept)
+        for entries in matches.itervalues():
+            entries.reverse()
+        found = []
+        for key in keys:
+            entries = matches.get(key)
+            found.append(entries.pop() if entries else None)
+        return found
+
+    # =========================================================================
+    def _findEntry(self, bucket, key):
+        """Return the entry with the given key in the given bucket.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl._findEntry(['one', 'two'], 'two')
+        'two'
+
+        >>> pl._findEntry(None, 'two')
+
+        :type bucket: list
+        :param bucket: Bucket for a priority, or None if it was not created.
+
+        :type key: object
+        :param key: Key for the entry to look for.
+
+        :rtype: object
+        :return: Entry found or None if not found.
+        """
+        if bucket is None:
+            return None
+        if self.storage == STORAGE_INDEXED:
+            return bucket.find(key)
+        getKey = self._getKeyFromEntry
+        for entry in bucket:
+            if getKey(entry) == key:
+                return entry
+        return None
+
+    # =========================================================================
+    def addAtFrontUnchecked(self, entry, priority):
+        """Add a new entry at the front of the list for a trusted caller.
+
+        It works as addAtFront, but the entry is neither validated nor
+        normalized, the priority has to be a valid one and nothing is logged.
+        It is meant for internal callers that have already validated their
+        input. For PListFunction, the entry must contain the 'method', 'args'
+        as a tuple and 'kwargs' keys.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addAtFrontUnchecked('one', 2)
+        'one'
+        >>> pl.addAtFrontUnchecked('two', 2)
+        'two'
+        >>> pl.getListForPriority()
+        ['two', 'one']
+
+        :type entry: object
+        :param entry: Valid entry to be added at the front of the list.
+
+        :type priority: object
+        :param priority: Valid priority where the entry should be added.
+
+        :rtype: object
+        :return: Object added.
+
+        :raise DuplicateEntryException:
+            Entry already in the list, only for UNIQUE_REJECT.
+        """
+        if self.unique:
+            self._admitEntries(priority, [entry])
+        self._getBucket(priority).insert(0, entry)
+        self._containerChanged(priority, None if self.unique == UNIQUE_MOVE else 1)
+        return entry
+
+    # =========================================================================
+    def addAtBackUnchecked(self, entry, priority):
+        """Add a new entry at the back of the list for a trusted caller.
+
+        It works as addAtBack, but the entry is neither validated nor
+        normalized, the priority has to be a valid one and nothing is logged.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addAtBackUnchecked('one', 2)
+        'one'
+        >>> pl.addAtBackUnchecked('two', 2)
+        'two'
+        >>> pl.getListForPriority()
+        ['one', 'two']
+
+        :type entry: object
+        :param entry: Valid entry to be added at the back of the list.
+
+        :type priority: object
+        :param priority: Valid priority where the entry should be added.
+
+        :rtype: object
+        :return: Object added.
+
+        :raise DuplicateEntryException:
+            Entry already in the list, only for UNIQUE_REJECT.
+        """
+        if self.unique:
+            self._admitEntries(priority, [entry])
+        self._getBucket(priority).append(entry)
+        self._containerChanged(priority, None if self.unique == UNIQUE_MOVE else 1)
+        return entry
+
+    # =========================================================================
+    def removeUnchecked(self, entry, priority):
+        """Remove the given entry from the list for a trusted caller.
+
+        It works as remove, but the entry is not validated, the priority has
+        to be a valid one and nothing is logged.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('one', 'two'))
+        ['one', 'two']
+
+        >>> pl.removeUnchecked('one', 2)
+        'one'
+        >>> pl.removeUnchecked('one', 2)
+        >>> pl.removeUnchecked('one', 3)
+        >>> pl.getListForPriority()
+        ['two']
+
+        :type entry: object
+        :param entry: Valid entry to be removed.
+
+        :type priority: object
+        :param priority: Valid priority where the entry should be removed.
+
+        :rtype: object
+        :return: Value for the entry removed or None if not found.
+        """
+        bucket = self.container.get(priority)
+        realEntry = self._findEntry(bucket, self._getKeyFromEntry(entry))
+        if realEntry is None:
+            return None
+        self._getBucket(priority).remove(realEntry)
+        self._entryRemoved(realEntry, priority)
+        self._containerChanged(priority, -1)
+        return self._getValueFromEntry(realEntry)
+
+    # =========================================================================
+    def getListForPriority(self, priority=None):
+        """Return the list for the given priority.
+
+        It returns the list with all entries for the given priority.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+
+        >>> pl.getListForPriority()
+        ['three', 'one', 'four']
+
+        >>> pl.getListForPriority(1)
+        ['one', 'two']
+
+        >>> pl.getListForPriority(0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        :type priority: object
+        :param priority:
+            Priority of the list to be returned, If no value is given for the
+            priority, the default priority will be used.
+
+        :rtype: list
+        :return:
+            List with all entries for the given priority.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+        """
+        priority = self.priorityValues.getDefault(priority)
+        return self._getBucketAsList(self.container.get(priority, []))
+
+    # =========================================================================
+    def getAllLists(self):
+        """Return all lists.
+
+        It returns all list for every priority. List is concatenated in the
+        order of the priority, first the one with highest priority and so on.
+
+        The list returned doesn't have any information about which entries
+        belong to whar priority.
+
+        There is one list for every priority, even if it has no entries, so
+        it takes time in the number of priorities. Use iterAll or getLevels
+        to traverse only priorities with entries.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+
+        >>> pl.getAllLists()
+        [['one', 'two'], ['three', 'one', 'four'], ['five', 'two', 'one']]
+
+        :rtype: list
+        :return:
+            All priority list concatenaited.
+        """
+        retvalue = []
+        for priority in self.priorityValues.getList():
+            retvalue.append(self._getBucketAsList(self.container.get(priority, [])))
+        return retvalue
+
+    # =========================================================================
+    def _iterBucket(self, priority):
+        """Return a generator over entries in the list for the given priority.
+
+        It traverses the list in place, so no copy is created while the list
+        is not changed. The list is registered in readers while it is
+        traversed, and any change done meanwhile is done in a copy of the
+        list, which replaces it in the container, so the generator keeps
+        traversing entries as they were when it started.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('one', 'two', 'three'), 1)
+        ['one', 'two', 'three']
+
+        >>> for entry in pl._iterBucket(1):
+        ...     print entry
+        ...     if entry == 'one':
+        ...         pl.remove('one', 1)
+        ...         pl.addAtBack('four', 1)
+        one
+        'one'
+        'four'
+        two
+        three
+
+        >>> pl.getListForPriority(1)
+        ['two', 'three', 'four']
+
+        Removing the current entry together with an earlier one does not skip
+        any entry.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('a', 'b', 'c', 'd', 'b'), 1)
+        ['a', 'b', 'c', 'd', 'b']
+
+        >>> for entry in pl._iterBucket(1):
+        ...     print entry
+        ...     if entry == 'b' and pl.lenInList(1) == 5:
+        ...         pl.removeMany(('a', 'b'), 1)
+        a
+        b
+        ['a', 'b']
+        c
+        d
+        b
+
+        >>> pl.getListForPriority(1)
+        ['c', 'd', 'b']
+
+        >>> pl.snapshots, pl.readers
+        ({}, {})
+
+        :type priority: object
+        :param priority: Valid priority for the list to traverse.
+
+        :rtype: generator
+        :return: Generator over all entries for the given priority.
+        """
+        bucket = self.container.get(priority)
+        if not bucket:
+            return
+        key = id(bucket)
+        self.readers[key] = self.readers.get(key, 0) + 1
+        try:
+            for entry in bucket:
+                yield entry
+        finally:
+            count = self.readers.pop(key) - 1
+            if count:
+                self.readers[key] = count
+
+    # =========================================================================
+    def iterPriority(self, priority=None):
+        """Return an iterator over entries for the given priority.
+
+        It traverses the list in place, so no copy is created, but the list
+        can be changed while it is traversed. See _iterBucket.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('one', 'two'), 1)
+        ['one', 'two']
+
+        >>> list(pl.iterPriority(1))
+        ['one', 'two']
+
+        >>> list(pl.iterPriority())
+        []
+
+        >>> pl.iterPriority(0)
+        Traceback (most recent call last):
+        ...
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+
+        :type priority: object
+        :param priority:
+            Priority of the list to be traversed, If no value is given for
+            the priority, the default priority will be used.
+
+        :rtype: iterator
+        :return: Iterator over all entries for the given priority.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+        """
+        return self._iterBucket(self.priorityValues.getDefault(priority))
+
+    # =========================================================================
+    def iterAll(self):
+        """Return a generator over entries for all priorities.
 
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
+        Entries are generated in the order of the priority, first the ones
+        with highest priority and so on, as they are in getAllLists, but
+        without creating any list. Only priorities in levels are traversed,
+        and every one is traversed in place. The list can be changed while it
+        is traversed, see _iterBucket, and priorities which list was empty
+        when the traversal reached them are not traversed.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('five', 'six'), 3)
+        ['five', 'six']
+        >>> pl.addManyAtBack(('one', 'two'), 1)
+        ['one', 'two']
+
+        >>> list(pl.iterAll())
+        ['one', 'two', 'five', 'six']
+
+        >>> for entry in pl.iterAll():
+        ...     pl.remove(entry, 1)
+        'one'
+        'two'
+        >>> list(pl.iterAll())
+        ['five', 'six']
+
+        >>> for entry in pl.iterAll():
+        ...     print entry
+        ...     if entry == 'five':
+        ...         pl.addAtBack('one', 1)
+        ...         pl.addAtBack('three', 2)
+        five
+        'one'
+        'three'
+        six
+
+        >>> pl.snapshots, pl.readers
+        ({}, {})
+
+        :rtype: generator
+        :return: Generator over all entries.
+        """
+        position = 0
+        while position < len(self.levels):
+            rank     = self.levels[position]
+            priority = self.priorityValues.getList()[rank]
+            for entry in self._iterBucket(priority):
+                yield entry
+            position = bisect.bisect_right(self.levels, self.priorityValues.ranks.get(priority, rank))
+
+    # =========================================================================
+    def view(self):
+        """Return a read-only view of the priority list.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> view = pl.view()
+        >>> pl.addAtBack('one')
+        'one'
+
+        >>> list(view), len(view)
+        (['one'], 1)
+
+        :rtype: PListView
+        :return: Read-only view for all priorities.
+        """
+        return PListView(self)
+
+    # =========================================================================
+    def _getEntryState(self, entry):
+        """Return the state for the given entry.
+
+        Derived classes which entries can not be serialized as they are
+        should override this method and _setEntryState.
+
+        :type entry: object
+        :param entry: Entry stored in the PList.
+
+        :rtype: object
+        :return: Entry to be serialized.
         """
-        self._validateEntry(entry)
-        priority = self.priorityValues.getDefault(priority)
-        self.container[priority].append(entry)
-        if __debug__:
-            self.logger.debug('%s entry %s added back priority list %s' %
-                              (info.FUNC(), entry, priority))
         return entry
 
     # =========================================================================
-    def addAtFrontForAll(self, entry):
-        """Add a new entry at the front for every priority.
+    def _setEntryState(self, state):
+        """Return the entry for the given state.
 
-        It adds the given entry for every priority, and it adds at the front
-        for every list
+        :type state: object
+        :param state: Entry state returned by _getEntryState.
+
+        :rtype: object
+        :return: Entry to be stored in the PList.
+        """
+        return state
+
+    # =========================================================================
+    def __getstate__(self):
+        """Return the state used to serialize the priority list.
+
+        The state is a tuple with the state version, priorities, default
+        priority, name, storage, unique entries mode and a tuple with the
+        entries for every priority with entries.
 
         >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addAtBack('one', 1)
+        'one'
 
-        >>> pl.addAtFrontForAll('one')
-        ['one', 'one', 'one']
+        >>> pl.__getstate__()
+        (2, (1, 2, 3), 2, 'custom list', 'list', None, ((1, ('one',)),))
+
+        :rtype: tuple
+        :return: State for the priority list.
+        """
+        entryState = self._getEntryState
+        buckets = tuple([(priority, tuple([entryState(entry) for entry in self.container[priority]]))
+                         for priority in self.getLevels()])
+        return (STATE_VERSION,
+                self.priorityValues.getList(),
+                self.priorityValues.getDefault(),
+                self.name,
+                self.storage,
+                self.unique,
+                buckets)
+
+    # =========================================================================
+    def __setstate__(self, state):
+        """Restore the priority list from the given state.
+
+        Entries for every priority are loaded in one call to the bucket,
+        without validating or adding them one by one.
+
+        >>> pl = PList((1, 2, 3), 2)
+        >>> pl.__setstate__((2, (1, 2, 3), 2, 'custom list', 'indexed', None, ((3, ('one', 'two')), )))
+        >>> pl.container, pl.name, pl.lenAll()
+        ({3: IndexedBucket(['one', 'two'])}, 'custom list', 2)
+
+        >>> pl.__setstate__((0, (1, 2, 3), 2, None, 'list', None, ()))
+        Traceback (most recent call last):
+        ...
+        InvalidStateException: State is not valid : version: 0 not supported
+
+        :type state: tuple
+        :param state: State returned by __getstate__.
+
+        :raise InvalidStateException:
+            State version is not supported.
+        """
+        if not isinstance(state, tuple) or not state or state[0] != STATE_VERSION:
+            raise InvalidStateException('version: %s not supported' %
+                                        (state[0] if isinstance(state, tuple) and state else None, ))
+        _, priorities, defaultPriority, name, storage, unique, buckets = state
+        self.priorityValues = getPValuesList(priorities, defaultPriority)
+        self.name           = name
+        self.storage        = storage
+        self.unique         = unique
+        self.levels         = []
+        self.counts         = {}
+        self.total          = 0
+        self.version        = 0
+        self.snapshots      = {}
+        self.readers        = {}
+        self.container      = {}
+        entryState = self._setEntryState
+        for priority, entries in buckets:
+            self._getBucket(priority).extend([entryState(entry) for entry in entries])
+        self._updateLevels()
+
+    # =========================================================================
+    def cleanList(self, priority=None):
+        """Clean a list for the given priority.
+
+        It cleans a list for the given priority, removing all entries for
+        that list.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+
+        >>> pl.cleanList()
 
         >>> pl.container
-        {1: ['one'], 2: ['one'], 3: ['one']}
+        {1: ['one', 'two'], 3: ['five', 'two', 'one']}
 
-        >>> pl.addAtFrontForAll('two')
-        ['two', 'two', 'two']
+        >>> pl.cleanList(3)
 
         >>> pl.container
-        {1: ['two', 'one'], 2: ['two', 'one'], 3: ['two', 'one']}
+        {1: ['one', 'two']}
 
-        >>> pl.addAtFrontForAll(None)
+        >>> pl.cleanList(0)
         Traceback (most recent call last):
         ...
-        InvalidEntryException: Not a valid entry : entry: None
-
-        :type entry: object
-        :param entry:
-            Object to be added at the front of the list.
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
 
-        :rtype: list
-        :return:
-            List with all objects added if they were inserted properly.
+        :type priority: object
+        :param priority:
+            Priority of the list to be cleaned, If no value is given for the
+            priority, the default priority will be used.
 
-        :raise InvalidEntryException:
-            Entry is None or not valid.
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
         """
-        self._validateEntry(entry)
-        if __debug__:
-            self.logger.debug('%s entry %s added front' %
-                              (info.FUNC(), entry))
-        return map(lambda x:
-                   self.addAtFront(entry, x), self.priorityValues.getList())
+        priority = self.priorityValues.getDefault(priority)
+        self.container.pop(priority, None)
+        self._containerChanged(priority)
 
     # =========================================================================
-    def addAtBackForAll(self, entry):
-        """Add a new entry at the back for every priority.
+    def cleanListForAll(self):
+        """Clean all lists.
 
-        It adds the given entry for every priority, and it adds at the back for
-        every list
+        It cleans all priority lists.
 
         >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
 
-        >>> pl.addAtBackForAll('one')
-        ['one', 'one', 'one']
+        >>> pl.cleanListForAll()
 
         >>> pl.container
-        {1: ['one'], 2: ['one'], 3: ['one']}
+        {}
 
-        >>> pl.addAtBackForAll('two')
-        ['two', 'two', 'two']
+        """
+        for priority in self.priorityValues.getList():
+            self.cleanList(priority)
 
-        >>> pl.container
-        {1: ['one', 'two'], 2: ['one', 'two'], 3: ['one', 'two']}
+    # =========================================================================
+    def lenInList(self, priority=None):
+        """Number of entries in the list for the given priority.
 
-        >>> pl.addAtBackForAll(None)
+        It returns the length for the list for the given priority.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('one', 'two'), 1)
+        ['one', 'two']
+        >>> pl.addManyAtBack(('three', 'one', 'four'), 2)
+        ['three', 'one', 'four']
+
+        >>> pl.lenInList()
+        3
+
+        >>> pl.lenInList(1)
+        2
+
+        >>> pl.lenInList(0)
         Traceback (most recent call last):
         ...
-        InvalidEntryException: Not a valid entry : entry: None
+        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
 
-        :type entry: object
-        :param entry:
-            Object to be added at the back of the list.
+        :type priority: object
+        :param priority:
+            Priority of the list which length is requested, If no value is
+            given for the priority, the default priority will be used.
 
-        :rtype: list
+        :rtype: int
         :return:
-            List with all objects added if they were inserted properly.
+            Length for the given priority
 
-        :raise InvalidEntryException:
-            Entry is None or not valid.
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
         """
-        if __debug__:
-            self.logger.debug('%s entry %s added back' %
-                              (info.FUNC(), entry))
-        self._validateEntry(entry)
-        return map(lambda p:
-                   self.addAtBack(entry, p), self.priorityValues.getList())
+        priority = self.priorityValues.getDefault(priority)
+        return self.counts.get(priority, 0)
 
     # =========================================================================
-    def remove(self, entry, priority=None):
-        """Remove the given entry from the given priority list.
+    def lenAll(self):
+        """Number of entries in all lists.
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+        >>> pl.addManyAtBack(('one', 'two'), 1)
+        ['one', 'two']
+        >>> pl.addAtBack('three', 3)
+        'three'
+
+        >>> pl.lenAll()
+        3
+
+        >>> pl.cleanList(1)
+        >>> pl.lenAll()
+        1
+
+        :rtype: int
+        :return: Number of entries in all lists.
+        """
+        return self.total
+
+    # =========================================================================
+    def isEmpty(self):
+        """ Check if the list is empty
+
+        >>> pl = PList((1, 2, 3), 2, "custom list")
+
+        >>> pl.isEmpty()
+        True
+
+        >>> pl.addManyAtBack(('one', 'two'), 1)
+        ['one', 'two']
+        >>> pl.addManyAtBack(('three', 'one', 'four'), 2)
+        ['three', 'one', 'four']
+
+        >>> pl.isEmpty()
+        False
+
+        :rtype: bool
+        :return: True is the lsit is empty else False
+        """
+        return not self.total
+
+
+#
+#############################################################################
+#
+class PListView(object):
+    """PListView class is a read-only view of a priority list.
+
+    It does not copy any entry, it traverses the priority list every time it
+    is used, so it always shows the current entries. Entries are traversed in
+    the order of the priority.
+
+    >>> pl = PList((1, 2, 3), 2, "custom list")
+    >>> pl.addManyAtBack(('one', 'two'), 3)
+    ['one', 'two']
+    >>> pl.addAtBack('three', 1)
+    'three'
+
+    >>> view = PListView(pl)
+    >>> view
+    PListView(['three', 'one', 'two'])
+
+    >>> len(view), 'one' in view, 'four' in view
+    (3, True, False)
+
+    >>> view[3]
+    ('one', 'two')
+
+    >>> view.priorities()
+    [1, 3]
+
+    >>> view[3] = ()
+    Traceback (most recent call last):
+    ...
+    TypeError: 'PListView' object does not support item assignment
+    """
+
+    __slots__ = ('plist', )
+
+    # =========================================================================
+    def __init__(self, plist):
+        """PListView class constructor.
+
+        :type plist: PList
+        :param plist: Priority list to view.
+        """
+        self.plist = plist
+
+    # =========================================================================
+    def priorities(self):
+        """Return priorities with entries.
+
+        :rtype: list
+        :return: List with all priorities with entries, in order.
+        """
+        return self.plist.getLevels()
+
+    # =========================================================================
+    def __iter__(self):
+        """Return a generator over entries for all priorities.
+
+        :rtype: generator
+        :return: Generator over all entries.
+        """
+        return self.plist.iterAll()
+
+    # =========================================================================
+    def __len__(self):
+        """Return the number of entries for all priorities.
+
+        :rtype: int
+        :return: Number of entries.
+        """
+        return self.plist.lenAll()
+
+    # =========================================================================
+    def __contains__(self, entry):
+        """Check if the given entry is in any priority.
+
+        :type entry: object
+        :param entry: Entry to look for.
+
+        :rtype: bool
+        :return: True if the entry is found else False.
+        """
+        return entry in self.plist.iterAll()
+
+    # =========================================================================
+    def __getitem__(self, priority):
+        """Return entries for the given priority.
+
+        :type priority: object
+        :param priority: Priority of the list requested.
+
+        :rtype: tuple
+        :return: Tuple with all entries for the given priority.
+
+        :raise InvalidPriorityException:
+            Priority is not a valid one.
+        """
+        return tuple(self.plist.iterPriority(priority))
+
+    # =========================================================================
+    def __repr__(self):
+        """Return string to be displayed when the view is printed.
+
+        :rtype: str
+        :return: String with all entries.
+        """
+        return '%s(%r)' % (self.__class__.__name__, list(self))
+
+
+#
+#############################################################################
+#
+class PListFunction(PList):
+    """PListFunction extend PList where elements stored are functions.
 
-        It removes the given entry from the list for the given priority.
+    It is a PList extension where values entered in the priority list are
+    method calls.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'four'], 3: ['five']}
+    Every entry should be a dictionary with three keys:
 
-        >>> pl.remove('one', 1)
-        'one'
+    +--------+---------------------------+
+    | key    | value                     |
+    +========+===========================+
+    | method | method call               |
+    +--------+---------------------------+
+    | args   | args to pass to method    |
+    +--------+---------------------------+
+    | kwargs | kwargs to pass to method  |
+    +--------+---------------------------+
 
-        >>> pl.container
-        {1: ['two'], 2: ['three', 'four'], 3: ['five']}
+    and optional keys:
 
-        >>> pl.remove('four')
-        'four'
+    +--------+------------------------------------------+
+    | key    | value                                    |
+    +========+==========================================+
+    | batch  | method receives a batch as a list        |
+    +--------+------------------------------------------+
+    | weak   | method owner is referenced weakly        |
+    +--------+------------------------------------------+
 
-        >>> pl.container
-        {1: ['two'], 2: ['three'], 3: ['five']}
+    ::
 
-        >>> pl.remove(None)
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : entry: None
+                            ____________________________________________________
+        <container[Pn]> --> |                                                  |
+                            | <Entry> as a dictionary                          |
+                            |                                                  |
+                            | Entry['method'] -> method call                   |
+                            | Entry['args']   -> args to pass to method call   |
+                            | Entry['kwargs'] -> kwargs to pass to method call |
+                            |__________________________________________________|
 
-        >>> pl.remove('five', 0)
-        Traceback (most recent call last):
-        ...
-        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
 
-        >>> pl.remove('two')
+    >>> def func1(): pass
+    >>> def func2(x): pass
+    >>> def func3(x, y=0): pass
 
-        >>> pl.container
-        {1: ['two'], 2: ['three'], 3: ['five']}
+    >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
 
-        >>> pl.remove('two', 3) # entry in other priority
+    >>> pl.addAtFront({'method': func1, }, 1) # doctest: +ELLIPSIS
+    {'args': (), 'method': <function func1 at 0x...>, 'kwargs': {}}
 
-        >>> pl.container
-        {1: ['two'], 2: ['three'], 3: ['five']}
+    >>> pl.addAtFront({'method': func2, 'args': ('one', ), }, 2) # doctest: +ELLIPSIS
+    {'args': ('one',), 'method': <function func2 at 0x...>, 'kwargs': {}}
 
-        >>> pl.remove('six') # entry not found in default priority
+    >>> pl.addAtFront({'method': func3, 'args': ('two', ), 'kwargs': {'y': 1}}, 3) # doctest: +ELLIPSIS
+    {'args': ('two',), 'method': <function func3 at 0x...>, 'kwargs': {'y': 1}}
 
-        >>> pl.container
-        {1: ['two'], 2: ['three'], 3: ['five']}
+    PListFunction uses STORAGE_LIST by default, as PList does. With
+    STORAGE_INDEXED entries are indexed by their method, so looking for or
+    removing a method does not scan the list of entries for the priority,
+    but every method has to be hashable.
 
-        >>> pl.remove('six', 1) # entry not foun in given priority
+    >>> pl.storage
+    'list'
 
-        >>> pl.container
-        {1: ['two'], 2: ['three'], 3: ['five']}
+    >>> PListFunction((1, 2, 3), 2, storage=STORAGE_INDEXED).storage
+    'indexed'
 
-        :type entry: object
-        :param entry:
-            Object to be removed from the list.
+    Many entries can be registered or removed for a priority in one call.
 
-        :type priority: object
-        :param priority:
-            Priority where the object should be removed. If no value is
-            provided, default priority will be used.
+    >>> pl.addManyAtBack(({'method': func1, }, {'method': func2, 'args': ('two', )}), 1) # doctest: +ELLIPSIS
+    [{...}, {...}]
 
-        :rtype: object
-        :return:
-            Object removed if it was found. None if object was not found.
+    >>> pl.removeMany(({'method': func1, }, {'method': func3, }), 1) # doctest: +ELLIPSIS
+    [<function func1 at 0x...>, None]
 
-        :raise InvalidEntryException:
-            Entry is None or not valid.
+    """
 
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
-        """
-        self._validateEntry(entry)
-        priority = self.priorityValues.getDefault(priority)
-        if __debug__:
-            self.logger.debug('%s entry %s removed priority list %s' %
-                              (info.FUNC(), entry, priority))
-        retvalue = None
-        realEntry = self._getEntryFromContainer(entry, priority)
-        if realEntry is not None:
-            self.container[priority].remove(realEntry)
-            retvalue = self._getValueFromEntry(realEntry)
-            if __debug__:
-                self.logger.debug('%s real entry %s removed priority list %s' %
-                                  (info.FUNC(), retvalue, priority))
-        return retvalue
+    __slots__ = ('plan', 'priorityPlans', 'batchPlan', 'statsEnabled', 'entryStats')
 
     # =========================================================================
-    def removeForAll(self, entry):
-        """Remove the given entry from all priorities.
+    def __init__(self, priorities, defaultPriority, name=None, storage=None, unique=None):
+        """PListFunction class constructor.
 
-        It removes the given entry from every priority list.
+        Besides the PList, it creates the cache for the dispatch plans. A
+        dispatch plan is a tuple with one callable per entry, where the method
+        is already bound to the args and kwargs stored in the entry. Plans are
+        compiled the first time methods are called, and they are invalidated
+        every time the list changes.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
 
-        >>> pl.removeForAll('one')
-        ['one', 'one', 'one']
+        >>> pl.plan
 
-        >>> pl.container
-        {1: ['two'], 2: ['three', 'four'], 3: ['five', 'two']}
+        >>> pl.priorityPlans
+        {}
 
-        >>> pl.removeForAll('two')
-        ['two', None, 'two']
+        >>> pl.batchPlan
 
-        >>> pl.container
-        {1: [], 2: ['three', 'four'], 3: ['five']}
+        >>> pl.statsEnabled
+        False
 
-        >>> pl.removeForAll('four')
-        [None, 'four', None]
+        :type priorities: list
+        :param priorities:
+            It is the list of priorities to be used in the priority list.
 
-        >>> pl.container
-        {1: [], 2: ['three'], 3: ['five']}
+        :type defaultPriority: object
+        :param defaultPriority:
+            It is the default priority that will be used for any other method
+            when no priority value is provided.
 
-        >>> pl.removeForAll(None)
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : entry: None
+        :type name: str
+        :param name: name for the list
 
-        >>> pl.removeForAll('one')
-        [None, None, None]
+        :type storage: str
+        :param storage:
+            Storage to be used for every priority.
 
-        >>> pl.container
-        {1: [], 2: ['three'], 3: ['five']}
+        :type unique: str
+        :param unique:
+            Unique entries mode, it should be one of the values in UNIQUES.
 
-        :type entry: object
-        :param entry:
-            Object to be removed from the list.
+        :raise PriorityListException:
+            No list of priorities is provided.
 
-        :rtype: list
-        :return:
-            List with all objects removed if they were found. If the object
-            was not found for any priority, it returns a None for such
-            priority.
+        :raise DefaultPriorityException:
+            Default priority does not belong to list of priorities provided.
 
-        :raise InvalidEntryException:
-            Entry is None or not valid.
+        :raise InvalidStorageException:
+            Storage is not supported.
         """
-        if __debug__:
-            self.logger.debug('%s entry %s removed' %
-                              (info.FUNC(), entry))
-        self._validateEntry(entry)
-        return map(lambda p:
-                   self.remove(entry, p), self.priorityValues.getList())
+        super(PListFunction, self).__init__(priorities, defaultPriority, name, storage, unique)
+        self.plan          = None
+        self.priorityPlans = {}
+        self.batchPlan     = None
+        self.statsEnabled  = False
+        self.entryStats    = {}
 
     # =========================================================================
-    def getListForPriority(self, priority=None):
-        """Return the list for the given priority.
-
-        It returns the list with all entries for the given priority.
+    def _entryRemoved(self, entry, priority):
+        """Drop statistics recorded for an entry removed from the list.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
-
-        >>> pl.getListForPriority()
-        ['three', 'one', 'four']
+        >>> def func1(): pass
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> entry = pl.addAtBack({'method': func1, }, 1)
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.enableStats()
+        >>> pl.callForAll()
+        >>> len(pl.entryStats[1])
+        2
 
-        >>> pl.getListForPriority(1)
-        ['one', 'two']
+        >>> pl._entryRemoved(entry, 1)
+        >>> len(pl.entryStats[1])
+        1
 
-        >>> pl.getListForPriority(0)
-        Traceback (most recent call last):
-        ...
-        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+        :type entry: dict
+        :param entry: Entry removed, as it was stored in the container.
 
         :type priority: object
-        :param priority:
-            Priority of the list to be returned, If no value is given for the
-            priority, the default priority will be used.
-
-        :rtype: list
-        :return:
-            List with all entries for the given priority.
-
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
+        :param priority: Priority for the list the entry was removed from.
         """
-        priority = self.priorityValues.getDefault(priority)
-        return self.container[priority]
+        records = self.entryStats.get(priority)
+        if records:
+            records.pop(id(entry), None)
+            if not records:
+                del self.entryStats[priority]
 
     # =========================================================================
-    def getAllLists(self):
-        """Return all lists.
+    def _containerChanged(self, priority, delta=None):
+        """Invalidate dispatch plans when the list for a priority changes.
 
-        It returns all list for every priority. List is concatenated in the
-        order of the priority, first the one with highest priority and so on.
+        Statistics recorded for the priority are dropped when its list is
+        empty, statistics for entries removed one by one are dropped in
+        _entryRemoved.
 
-        The list returned doesn't have any information about which entries
-        belong to whar priority.
+        >>> def func1(): pass
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.callForAll()
+        >>> pl.callForPriority(2)
+        >>> pl.plan
+        ()
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+        >>> pl.addAtFront({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.plan
 
-        >>> pl.getAllLists()
-        [['one', 'two'], ['three', 'one', 'four'], ['five', 'two', 'one']]
+        >>> pl.priorityPlans
+        {2: ()}
 
-        :rtype: list
-        :return:
-            All priority list concatenaited.
+        :type priority: object
+        :param priority: Priority for the list that changed.
+
+        :type delta: int
+        :param delta:
+            Number of entries added, negative for entries removed. If no
+            value is provided, entries in the list are counted.
         """
-        retvalue = []
-        for priority in self.priorityValues.getList():
-            retvalue.append(self.container[priority])
-        return retvalue
+        super(PListFunction, self)._containerChanged(priority, delta)
+        self.plan      = None
+        self.batchPlan = None
+        if self.priorityPlans:
+            self.priorityPlans.pop(priority, None)
+        if self.entryStats and priority not in self.counts:
+            self.entryStats.pop(priority, None)
 
     # =========================================================================
-    def cleanList(self, priority=None):
-        """Clean a list for the given priority.
-
-        It cleans a list for the given priority, removing all entries for
-        that list.
+    def _compilePriorityPlan(self, priority):
+        """Compile the dispatch plan for the given priority.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+        >>> def func2(x, y=0): return (x, y)
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func2, 'args': ('one', ), 'kwargs': {'y': 1}}, 1) # doctest: +ELLIPSIS
+        {...}
 
-        >>> pl.cleanList()
+        >>> plan = pl._compilePriorityPlan(1)
+        >>> len(plan)
+        1
 
-        >>> pl.container
-        {1: ['one', 'two'], 2: [], 3: ['five', 'two', 'one']}
+        >>> plan[0]()
+        ('one', 1)
 
-        >>> pl.cleanList(3)
+        >>> pl.priorityPlans[1] is plan
+        True
 
-        >>> pl.container
-        {1: ['one', 'two'], 2: [], 3: []}
+        The plan is built from the list itself, so no snapshot is kept for
+        the lifetime of the plan.
 
-        >>> pl.cleanList(0)
-        Traceback (most recent call last):
-        ...
-        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
+        >>> pl.snapshots
+        {}
 
         :type priority: object
-        :param priority:
-            Priority of the list to be cleaned, If no value is given for the
-            priority, the default priority will be used.
+        :param priority: Priority for the plan to compile.
 
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
+        :rtype: tuple
+        :return: Callables for all entries in the priority, in order.
         """
-        priority = self.priorityValues.getDefault(priority)
-        del self.container[priority][:]
+        entries = self.container.get(priority, ())
+        plan = tuple([functools.partial(entry[METHOD], *entry[ARGS], **entry[KWARGS])
+                      for entry in entries])
+        if self.statsEnabled:
+            plan = tuple([self._instrumentCall(entry, call, priority)
+                          for entry, call in zip(entries, plan)])
+        self.priorityPlans[priority] = plan
+        return plan
 
     # =========================================================================
-    def cleanListForAll(self):
-        """Clean all lists.
+    def _instrumentCall(self, entry, call, priority):
+        """Return a callable that records statistics for the given call.
 
-        It cleans all priority lists.
+        Statistics are stored per priority and per entry identity as a list
+        with the number of calls, the cumulative time, the latency histogram
+        and the entry. Records are dropped when the entry is removed from
+        the list for the priority.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+        >>> def func1(): return 'func1'
+        >>> entry = {'method': func1, }
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
 
-        >>> pl.cleanListForAll()
+        >>> pl._instrumentCall(entry, func1, 1)()
+        'func1'
 
-        >>> pl.container
-        {1: [], 2: [], 3: []}
+        >>> record = pl.entryStats[1][id(entry)]
+        >>> record[0], len(record[2]), record[3] is entry
+        (1, 8, True)
+
+        :type entry: dict
+        :param entry: Entry for the call.
+
+        :type call: function
+        :param call: Callable for the entry.
 
+        :type priority: object
+        :param priority: Priority for the entry.
+
+        :rtype: function
+        :return: Callable that calls the given call and records statistics.
         """
-        for priority in self.priorityValues.getList():
-            self.cleanList(priority)
+        records = self.entryStats.setdefault(priority, {})
+        record = records.get(id(entry))
+        if record is None:
+            record = [0, 0.0, [0] * (len(HISTOGRAM_BOUNDS) + 1), entry]
+            records[id(entry)] = record
+        histogram = record[2]
+        timer = timeit.default_timer
+        bucketFor = bisect.bisect_left
+
+        def instrumented(*args, **kwargs):
+            start = timer()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                elapsed = timer() - start
+                record[0] += 1
+                record[1] += elapsed
+                histogram[bucketFor(HISTOGRAM_BOUNDS, elapsed)] += 1
+
+        return instrumented
 
     # =========================================================================
-    def lenInList(self, priority=None):
-        """Number of entries in the list for the given priority.
+    def _dropPlans(self):
+        """Drop all dispatch plans, so they are compiled again when used.
+        """
+        self.plan = None
+        self.batchPlan = None
+        self.priorityPlans.clear()
 
-        It returns the length for the list for the given priority.
+    # =========================================================================
+    def enableStats(self):
+        """Enable statistics for all methods.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+        Every call records the number of calls, the cumulative time and the
+        latency histogram for the entry. Statistics are compiled in the
+        dispatch plans, so there is no cost at all when they are disabled.
 
-        >>> pl.lenInList()
-        3
+        >>> def func1(): pass
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.callForAll()
+        >>> pl.stats()
+        {}
 
-        >>> pl.lenInList(1)
+        >>> pl.enableStats()
+        >>> pl.callForAll()
+        >>> pl.callForPriority(1)
+        >>> pl.stats()[1, func1]['count']
         2
+        """
+        if __debug__:
+            self.logger.debug('%s stats enabled for %s' % (info.FUNC(), self.name))
+        self.statsEnabled = True
+        self._dropPlans()
 
-        >>> pl.lenInList(0)
-        Traceback (most recent call last):
-        ...
-        InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
-
-        :type priority: object
-        :param priority:
-            Priority of the list which length is requested, If no value is
-            given for the priority, the default priority will be used.
+    # =========================================================================
+    def disableStats(self):
+        """Disable statistics for all methods.
 
-        :rtype: int
-        :return:
-            Length for the given priority
+        Statistics already recorded are dropped.
 
-        :raise InvalidPriorityException:
-            Priority is not a valid one.
+        >>> def func1(): pass
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.enableStats()
+        >>> pl.callForAll()
+        >>> pl.disableStats()
+        >>> pl.callForAll()
+        >>> pl.stats()
+        {}
         """
-        priority = self.priorityValues.getDefault(priority)
-        return len(self.container[priority])
+        if __debug__:
+            self.logger.debug('%s stats disabled for %s' % (info.FUNC(), self.name))
+        self.statsEnabled = False
+        self.entryStats.clear()
+        self._dropPlans()
 
     # =========================================================================
-    def isEmpty(self):
-        """ Check if the list is empty
+    def stats(self):
+        """Return statistics for all entries.
 
-        >>> pl = PList((1, 2, 3), 2, "custom list")
+        It returns a dictionary with the priority and the method for the
+        entry as the key, and a dictionary with the number of calls, the
+        cumulative time in seconds and the latency histogram as the value.
+        Histogram buckets are defined by HISTOGRAM_BOUNDS. Storages that
+        allow the same method more than once in a priority add up the
+        statistics for those entries.
 
-        >>> pl.isEmpty()
-        True
+        >>> def func1(): pass
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': func1, }, 3) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.enableStats()
+        >>> pl.callForAll()
+        >>> pl.callForPriority(1)
 
-        >>> pl.container = {1: ['one', 'two'], 2: ['three', 'one', 'four'], 3: ['five', 'two', 'one']}
+        >>> stats = pl.stats()[1, func1]
+        >>> stats['count'], stats['time'] >= 0, sum(stats['histogram'])
+        (2, True, 2)
 
-        >>> pl.isEmpty()
-        False
+        >>> pl.stats()[3, func1]['count']
+        1
 
-        :rtype: bool
-        :return: True is the lsit is empty else False
+        >>> pl.remove({'method': func1, }, 1) # doctest: +ELLIPSIS
+        <function func1 at 0x...>
+        >>> sorted(pl.stats()) # doctest: +ELLIPSIS
+        [(3, <function func1 at 0x...>)]
+
+        :rtype: dict
+        :return: Statistics for every entry.
         """
-        for priority in self.priorityValues.getList():
-            if self.lenInList(priority):
-                return False
-        return True
+        result = {}
+        for priority, records in self.entryStats.iteritems():
+            for record in records.itervalues():
+                key = (priority, self._getKeyFromEntry(record[3]))
+                stats = result.get(key)
+                if stats is None:
+                    result[key] = {COUNT: record[0], TIME: record[1], HISTOGRAM: list(record[2])}
+                else:
+                    stats[COUNT] += record[0]
+                    stats[TIME] += record[1]
+                    stats[HISTOGRAM] = [x + y for x, y in zip(stats[HISTOGRAM], record[2])]
+        return result
 
+    # =========================================================================
+    def resetStats(self):
+        """Reset statistics for all entries.
 
-#
-#############################################################################
-#
-class PListFunction(PList):
-    """PListFunction extend PList where elements stored are functions.
+        All records are dropped, and dispatch plans are compiled again, so
+        calls done after the reset start new records.
 
-    It is a PList extension where values entered in the priority list are
-    method calls.
+        >>> def func1(): pass
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.enableStats()
+        >>> pl.callForAll()
+        >>> pl.resetStats()
+        >>> pl.stats()
+        {}
 
-    Every entry should be a dictionary with three keys:
+        >>> pl.callForAll()
+        >>> pl.stats()[1, func1]['count']
+        1
+        """
+        self.entryStats.clear()
+        self._dropPlans()
 
-    +--------+---------------------------+
-    | key    | value                     |
-    +========+===========================+
-    | method | method call               |
-    +--------+---------------------------+
-    | args   | args to pass to method    |
-    +--------+---------------------------+
-    | kwargs | kwargs to pass to method  |
-    +--------+---------------------------+
+    # =========================================================================
+    def _compilePlan(self):
+        """Compile the dispatch plan for all priorities.
 
-    ::
+        The plan for all priorities is the concatenation of the plans for
+        every priority, in the order of the priorities. Only priorities with
+        entries are traversed.
 
-                            ____________________________________________________
-        <container[Pn]> --> |                                                  |
-                            | <Entry> as a dictionary                          |
-                            |                                                  |
-                            | Entry['method'] -> method call                   |
-                            | Entry['args']   -> args to pass to method call   |
-                            | Entry['kwargs'] -> kwargs to pass to method call |
-                            |__________________________________________________|
+        >>> def func1(): return 'func1'
+        >>> def func2(): return 'func2'
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func2, }, 3) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
 
+        >>> [call() for call in pl._compilePlan()]
+        ['func1', 'func2']
 
-    >>> def func1(): pass
-    >>> def func2(x): pass
-    >>> def func3(x, y=0): pass
+        :rtype: tuple
+        :return: Callables for all entries, in dispatch order.
+        """
+        plan = ()
+        for priority in self.getLevels():
+            priorityPlan = self.priorityPlans.get(priority)
+            if priorityPlan is None:
+                priorityPlan = self._compilePriorityPlan(priority)
+            plan += priorityPlan
+        self.plan = plan
+        return plan
 
-    >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+    # =========================================================================
+    def getPlan(self):
+        """Return the dispatch plan for all priorities.
 
-    >>> pl.addAtFront({'method': func1, }, 1) # doctest: +ELLIPSIS
-    {'args': (), 'method': <function func1 at 0x...>, 'kwargs': {}}
+        The plan is compiled if it is not in the cache. The tuple returned is
+        not updated when the list changes, so callers that keep it should get
+        it again after any change.
 
-    >>> pl.addAtFront({'method': func2, 'args': ('one', ), }, 2) # doctest: +ELLIPSIS
-    {'args': ('one',), 'method': <function func2 at 0x...>, 'kwargs': {}}
+        >>> def func1(): return 'func1'
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.getPlan()
+        ()
 
-    >>> pl.addAtFront({'method': func3, 'args': ('two', ), 'kwargs': {'y': 1}}, 3) # doctest: +ELLIPSIS
-    {'args': ('two',), 'method': <function func3 at 0x...>, 'kwargs': {'y': 1}}
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> [call() for call in pl.getPlan()]
+        ['func1']
 
-    """
+        >>> pl.getPlan() is pl.plan
+        True
+
+        :rtype: tuple
+        :return: Callables for all entries, in dispatch order.
+        """
+        plan = self.plan
+        if plan is None:
+            plan = self._compilePlan()
+        return plan
 
     # =========================================================================
     def _validateEntry(self, entry):
@@ -1176,6 +4253,11 @@ class PListFunction(PList):
         >>> entry # doctest: +ELLIPSIS
         {'args': ('two',), 'method': <function func3 at 0x...>, 'kwargs': {'y': 1}}
 
+        >>> entry = {'method': func2, 'args': ['one'], }
+        >>> pl._validateEntry(entry)
+        >>> entry # doctest: +ELLIPSIS
+        {'args': ('one',), 'method': <function func2 at 0x...>, 'kwargs': {}}
+
         >>> pl._validateEntry(None)
         Traceback (most recent call last):
         ...
@@ -1191,6 +4273,29 @@ class PListFunction(PList):
         ...
         InvalidEntryException: Not a valid entry : Entry: {'method': 0}
 
+        Methods in entries with the 'weak' key set to True are referenced
+        with a WeakCallable.
+
+        >>> entry = {'method': func1, 'weak': True}
+        >>> pl._validateEntry(entry)
+        >>> entry['method'] # doctest: +ELLIPSIS
+        <WeakCallable <function func1 at 0x...>>
+
+        Methods only referenced by the entry, and methods bound to objects
+        that can not be referenced weakly, are not valid for weak entries.
+
+        >>> pl._validateEntry({'method': lambda: 1, 'weak': True}) # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : Entry: {...} method is only referenced by the entry
+
+        >>> class Slotted(object):
+        ...     __slots__ = ()
+        ...     def bar(self): pass
+        >>> pl._validateEntry({'method': Slotted().bar, 'weak': True}) # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : Entry: {...} method can not be referenced weakly
 
         :type entry: object
         :param entry:
@@ -1202,11 +4307,247 @@ class PListFunction(PList):
         if entry is not None and METHOD in entry and hasattr(entry[METHOD], '__call__'):
             if not ARGS in entry:
                 entry[ARGS] = ()
+            elif not isinstance(entry[ARGS], tuple):
+                entry[ARGS] = tuple(entry[ARGS])
             if not KWARGS in entry:
                 entry[KWARGS] = {}
+            if entry.get(WEAK) and not isinstance(entry[METHOD], WeakCallable):
+                try:
+                    entry[METHOD] = WeakCallable(entry[METHOD], self._weakMethodDied)
+                except TypeError:
+                    raise InvalidEntryException('Entry: %s method can not be referenced weakly' % entry)
+                if entry[METHOD].get() is None:
+                    raise InvalidEntryException('Entry: %s method is only referenced by the entry' % entry)
         else:
             raise InvalidEntryException('Entry: %s' % entry)
 
+    # =========================================================================
+    def _validateEntries(self, entries):
+        """Validate all entries in a batch before inserting or removing them.
+
+        Entries are validated and normalized as in _validateEntry, but
+        entries without the 'weak' key are checked in the loop, so there is
+        no method call for every entry in large batches.
+
+        >>> def func1(): pass
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+
+        >>> pl._validateEntries(({'method': func1, }, {'method': func1, 'args': ['one']})) # doctest: +ELLIPSIS
+        [{'args': (), 'method': <function func1 at 0x...>, 'kwargs': {}}, {'args': ('one',), ...}]
+
+        >>> pl._validateEntries(({'method': func1, }, {'method': 0, }))
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : Entry: {'method': 0}
+
+        :type entries: list
+        :param entries: Iterable with all entries to be validated.
+
+        :rtype: list
+        :return: List with all entries.
+
+        :raise InvalidEntryException:
+            Any entry is None or not valid.
+        """
+        entries  = list(entries)
+        validate = self._validateEntry
+        for entry in entries:
+            if entry is not None and METHOD in entry and WEAK not in entry and hasattr(entry[METHOD], '__call__'):
+                if not ARGS in entry:
+                    entry[ARGS] = ()
+                elif not isinstance(entry[ARGS], tuple):
+                    entry[ARGS] = tuple(entry[ARGS])
+                if not KWARGS in entry:
+                    entry[KWARGS] = {}
+            else:
+                validate(entry)
+        return entries
+
+    # =========================================================================
+    def _weakMethodDied(self, method):
+        """Remove all entries for a weakly referenced method.
+
+        It is called when the object referenced by the method is deleted.
+        Only priorities with entries are checked, and the entry is found
+        with the bucket index when the storage is STORAGE_INDEXED, so the
+        bucket is not scanned.
+
+        >>> class Foo(object):
+        ...     def bar(self, x): print 'bar %s' % x
+        >>> foo = Foo()
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBackForAll({'method': foo.bar, 'weak': True}) # doctest: +ELLIPSIS
+        [{...}, {...}, {...}]
+        >>> pl.callForPriority(1, 'one')
+        bar one
+
+        >>> del foo
+        >>> pl.isEmpty()
+        True
+
+        :type method: WeakCallable
+        :param method: Method referenced weakly.
+        """
+        if __debug__:
+            self.logger.debug('%s method %s died' % (info.FUNC(), method))
+        for priority in self.getLevels():
+            entry = self._getEntryFromContainer(method, priority)
+            while entry is not None:
+                self._getBucket(priority).remove(entry)
+                self._entryRemoved(entry, priority)
+                self._containerChanged(priority)
+                entry = self._getEntryFromContainer(method, priority)
+
+    # =========================================================================
+    def _getEntryState(self, entry):
+        """Return the state for the given entry.
+
+        The method is stored as an importable reference, see
+        _getCallableReference. Entries which weakly referenced method has
+        been deleted are not stored.
+
+        >>> import operator
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl._getEntryState({'method': operator.add, 'args': (1, ), 'kwargs': {}})
+        {'args': (1,), 'method': ('operator', 'add'), 'kwargs': {}}
+
+        :type entry: dict
+        :param entry: Entry stored in the PListFunction.
+
+        :rtype: dict
+        :return: Entry to be serialized.
+
+        :raise InvalidStateException:
+            Method can not be imported.
+        """
+        method = entry[METHOD]
+        if isinstance(method, WeakCallable):
+            method = method.get()
+        state = dict(entry)
+        state[METHOD] = _getCallableReference(method) if method is not None else None
+        return state
+
+    # =========================================================================
+    def _setEntryState(self, state):
+        """Return the entry for the given state.
+
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl._setEntryState({'args': (1,), 'method': ('operator', 'add'), 'kwargs': {}})
+        {'args': (1,), 'method': <built-in function add>, 'kwargs': {}}
+
+        :type state: dict
+        :param state: Entry state returned by _getEntryState.
+
+        :rtype: dict
+        :return: Entry to be stored in the PListFunction.
+        """
+        entry = dict(state)
+        entry[METHOD] = _getCallableFromReference(state[METHOD])
+        if entry.get(WEAK):
+            entry[METHOD] = WeakCallable(entry[METHOD], self._weakMethodDied)
+        return entry
+
+    # =========================================================================
+    def __getstate__(self):
+        """Return the state used to serialize the priority list.
+
+        Entries which weakly referenced method has been deleted are skipped.
+
+        :rtype: tuple
+        :return: State for the priority list.
+        """
+        state = super(PListFunction, self).__getstate__()
+        buckets = tuple([(priority, tuple([entry for entry in entries if entry[METHOD] is not None]))
+                         for priority, entries in state[-1]])
+        return state[:-1] + (buckets, )
+
+    # =========================================================================
+    def __setstate__(self, state):
+        """Restore the priority list from the given state.
+
+        >>> import operator
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': operator.add, 'args': (1, )}, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': operator.mul, 'args': (2, )}, 3) # doctest: +ELLIPSIS
+        {...}
+
+        >>> restored = loads(dumps(pl))
+        >>> [call(3) for call in restored._compilePlan()]
+        [4, 6]
+
+        >>> pl.addAtBack({'method': lambda x: x, }, 2) # doctest: +ELLIPSIS
+        {...}
+        >>> dumps(pl)
+        Traceback (most recent call last):
+        ...
+        InvalidStateException: State is not valid : callable <lambda> can not be imported
+
+        :type state: tuple
+        :param state: State returned by __getstate__.
+
+        :raise InvalidStateException:
+            State version is not supported.
+        """
+        self.plan          = None
+        self.priorityPlans = {}
+        self.batchPlan     = None
+        self.statsEnabled  = False
+        self.entryStats    = {}
+        super(PListFunction, self).__setstate__(state)
+
+    # =========================================================================
+    def _compileBatchPlan(self):
+        """Compile the dispatch plan for batches of events.
+
+        It is a tuple with one pair per entry, in dispatch order, with the
+        callable for the entry and the flag that tells if the entry receives
+        the whole batch.
+
+        >>> def func1(): return 'func1'
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func1, 'batch': True}, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': func1, }, 3) # doctest: +ELLIPSIS
+        {...}
+
+        >>> [(call(), isBatch) for call, isBatch in pl._compileBatchPlan()]
+        [('func1', True), ('func1', False)]
+
+        :rtype: tuple
+        :return: Pairs with callable and batch flag for all entries.
+        """
+        plan = []
+        for priority in self.getLevels():
+            priorityPlan = self.priorityPlans.get(priority)
+            if priorityPlan is None:
+                priorityPlan = self._compilePriorityPlan(priority)
+            for entry, call in zip(self.container[priority], priorityPlan):
+                plan.append((call, bool(entry.get(BATCH))))
+        self.batchPlan = tuple(plan)
+        return self.batchPlan
+
+    # =========================================================================
+    def _getKeyFromEntry(self, entry):
+        """Return the key that identifies the given entry.
+
+        Entries in PListFunction are identified by the method stored.
+
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+
+        >>> def func(x, y=0): pass
+        >>> entry = {'method': func, 'args': ('two', ), 'kwargs': {'y': 1}}
+        >>> pl._getKeyFromEntry(entry) # doctest: +ELLIPSIS
+        <function func at 0x...>
+
+        :type entry: dict
+        :param entry: Entry stored in the PListFunction.
+
+        :rtype: function
+        :return: Method stored in the entry.
+        """
+        return entry[METHOD]
+
     # =========================================================================
     def _getEntryFromContainer(self, method, priority=None):
         """Get entry from the container.
@@ -1240,11 +4581,21 @@ class PListFunction(PList):
 
         >>> pl._getEntryFromContainer(func4) # not found entry
 
+        >>> pl.cleanList(3)
+        >>> pl._getEntryFromContainer(func3, 3) # removed when list is cleaned
+
         >>> pl._getEntryFromContainer(func3, 0)
         Traceback (most recent call last):
         ...
         InvalidPriorityException: Priority is not in the priority list : priority: 0 not in (1, 2, 3)
 
+        >>> pl = PListFunction((1, 2, 3), 2, storage=STORAGE_LIST)
+        >>> pl.addAtFront({'method': func2, 'args': ('one', ), }, 2) # doctest: +ELLIPSIS
+        {'args': ('one',), 'method': <function func2 at 0x...>, 'kwargs': {}}
+
+        >>> pl._getEntryFromContainer(func2) # doctest: +ELLIPSIS
+        {'args': ('one',), 'method': <function func2 at 0x...>, 'kwargs': {}}
+
         :type method: function
         :param method:
             Method to be check is present in the container.
@@ -1258,7 +4609,12 @@ class PListFunction(PList):
             Real entry in the container to be removed or None if not found.
         """
         priority = self.priorityValues.getDefault(priority)
-        for traverse in self.container[priority]:
+        bucket = self.container.get(priority)
+        if bucket is None:
+            return None
+        if self.storage == STORAGE_INDEXED:
+            return bucket.find(method)
+        for traverse in bucket:
             if method == traverse[METHOD]:
                 return traverse
         return None
@@ -1278,101 +4634,37 @@ class PListFunction(PList):
         <function func at 0x...>
 
         >>> pl._getValueFromEntry(None)
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : Entry: None
-
-        >>> pl._getValueFromEntry({'METHOD': func, }) # doctest: +ELLIPSIS
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : Entry: {'METHOD': <function func at 0x...>}
-
-        >>> pl._getValueFromEntry({'method': 0, })
-        Traceback (most recent call last):
-        ...
-        InvalidEntryException: Not a valid entry : Entry: {'method': 0}
-
-        :type entry: dict
-        :param entry: Entry found in the PListFunction.
-
-        :rtype: function
-        :return: Function stored in the entry in the PListFunction.
-        """
-        if entry is not None and METHOD in entry and hasattr(entry[METHOD], '__call__'):
-            return entry['method']
-        else:
-            raise InvalidEntryException('Entry: %s' % entry)
-
-    # =========================================================================
-    def _callEntry(self, entry, *args, **kwargs):
-        """Call method in the given entry.
-
-        It get the method, args and kwargs from the given entry, and proceed
-        to call it.
-
-        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
-
-        >>> def func1(): return True
-        >>> entry = {'method': func1, 'args': (), 'kwargs': {}}
-        >>> pl._callEntry(entry)
-        True
-
-        >>> def func2(x): return x
-        >>> entry = {'method': func2, 'args': ('one', ), 'kwargs': {}}
-        >>> pl._callEntry(entry)
-        'one'
-
-        >>> entry = {'method': func2, 'args': (), 'kwargs': {}}
-        >>> pl._callEntry(entry, 'three')
-        'three'
-
-        >>> def func3(x, y=0): return (x, y)
-        >>> entry = {'method': func3, 'args': ('one', ), 'kwargs': {'y': 'two'}}
-        >>> pl._callEntry(entry)
-        ('one', 'two')
-
-        >>> entry = {'method': func3, 'args': ('two', ), 'kwargs': {}}
-        >>> pl._callEntry(entry)
-        ('two', 0)
-
-        >>> entry = {'method': func3, 'args': (), 'kwargs': {}}
-        >>> pl._callEntry(entry, 'three')
-        ('three', 0)
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : Entry: None
 
-        >>> entry = {'method': func3, 'args': (), 'kwargs': {}}
-        >>> pl._callEntry(entry, 'four', y='five')
-        ('four', 'five')
+        >>> pl._getValueFromEntry({'METHOD': func, }) # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : Entry: {'METHOD': <function func at 0x...>}
 
-        >>> def func4(x, y, v=0, w=1): return (x, y, v, w)
-        >>> entry = {'method': func4, 'args': ('one', ), 'kwargs': {'v': 'two'}}
-        >>> pl._callEntry(entry, '1', w='2')
-        ('one', '1', 'two', '2')
+        >>> pl._getValueFromEntry({'method': 0, })
+        Traceback (most recent call last):
+        ...
+        InvalidEntryException: Not a valid entry : Entry: {'method': 0}
 
         :type entry: dict
-        :param entry:
-            Dictionary containing method, args and kwargs.
-
-        :type args: list
-        :param args: list with arguements to passed to the method to call
+        :param entry: Entry found in the PListFunction.
 
-        :type kwargs: dict
-        :param kwargs: dict with arguements to passed to the method to call
+        :rtype: function
+        :return: Function stored in the entry in the PListFunction.
         """
-        method = entry[METHOD]
-        argsToUse = list(entry[ARGS])
-        argsToUse.extend(args)
-        kwargsToUse = entry[KWARGS]
-        kwargsToUse.update(kwargs)
-        if __trace__:
-            self.logger.debug('%s method %s, args %s, kwargs %s' %
-                              (info.FUNC(), method, argsToUse, kwargsToUse))
-        return method(*argsToUse, **kwargsToUse)
+        if entry is not None and METHOD in entry and hasattr(entry[METHOD], '__call__'):
+            return entry['method']
+        else:
+            raise InvalidEntryException('Entry: %s' % entry)
 
     # =========================================================================
     def callForPriority(self, priority=None, *args, **kwargs):
         """Call all methods for the given priority.
 
-        It calls all methods for the given priority.
+        It calls all methods for the given priority, using the dispatch plan
+        for the priority, which is compiled only when the list has changed.
 
         >>> def func1(): print 'func1'
         >>> def func2(x): print 'func2 %s' % x
@@ -1412,6 +4704,21 @@ class PListFunction(PList):
         >>> pl.callForPriority(3, 'three', y=3)
         func3 three, 3
 
+        Methods are called from an immutable plan, so a method can deregister
+        itself, or any other method, while methods are being called. Changes
+        are used the next time methods are called.
+
+        >>> def once(): print 'once'; pl.remove({'method': once}, 1)
+        >>> pl.addAtBack({'method': once}, 1) # doctest: +ELLIPSIS
+        {...}
+
+        >>> pl.callForPriority(1)
+        func1
+        once
+
+        >>> pl.callForPriority(1)
+        func1
+
         >>> pl.callForPriority(0)
         Traceback (most recent call last):
         ...
@@ -1435,14 +4742,48 @@ class PListFunction(PList):
         if __trace__:
             self.logger.debug('%s priority %s, args %s, kwargs %s' %
                               (info.FUNC(), priority, args, kwargs))
-        for entry in self.container[priority]:
-            self._callEntry(entry, *args, **kwargs)
+        plan = self.priorityPlans.get(priority)
+        if plan is None:
+            plan = self._compilePriorityPlan(priority)
+        for call in plan:
+            call(*args, **kwargs)
+
+    # =========================================================================
+    def callForPriorityUnchecked(self, priority, *args, **kwargs):
+        """Call all methods for the given priority for a trusted caller.
+
+        It works as callForPriority, but the priority has to be a valid one
+        and nothing is logged.
+
+        >>> def func1(x): print 'func1 %s' % x
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+
+        >>> pl.callForPriorityUnchecked(1, 'one')
+        func1 one
+
+        :type priority: object
+        :param priority: Valid priority for methods to call.
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+        """
+        plan = self.priorityPlans.get(priority)
+        if plan is None:
+            plan = self._compilePriorityPlan(priority)
+        for call in plan:
+            call(*args, **kwargs)
 
     # =========================================================================
     def callForAll(self, *args, **kwargs):
         """Call all methods.
 
-        It calls all methods for every priority.
+        It calls all methods for every priority, using the dispatch plan for
+        all priorities, which is compiled only when the list has changed.
 
         >>> def func1(): print 'func1'
         >>> def func2(x): print 'func2 %s' % x
@@ -1487,6 +4828,21 @@ class PListFunction(PList):
         func3 THREE, 3
         func3 THREE, 3
 
+        Stored args and kwargs are bound in the dispatch plan, and they are
+        passed without any copy when no args or kwargs are given. When they
+        are given, they are merged in new objects, so the entry is never
+        modified.
+
+        >>> def func5(x, y, v=0, w=1): print 'func5 %s, %s, %s, %s' % (x, y, v, w)
+        >>> pl.cleanListForAll()
+        >>> entry = pl.addAtBack({'method': func5, 'args': ('one', ), 'kwargs': {'v': 'two'}}, 1)
+        >>> pl.callForAll('1', w='2')
+        func5 one, 1, two, 2
+        >>> entry['kwargs']
+        {'v': 'two'}
+        >>> pl.callForAll('1')
+        func5 one, 1, two, 1
+
         :type args: list
         :param args: list with arguements to passed to the method to call
 
@@ -1496,8 +4852,262 @@ class PListFunction(PList):
         if __trace__:
             self.logger.debug('%s args %s, kwargs %s' %
                               (info.FUNC(), args, kwargs))
-        for priority in self.priorityValues.getList():
-            self.callForPriority(priority, *args, **kwargs)
+        plan = self.plan
+        if plan is None:
+            plan = self._compilePlan()
+        for call in plan:
+            call(*args, **kwargs)
+
+    # =========================================================================
+    def callForAllBatch(self, events, *args, **kwargs):
+        """Call all methods for a batch of events.
+
+        It traverses priorities and entries once for the whole batch. Entries
+        registered with the 'batch' key set to True are called once, with the
+        tuple of events as the first argument after the stored args. The same
+        tuple is passed to every one of them, so none of them can change the
+        batch seen by the next ones. Any other
+        entry is called once per event, with the event as the first argument
+        after the stored args. Every entry handles the whole batch before the
+        next entry is called, so the priority order is kept.
+
+        >>> def each(tag, event): print '%s %s' % (tag, event)
+        >>> def all(tag, events, y=0): print '%s %s %s' % (tag, events, y)
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': each, 'args': ('low', )}, 3) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': all, 'args': ('high', ), 'batch': True}, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': each, 'args': ('med', )}, 2) # doctest: +ELLIPSIS
+        {...}
+
+        >>> pl.callForAllBatch(iter(('one', 'two')))
+        high ('one', 'two') 0
+        med one
+        med two
+        low one
+        low two
+
+        >>> pl.callForAllBatch(('one', ), y=1)
+        Traceback (most recent call last):
+        ...
+        TypeError: each() got an unexpected keyword argument 'y'
+
+        :type events: list
+        :param events: Iterable with all events in the batch.
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+        """
+        events = tuple(events)
+        if __trace__:
+            self.logger.debug('%s %d events, args %s, kwargs %s' %
+                              (info.FUNC(), len(events), args, kwargs))
+        plan = self.batchPlan
+        if plan is None:
+            plan = self._compileBatchPlan()
+        for call, isBatch in plan:
+            if isBatch:
+                call(events, *args, **kwargs)
+            else:
+                for event in events:
+                    call(event, *args, **kwargs)
+
+    # =========================================================================
+    def callForAllParallel(self, executor, *args, **kwargs):
+        """Call all methods, running methods with the same priority in parallel.
+
+        Methods for one priority are submitted to the given executor, and all
+        of them have to be completed before methods for the next priority are
+        submitted, so the order between priorities is kept. Any executor with
+        a submit method that returns a future, like executors in module
+        concurrent.futures, can be used.
+
+        It returns one dictionary per entry, in dispatch order, with the
+        method, the value returned and the exception raised, if any.
+
+        >>> class Future(object):
+        ...     def __init__(self, call): self.call = call
+        ...     def result(self): return self.call()
+        >>> class Executor(object):
+        ...     def submit(self, method, *args, **kwargs):
+        ...         print 'submit %s%s' % (method.func.__name__, method.args + args)
+        ...         return Future(functools.partial(method, *args, **kwargs))
+        >>> def func1(x): return 'func1 %s' % x
+        >>> def func2(x, y): return 'func2 %s %s' % (x, y)
+        >>> def func3(x, y): raise ValueError(x, y)
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func3, 'args': ('three', )}, 3) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': func2, 'args': ('two', )}, 1) # doctest: +ELLIPSIS
+        {...}
+
+        >>> results = pl.callForAllParallel(Executor(), 'one')
+        submit func1('one',)
+        submit func2('two', 'one')
+        submit func3('three', 'one')
+        >>> [(r['method'].__name__, r['result'], r['exception']) for r in results]
+        [('func1', 'func1 one', None), ('func2', 'func2 two one', None), ('func3', None, ValueError('three', 'one'))]
+
+        :type executor: object
+        :param executor: Executor where methods are submitted.
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+
+        :rtype: list
+        :return: Dictionaries with method, result and exception per entry.
+        """
+        if __trace__:
+            self.logger.debug('%s args %s, kwargs %s' % (info.FUNC(), args, kwargs))
+        results = []
+        for priority in self.getLevels():
+            plan = self.priorityPlans.get(priority)
+            if plan is None:
+                plan = self._compilePriorityPlan(priority)
+            futures = [(entry[METHOD], executor.submit(call, *args, **kwargs))
+                       for entry, call in zip(self.container[priority], plan)]
+            for method, future in futures:
+                try:
+                    result, exception = future.result(), None
+                except Exception as ex:
+                    result, exception = None, ex
+                results.append({METHOD: method, RESULT: result, EXCEPTION: exception})
+        return results
+
+    # =========================================================================
+    @staticmethod
+    def _callPlan(plan, args, kwargs):
+        """Call all callables in the given plan.
+
+        :type plan: tuple
+        :param plan: Callables to call.
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+        """
+        for call in plan:
+            call(*args, **kwargs)
+
+    # =========================================================================
+    def callForAllWithin(self, budget, args=(), kwargs=None, mandatory=None, deferTo=None):
+        """Call all methods for all priorities within the given time budget.
+
+        Priorities up to the mandatory priority, which is the first priority
+        in the list by default, are always called. Before any other priority
+        is called, the deadline is checked, and once it has passed, that
+        priority and all priorities after it are not called. If a queue is
+        given, they are deferred instead: a callable per priority is put in
+        the queue, which calls the methods that would have been called.
+
+        It returns a report with priorities executed, skipped and deferred.
+
+        >>> import Queue
+        >>> def func1(x, y=0): print 'func1 %s' % x
+        >>> def func2(x, y=0): print 'func2 %s' % x
+        >>> def func3(x, y=0): print 'func3 %s, %s' % (x, y)
+        >>> def show(report):
+        ...     return [(key, report[key]) for key in ('executed', 'skipped', 'deferred')]
+        >>> pl = PListFunction((1, 2, 3), 2, "custom function list")
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': func2, }, 2) # doctest: +ELLIPSIS
+        {...}
+        >>> pl.addAtBack({'method': func3, }, 3) # doctest: +ELLIPSIS
+        {...}
+
+        >>> show(pl.callForAllWithin(60, ('one', ), {'y': 1}))
+        func1 one
+        func2 one
+        func3 one, 1
+        [('executed', [1, 2, 3]), ('skipped', []), ('deferred', [])]
+
+        >>> show(pl.callForAllWithin(0, ('one', )))
+        func1 one
+        [('executed', [1]), ('skipped', [2, 3]), ('deferred', [])]
+
+        >>> show(pl.callForAllWithin(0, ('one', ), mandatory=2))
+        func1 one
+        func2 one
+        [('executed', [1, 2]), ('skipped', [3]), ('deferred', [])]
+
+        >>> queue = Queue.Queue()
+        >>> show(pl.callForAllWithin(0, ('one', ), deferTo=queue))
+        func1 one
+        [('executed', [1]), ('skipped', []), ('deferred', [2, 3])]
+        >>> while not queue.empty():
+        ...     queue.get()()
+        func2 one
+        func3 one, 0
+
+        :type budget: float
+        :param budget: Time budget in seconds.
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+
+        :type mandatory: object
+        :param mandatory:
+            Last priority always called. If it is None, the first priority
+            in the list is used.
+
+        :type deferTo: object
+        :param deferTo:
+            Queue, with a put method, where priorities not called are
+            deferred. If it is None, they are skipped.
+
+        :rtype: dict
+        :return: Report with priorities executed, skipped and deferred.
+
+        :raise InvalidPriorityException:
+            Mandatory priority is not a valid one.
+        """
+        deadline = timeit.default_timer() + budget
+        kwargs = kwargs if kwargs is not None else {}
+        if mandatory is None:
+            mandatory = self.priorityValues.getList()[0]
+        elif not self.priorityValues.isValid(mandatory):
+            raise InvalidPriorityException('priority: %s not in %s' %
+                                           (mandatory, self.priorityValues.getList()))
+        mandatoryRank = self.priorityValues.ranks[mandatory]
+        if __trace__:
+            self.logger.debug('%s budget %s, mandatory %s, args %s, kwargs %s' %
+                              (info.FUNC(), budget, mandatory, args, kwargs))
+        report = {EXECUTED: [], SKIPPED: [], DEFERRED: []}
+        expired = False
+        for priority in self.getLevels():
+            plan = self.priorityPlans.get(priority)
+            if plan is None:
+                plan = self._compilePriorityPlan(priority)
+            if not expired and self.priorityValues.ranks[priority] > mandatoryRank:
+                expired = timeit.default_timer() >= deadline
+            if not expired:
+                self._callPlan(plan, args, kwargs)
+                report[EXECUTED].append(priority)
+            elif deferTo is not None:
+                deferTo.put(functools.partial(self._callPlan, plan, args, kwargs))
+                report[DEFERRED].append(priority)
+            else:
+                report[SKIPPED].append(priority)
+        if __debug__:
+            if report[SKIPPED] or report[DEFERRED]:
+                self.logger.debug('%s %s skipped %s, deferred %s' %
+                                  (info.FUNC(), self.name, report[SKIPPED], report[DEFERRED]))
+        return report
 
     # =========================================================================
     def remove(self, entry, priority=None):
@@ -1569,7 +5179,9 @@ class PListFunction(PList):
         retvalue = None
         realEntry = self._getEntryFromContainer(entry[METHOD], priority)
         if realEntry is not None:
-            self.container[priority].remove(realEntry)
+            self._getBucket(priority).remove(realEntry)
+            self._entryRemoved(realEntry, priority)
+            self._containerChanged(priority)
             retvalue = realEntry[METHOD]
             if __debug__:
                 self.logger.debug('%s real entry %s removed priority list %s' %
@@ -1577,6 +5189,353 @@ class PListFunction(PList):
         return retvalue
 
 
+#
+#############################################################################
+#
+class AsyncPListFunction(PListFunction):
+    """AsyncPListFunction extend PListFunction for an asyncio event loop.
+
+    Methods callForPriority and callForAll do not block, they return a future
+    that can be yielded from a coroutine or run in the event loop. Every
+    method for a priority is called, and all awaitables returned, coroutines
+    or futures, run concurrently. Awaitables for one priority have to be
+    completed before methods for the next priority are called, so the order
+    between priorities is kept.
+
+    Plain functions are called as they are in PListFunction. A blocking
+    function should return loop.run_in_executor(...) instead, so it does not
+    stall the event loop.
+
+    It requires asyncio or, for Python 2, trollius, which is imported when
+    the first AsyncPListFunction is created.
+
+    >>> asyncio = _getAsyncio()
+    >>> loop = asyncio.new_event_loop()
+    >>> def later(tag, delay):
+    ...     def done():
+    ...         if not future.cancelled():
+    ...             print tag
+    ...             future.set_result(tag)
+    ...     future = asyncio.Future(loop=loop)
+    ...     loop.call_later(delay, done)
+    ...     return future
+    >>> def now(tag): print tag
+
+    >>> pl = AsyncPListFunction((1, 2, 3), 2, "async function list", loop=loop)
+    >>> pl.addAtBack({'method': later, 'args': ('3 fast', 0)}, 3) # doctest: +ELLIPSIS
+    {...}
+    >>> pl.addAtBack({'method': later, 'args': ('1 slow', 0.02)}, 1) # doctest: +ELLIPSIS
+    {...}
+    >>> pl.addAtBack({'method': later, 'args': ('1 fast', 0.01)}, 1) # doctest: +ELLIPSIS
+    {...}
+    >>> pl.addAtBack({'method': now, 'args': ('2 plain', )}, 2) # doctest: +ELLIPSIS
+    {...}
+
+    >>> loop.run_until_complete(pl.callForAll())
+    1 fast
+    1 slow
+    2 plain
+    3 fast
+
+    >>> loop.run_until_complete(pl.callForPriority(1))
+    1 fast
+    1 slow
+
+    A timeout can be set for every priority, or per priority with a
+    dictionary. Awaitables not completed when the timeout expires are
+    cancelled, and priorities after that one are not called.
+
+    >>> pl.timeout = {1: 0.01}
+    >>> loop.run_until_complete(pl.callForAll())
+    Traceback (most recent call last):
+    ...
+    TimeoutError
+
+    >>> loop.close()
+    """
+
+    __slots__ = ('loop', 'timeout')
+
+    # =========================================================================
+    def __init__(self, priorities, defaultPriority, name=None, storage=None,
+                 unique=None, loop=None, timeout=None):
+        """AsyncPListFunction class constructor.
+
+        >>> pl = AsyncPListFunction((1, 2, 3), 2, "async function list", timeout=0.5)
+
+        >>> pl.timeout
+        0.5
+
+        :type priorities: list
+        :param priorities:
+            It is the list of priorities to be used in the priority list.
+
+        :type defaultPriority: object
+        :param defaultPriority:
+            It is the default priority that will be used for any other method
+            when no priority value is provided.
+
+        :type name: str
+        :param name: name for the list
+
+        :type storage: str
+        :param storage:
+            Storage to be used for every priority.
+
+        :type unique: str
+        :param unique:
+            Unique entries mode, it should be one of the values in UNIQUES.
+
+        :type loop: object
+        :param loop:
+            Event loop to be used. If it is None, the current event loop is
+            used.
+
+        :type timeout: object
+        :param timeout:
+            Timeout in seconds for every priority, or dictionary with the
+            timeout for every priority. None means no timeout.
+
+        :raise PriorityListException:
+            No list of priorities is provided.
+
+        :raise DefaultPriorityException:
+            Default priority does not belong to list of priorities provided.
+
+        :raise InvalidStorageException:
+            Storage is not supported.
+
+        :raise AsyncNotSupportedException:
+            Neither asyncio nor trollius are available.
+        """
+        if _getAsyncio() is None:
+            raise AsyncNotSupportedException('asyncio or trollius is required')
+        super(AsyncPListFunction, self).__init__(priorities, defaultPriority, name, storage, unique)
+        self.loop    = loop
+        self.timeout = timeout
+
+    # =========================================================================
+    def __getstate__(self):
+        """Return the state used to serialize the priority list.
+
+        The event loop is not serialized, the current event loop is used
+        after the priority list is restored.
+
+        :rtype: tuple
+        :return: State for the priority list.
+        """
+        return (super(AsyncPListFunction, self).__getstate__(), self.timeout)
+
+    # =========================================================================
+    def __setstate__(self, state):
+        """Restore the priority list from the given state.
+
+        >>> pl = AsyncPListFunction((1, 2, 3), 2, "async function list", timeout=0.5)
+        >>> restored = loads(dumps(pl))
+        >>> restored.loop, restored.timeout
+        (None, 0.5)
+
+        :type state: tuple
+        :param state: State returned by __getstate__.
+
+        :raise InvalidStateException:
+            State version is not supported.
+
+        :raise AsyncNotSupportedException:
+            Neither asyncio nor trollius are available.
+        """
+        if _getAsyncio() is None:
+            raise AsyncNotSupportedException('asyncio or trollius is required')
+        baseState, timeout = state
+        super(AsyncPListFunction, self).__setstate__(baseState)
+        self.loop    = None
+        self.timeout = timeout
+
+    # =========================================================================
+    def _getLoop(self):
+        """Return the event loop to be used.
+
+        :rtype: object
+        :return: Event loop.
+        """
+        return self.loop if self.loop is not None else asyncio.get_event_loop()
+
+    # =========================================================================
+    def _getTimeout(self, priority):
+        """Return the timeout for the given priority.
+
+        >>> pl = AsyncPListFunction((1, 2, 3), 2, "async function list", timeout={1: 0.5})
+
+        >>> pl._getTimeout(1), pl._getTimeout(2)
+        (0.5, None)
+
+        :type priority: object
+        :param priority: Priority to look for.
+
+        :rtype: float
+        :return: Timeout in seconds, or None for no timeout.
+        """
+        if isinstance(self.timeout, dict):
+            return self.timeout.get(priority)
+        return self.timeout
+
+    # =========================================================================
+    def _gatherPriority(self, priority, loop, *args, **kwargs):
+        """Call all methods for the given priority, and gather awaitables.
+
+        :type priority: object
+        :param priority: Priority for methods to call.
+
+        :type loop: object
+        :param loop: Event loop to be used.
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+
+        :rtype: object
+        :return:
+            Future completed when all awaitables are completed, or None if
+            no method returned an awaitable.
+        """
+        plan = self.priorityPlans.get(priority)
+        if plan is None:
+            plan = self._compilePriorityPlan(priority)
+        awaitables = []
+        for call in plan:
+            result = call(*args, **kwargs)
+            if isinstance(result, asyncio.Future) or asyncio.iscoroutine(result):
+                awaitables.append(result)
+        if not awaitables:
+            return None
+        future = asyncio.gather(*awaitables, loop=loop)
+        timeout = self._getTimeout(priority)
+        if timeout is not None:
+            future = asyncio.ensure_future(asyncio.wait_for(future, timeout, loop=loop), loop=loop)
+        return future
+
+    # =========================================================================
+    def callForPriority(self, priority=None, *args, **kwargs):
+        """Call all methods for the given priority.
+
+        >>> asyncio = _getAsyncio()
+        >>> loop = asyncio.new_event_loop()
+        >>> def func1(x): print 'func1 %s' % x
+        >>> pl = AsyncPListFunction((1, 2, 3), 2, "async function list", loop=loop)
+        >>> pl.addAtBack({'method': func1, }, 2) # doctest: +ELLIPSIS
+        {...}
+
+        >>> loop.run_until_complete(pl.callForPriority(None, 'one'))
+        func1 one
+
+        >>> loop.close()
+
+        :type priority: object
+        :param priority: Priority for methods to call.
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+
+        :rtype: object
+        :return: Future completed when all methods are completed.
+        """
+        priority = self.priorityValues.getDefault(priority)
+        if __trace__:
+            self.logger.debug('%s priority %s, args %s, kwargs %s' %
+                              (info.FUNC(), priority, args, kwargs))
+        loop = self._getLoop()
+        done = asyncio.Future(loop=loop)
+        try:
+            future = self._gatherPriority(priority, loop, *args, **kwargs)
+        except Exception as ex:
+            done.set_exception(ex)
+            return done
+
+        def _completed(future):
+            if done.cancelled():
+                return
+            if future.cancelled():
+                done.cancel()
+            elif future.exception() is not None:
+                done.set_exception(future.exception())
+            else:
+                done.set_result(None)
+
+        if future is None:
+            done.set_result(None)
+        else:
+            future.add_done_callback(_completed)
+        return done
+
+    # =========================================================================
+    def callForAll(self, *args, **kwargs):
+        """Call all methods for all priorities.
+
+        >>> asyncio = _getAsyncio()
+        >>> loop = asyncio.new_event_loop()
+        >>> def func1(x): print 'func1 %s' % x
+        >>> def func2(x): raise ValueError(x)
+        >>> pl = AsyncPListFunction((1, 2, 3), 2, "async function list", loop=loop)
+        >>> pl.addAtBack({'method': func1, }, 1) # doctest: +ELLIPSIS
+        {...}
+
+        >>> loop.run_until_complete(pl.callForAll('one'))
+        func1 one
+
+        >>> pl.addAtBack({'method': func2, }, 3) # doctest: +ELLIPSIS
+        {...}
+        >>> loop.run_until_complete(pl.callForAll('two'))
+        Traceback (most recent call last):
+        ...
+        ValueError: two
+
+        >>> loop.close()
+
+        :type args: list
+        :param args: list with arguements to passed to the method to call
+
+        :type kwargs: dict
+        :param kwargs: dict with arguements to passed to the method to call
+
+        :rtype: object
+        :return: Future completed when all methods are completed.
+        """
+        if __trace__:
+            self.logger.debug('%s args %s, kwargs %s' % (info.FUNC(), args, kwargs))
+        loop = self._getLoop()
+        done = asyncio.Future(loop=loop)
+        levels = iter(self.getLevels())
+
+        def _next(previous=None):
+            if done.cancelled():
+                return
+            if previous is not None:
+                if previous.cancelled():
+                    done.cancel()
+                    return
+                if previous.exception() is not None:
+                    done.set_exception(previous.exception())
+                    return
+            for priority in levels:
+                try:
+                    future = self._gatherPriority(priority, loop, *args, **kwargs)
+                except Exception as ex:
+                    done.set_exception(ex)
+                    return
+                if future is not None:
+                    future.add_done_callback(_next)
+                    return
+            done.set_result(None)
+
+        _next()
+        return done
+
+
 ###############################################################################
 ##                  _
 ##  _ __ ___   __ _(_)_ __